@@ -1,152 +1,368 @@
 
-from .base.structured_config import (
-        ConfigFileArgumentType, 
-        ArgparseConfig, 
-        OverrideConfig, 
-        FileConfig, 
-        ConfigSpecification,
-    )
-
-from .base.typedefs import (
-        ConversionTargetType, 
-        ConversionSourceType, 
-        ValidatorSourceType, 
-        ConfigObjectType, 
-        ScalarConfigTypeRequirements, 
-        ScalarConvertedTypeRequirements,
-    )
-
-from .spec.config import (
-        Config,
-    )
-
-from .spec.entries.list_entry import (
-        ListEntry,
-    )
-
-from .spec.entries.object_entry import (
-        ObjectEntry,
-    )
-
-from .spec.entries.scalar_entry import (
-        ScalarEntry,
-    )
-
-from .spec.entries.object_requirements import (
-        MakeRequirements,
-    )
-
-from .type_checking.type_config import (
-        TypeConfig,
-        ConfigTypeCheckingFunction,
-        ConvertedTypeCheckingFunction,
-    )
-
-from .type_checking.converted_type_checker import (
-        ConvertedTypeChecker,
-    )
-
-from .type_checking.config_type_checker import (
-        ConfigTypeChecker,
-    )
-
-from .type_checking.require_types import (
-        RequireConfigType,
-        RequireConvertedType,
-    )
-
-from .cli_args.argparse_argument import ArgparseArgument
-from .cli_args.config_argument import ConfigArgument
-from .cli_args.override_list_argument import OverrideListArgument
-from .cli_args.schema_argument import SchemaArgument
-from .cli_args.schema_output_argument import (
-        SchemaOutputArgument,
-        SchemaOutputType,
-    )
-
-from .io.case_translation.camel_case import CamelCase
-from .io.case_translation.snake_case import SnakeCase
-from .io.case_translation.pascal_case import PascalCase
-from .io.case_translation.macro_case import MacroCase
-from .io.case_translation.no_translation import NoTranslation
-from .io.case_translation.case_translator_base import CaseTranslatorBase
-
-from .io.overrides.argparse_extractor import (
-        DictionaryKeyFilterFunction,
-        ArgparseOverrideKeyMappingFunction,
-        ArgparseOverrides,
-    )
-
-from .io.overrides.dictionary_node_classifier import (
-        DictionaryNodeClassifier,
-        DictionaryNodeClassification,
-    )
-
-from .io.overrides.dictionary_source_extractor import (
-        DictionaryKeyExtractorFunction,
-        DictionarySourceExtractor,
-    )
-
-from .io.overrides.functional_extractor import (
-        KeyListFunction,
-        SourceConverterFunction,
-        StringKeyMappingFunction,
-        FunctionalExtractor,
-        SourceConvertingFunctionalExtractor,
-    )
-
-from .io.overrides.extractor_base import ExtractorBase
-
-from .io.overrides.assignment import (
-        Assignment,
-        Override,
-        OverrideKeyPart,
-    )
-
-from .io.overrides.mapper import (
-        Mapper,
-    )
-
-from .io.overrides.mapper_builder import (
-        MapperBuilder,
-        MapperExtractorBuilder,
-    )
-
-from .io.reader.config_reader_base import ConfigReaderBase
-from .io.reader.json_reader import JsonReader
-from .io.reader.yaml_reader import YamlReader
-
-from .io.schema.schema_writer_base import (
-        SpecType,
-        DefinitionBase,
-        ListDefinition,
-        ObjectDefinition,
-        ValueDefinition,
-        SchemaWriterBase,
-    )
-
-from .io.schema.indented_schema_writer import (
-        IndentationConfig,
-        IndentedSchemaWriter,
-    )
-
-from .io.schema.json_like_writer import JsonLikeWriter
-from .io.schema.yaml_like_writer import YamlLikeWriter
-
-from .conversion.converter_base import (
-        ConversionTypeException,
-        ConverterBase,
-    )
-
-from .conversion.no_op_converter import NoOpConverter
-from .conversion.type_casting_converter import TypeCastingConverter
-
-from .validation.validator_base import (
-        ValidationException,
-        ValidatorPhase,
-        ValidatorBase
-    )
-
-from .validation.list_validator import ListValidator
-from .validation.pass_all_validator import PassAllValidator
-from .validation.str_format_validator import StrFormatValidator
\ No newline at end of file
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from .base.structured_config import (
+            ConfigFileArgumentType, 
+            ArgparseConfig, 
+            OverrideConfig, 
+            FileConfig, 
+            ConfigSpecification,
+        )
+
+    from .base.typedefs import (
+            ConversionTargetType, 
+            ConversionSourceType, 
+            ValidatorSourceType, 
+            ConfigObjectType, 
+            ScalarConfigTypeRequirements, 
+            ScalarConvertedTypeRequirements,
+        )
+
+    from .spec.config import (
+            Config,
+        )
+
+    from .spec.dataclass_spec import (
+            DataclassSpec,
+        )
+
+    from .spec.conversion_record import (
+            ConversionRecord,
+        )
+
+    from .spec.converted_config import (
+            ConvertedConfig,
+        )
+
+    from .spec.spec_index import (
+            SpecIndex,
+        )
+
+    from .spec.entries.list_entry import (
+            ListEntry,
+        )
+
+    from .spec.entries.object_entry import (
+            ObjectEntry,
+        )
+
+    from .spec.entries.scalar_entry import (
+            ScalarEntry,
+        )
+
+    from .spec.entries.object_requirements import (
+            MakeRequirements,
+        )
+
+    from .type_checking.type_config import (
+            TypeConfig,
+            ConfigTypeCheckingFunction,
+            ConvertedTypeCheckingFunction,
+        )
+
+    from .type_checking.converted_type_checker import (
+            ConvertedTypeChecker,
+        )
+
+    from .type_checking.config_type_checker import (
+            ConfigTypeChecker,
+        )
+
+    from .type_checking.type_registry import (
+            TypeRegistry,
+        )
+
+    from .type_checking.require_types import (
+            RequireConfigType,
+            RequireConvertedType,
+        )
+
+    from .cli_args.argparse_argument import ArgparseArgument
+    from .cli_args.config_argument import ConfigArgument
+    from .cli_args.override_list_argument import OverrideListArgument
+    from .cli_args.override_file_argument import OverrideFileArgument
+    from .cli_args.schema_argument import SchemaArgument
+    from .cli_args.schema_output_argument import (
+            SchemaOutputArgument,
+            SchemaOutputType,
+        )
+
+    from .io.case_translation.camel_case import CamelCase
+    from .io.case_translation.snake_case import SnakeCase
+    from .io.case_translation.pascal_case import PascalCase
+    from .io.case_translation.macro_case import MacroCase
+    from .io.case_translation.no_translation import NoTranslation
+    from .io.case_translation.case_translator_base import CaseTranslatorBase
+
+    from .io.overrides.argparse_extractor import (
+            DictionaryKeyFilterFunction,
+            ArgparseOverrideKeyMappingFunction,
+            ArgparseOverrides,
+        )
+
+    from .io.overrides.dictionary_node_classifier import (
+            DictionaryNodeClassifier,
+            DictionaryNodeClassification,
+        )
+
+    from .io.overrides.dictionary_source_extractor import (
+            DictionaryKeyExtractorFunction,
+            DictionarySourceExtractor,
+        )
+
+    from .io.overrides.functional_extractor import (
+            KeyListFunction,
+            SourceConverterFunction,
+            StringKeyMappingFunction,
+            FunctionalExtractor,
+            SourceConvertingFunctionalExtractor,
+        )
+
+    from .io.overrides.extractor_base import (
+            ExtractorBase,
+            ExtractorKeyFilterFunction,
+        )
+
+    from .io.overrides.assignment import (
+            Assignment,
+            Override,
+            OverrideKeyPart,
+        )
+
+    from .io.overrides.mapper import (
+            Mapper,
+        )
+
+    from .io.overrides.override_file_reader import (
+            OverrideFileReader,
+        )
+
+    from .io.overrides.mapper_builder import (
+            MapperBuilder,
+            MapperExtractorBuilder,
+        )
+
+    from .io.reader.config_reader_base import ConfigReaderBase
+    from .io.reader.json_reader import JsonReader
+    from .io.reader.yaml_reader import YamlReader
+
+    from .io.schema.schema_writer_base import (
+            SpecType,
+            DefinitionBase,
+            ListDefinition,
+            ObjectDefinition,
+            ValueDefinition,
+            SchemaWriterBase,
+        )
+
+    from .io.schema.indented_schema_writer import (
+            IndentationConfig,
+            IndentedSchemaWriter,
+        )
+
+    from .io.schema.json_like_writer import JsonLikeWriter
+    from .io.schema.yaml_like_writer import YamlLikeWriter
+
+    from .conversion.converter_base import (
+            ConversionTypeException,
+            ConverterBase,
+        )
+
+    from .conversion.no_op_converter import NoOpConverter
+    from .conversion.type_casting_converter import TypeCastingConverter
+    from .conversion.keyword_casting_converter import KeywordCastingConverter
+
+    from .validation.validator_base import (
+            ValidationException,
+            ValidatorPhase,
+            ValidatorBase
+        )
+
+    from .validation.list_validator import ListValidator
+    from .validation.pass_all_validator import PassAllValidator
+    from .validation.str_format_validator import StrFormatValidator
+    from .validation.compiled_validator import (
+            CompiledValidator,
+            ValidatorCheckFunction,
+        )
+    from .validation.range_validator import RangeValidator
+    from .validation.choice_validator import ChoiceValidator
+    from .validation.regex_validator import RegexValidator
+    from .validation.length_validator import LengthValidator
+    from .validation.combinators import (
+            AllOf,
+            AnyOf,
+            Not,
+        )
+    from .validation.element_validator_base import ElementValidatorBase
+    from .validation.element_range_validator import ElementRangeValidator
+    from .validation.element_choice_validator import ElementChoiceValidator
+    from .validation.element_regex_validator import ElementRegexValidator
+    from .validation.unique_elements_validator import UniqueElementsValidator
+    from .validation.cross_validation_context import CrossValidationContext
+    from .validation.cross_validator_base import (
+            CrossValidatorBase,
+            CrossValidationViolation,
+        )
+    from .validation.cross_validation_exception import CrossValidationException
+    from .validation.unique_key_validator import UniqueKeyValidator
+    from .validation.reference_validator import ReferenceValidator
+    from .validation.deferred_validation import (
+            DeferredValidation,
+            DeferredValidationException,
+            DeferredValidationFailure,
+        )
+    from .validation.path_exists_validator import (
+            PathExistsValidator,
+            PathKind,
+        )
+    from .base.result_cache import (
+            ResultCache,
+            ResultCacheStatistics,
+        )
+    from .io.schema.json_schema_writer import (
+            JSON_SCHEMA_DIALECT,
+            JsonSchemaWriter,
+        )
+
+# Public names and the modules that define them. The modules are only imported when a name is first
+# accessed (PEP 562), so importing the package doesn't import every submodule and its dependencies
+# (e.g. "yaml" and "argparse").
+_lazy_imports: Dict[str, str] = {
+    "ConfigFileArgumentType": ".base.structured_config",
+    "ArgparseConfig": ".base.structured_config",
+    "OverrideConfig": ".base.structured_config",
+    "FileConfig": ".base.structured_config",
+    "ConfigSpecification": ".base.structured_config",
+    "ConversionTargetType": ".base.typedefs",
+    "ConversionSourceType": ".base.typedefs",
+    "ValidatorSourceType": ".base.typedefs",
+    "ConfigObjectType": ".base.typedefs",
+    "ScalarConfigTypeRequirements": ".base.typedefs",
+    "ScalarConvertedTypeRequirements": ".base.typedefs",
+    "Config": ".spec.config",
+    "DataclassSpec": ".spec.dataclass_spec",
+    "ConversionRecord": ".spec.conversion_record",
+    "ConvertedConfig": ".spec.converted_config",
+    "SpecIndex": ".spec.spec_index",
+    "ListEntry": ".spec.entries.list_entry",
+    "ObjectEntry": ".spec.entries.object_entry",
+    "ScalarEntry": ".spec.entries.scalar_entry",
+    "MakeRequirements": ".spec.entries.object_requirements",
+    "TypeConfig": ".type_checking.type_config",
+    "ConfigTypeCheckingFunction": ".type_checking.type_config",
+    "ConvertedTypeCheckingFunction": ".type_checking.type_config",
+    "ConvertedTypeChecker": ".type_checking.converted_type_checker",
+    "ConfigTypeChecker": ".type_checking.config_type_checker",
+    "TypeRegistry": ".type_checking.type_registry",
+    "RequireConfigType": ".type_checking.require_types",
+    "RequireConvertedType": ".type_checking.require_types",
+    "ArgparseArgument": ".cli_args.argparse_argument",
+    "ConfigArgument": ".cli_args.config_argument",
+    "OverrideListArgument": ".cli_args.override_list_argument",
+    "OverrideFileArgument": ".cli_args.override_file_argument",
+    "SchemaArgument": ".cli_args.schema_argument",
+    "SchemaOutputArgument": ".cli_args.schema_output_argument",
+    "SchemaOutputType": ".cli_args.schema_output_argument",
+    "CamelCase": ".io.case_translation.camel_case",
+    "SnakeCase": ".io.case_translation.snake_case",
+    "PascalCase": ".io.case_translation.pascal_case",
+    "MacroCase": ".io.case_translation.macro_case",
+    "NoTranslation": ".io.case_translation.no_translation",
+    "CaseTranslatorBase": ".io.case_translation.case_translator_base",
+    "DictionaryKeyFilterFunction": ".io.overrides.argparse_extractor",
+    "ArgparseOverrideKeyMappingFunction": ".io.overrides.argparse_extractor",
+    "ArgparseOverrides": ".io.overrides.argparse_extractor",
+    "DictionaryNodeClassifier": ".io.overrides.dictionary_node_classifier",
+    "DictionaryNodeClassification": ".io.overrides.dictionary_node_classifier",
+    "DictionaryKeyExtractorFunction": ".io.overrides.dictionary_source_extractor",
+    "DictionarySourceExtractor": ".io.overrides.dictionary_source_extractor",
+    "KeyListFunction": ".io.overrides.functional_extractor",
+    "SourceConverterFunction": ".io.overrides.functional_extractor",
+    "StringKeyMappingFunction": ".io.overrides.functional_extractor",
+    "FunctionalExtractor": ".io.overrides.functional_extractor",
+    "SourceConvertingFunctionalExtractor": ".io.overrides.functional_extractor",
+    "ExtractorBase": ".io.overrides.extractor_base",
+    "ExtractorKeyFilterFunction": ".io.overrides.extractor_base",
+    "Assignment": ".io.overrides.assignment",
+    "Override": ".io.overrides.assignment",
+    "OverrideKeyPart": ".io.overrides.assignment",
+    "Mapper": ".io.overrides.mapper",
+    "OverrideFileReader": ".io.overrides.override_file_reader",
+    "MapperBuilder": ".io.overrides.mapper_builder",
+    "MapperExtractorBuilder": ".io.overrides.mapper_builder",
+    "ConfigReaderBase": ".io.reader.config_reader_base",
+    "JsonReader": ".io.reader.json_reader",
+    "YamlReader": ".io.reader.yaml_reader",
+    "SpecType": ".io.schema.schema_writer_base",
+    "DefinitionBase": ".io.schema.schema_writer_base",
+    "ListDefinition": ".io.schema.schema_writer_base",
+    "ObjectDefinition": ".io.schema.schema_writer_base",
+    "ValueDefinition": ".io.schema.schema_writer_base",
+    "SchemaWriterBase": ".io.schema.schema_writer_base",
+    "IndentationConfig": ".io.schema.indented_schema_writer",
+    "IndentedSchemaWriter": ".io.schema.indented_schema_writer",
+    "JsonLikeWriter": ".io.schema.json_like_writer",
+    "YamlLikeWriter": ".io.schema.yaml_like_writer",
+    "ConversionTypeException": ".conversion.converter_base",
+    "ConverterBase": ".conversion.converter_base",
+    "NoOpConverter": ".conversion.no_op_converter",
+    "TypeCastingConverter": ".conversion.type_casting_converter",
+    "KeywordCastingConverter": ".conversion.keyword_casting_converter",
+    "ValidationException": ".validation.validator_base",
+    "ValidatorPhase": ".validation.validator_base",
+    "ValidatorBase": ".validation.validator_base",
+    "ListValidator": ".validation.list_validator",
+    "PassAllValidator": ".validation.pass_all_validator",
+    "StrFormatValidator": ".validation.str_format_validator",
+    "CompiledValidator": ".validation.compiled_validator",
+    "ValidatorCheckFunction": ".validation.compiled_validator",
+    "RangeValidator": ".validation.range_validator",
+    "ChoiceValidator": ".validation.choice_validator",
+    "RegexValidator": ".validation.regex_validator",
+    "LengthValidator": ".validation.length_validator",
+    "AllOf": ".validation.combinators",
+    "AnyOf": ".validation.combinators",
+    "Not": ".validation.combinators",
+    "ElementValidatorBase": ".validation.element_validator_base",
+    "ElementRangeValidator": ".validation.element_range_validator",
+    "ElementChoiceValidator": ".validation.element_choice_validator",
+    "ElementRegexValidator": ".validation.element_regex_validator",
+    "UniqueElementsValidator": ".validation.unique_elements_validator",
+    "CrossValidationContext": ".validation.cross_validation_context",
+    "CrossValidatorBase": ".validation.cross_validator_base",
+    "CrossValidationViolation": ".validation.cross_validator_base",
+    "CrossValidationException": ".validation.cross_validation_exception",
+    "UniqueKeyValidator": ".validation.unique_key_validator",
+    "ReferenceValidator": ".validation.reference_validator",
+    "DeferredValidation": ".validation.deferred_validation",
+    "DeferredValidationException": ".validation.deferred_validation",
+    "DeferredValidationFailure": ".validation.deferred_validation",
+    "PathExistsValidator": ".validation.path_exists_validator",
+    "PathKind": ".validation.path_exists_validator",
+    "ResultCache": ".base.result_cache",
+    "ResultCacheStatistics": ".base.result_cache",
+    "JSON_SCHEMA_DIALECT": ".io.schema.json_schema_writer",
+    "JsonSchemaWriter": ".io.schema.json_schema_writer",
+}
+
+# subpackages, available as attributes like the public names
+_subpackages: List[str] = ["base", "cli_args", "conversion", "io", "spec", "type_checking", "validation"]
+
+__all__: List[str] = list(_lazy_imports.keys())
+
+def __getattr__(name: str) -> Any:
+    if name in _subpackages:
+        return importlib.import_module(f".{name}", __name__)
+    module: str or None = _lazy_imports.get(name, None)
+    if module == None:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    value: Any = getattr(importlib.import_module(module, __name__), name)
+    # later accesses don't go through "__getattr__" anymore
+    globals()[name] = value
+    return value
+
+def __dir__() -> List[str]:
+    return sorted(set(globals().keys()) | set(__all__))
\ No newline at end of file
@@ -0,0 +1,134 @@
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Tuple
+
+# maximum number of results kept by the shared cache
+RESULT_CACHE_SIZE: int = 65536
+
+# marks a cache miss, since "None" is a valid result
+_MISSING: object = object()
+
+
+@dataclass(frozen=True)
+class ResultCacheStatistics:
+    hits: int
+    misses: int
+    uncacheable: int
+    size: int
+    max_size: int
+
+    def hit_rate(self) -> float:
+        lookups: int = self.hits + self.misses
+        return self.hits / lookups if lookups > 0 else 0.0
+
+
+class _CachedFailure:
+    # the exception is stored without its traceback, and each hit raises a separate instance, since
+    # raising an exception sets its traceback, which must not be shared between threads
+    def __init__(self, error: BaseException):
+        self.error: BaseException = _CachedFailure._detach(error=error)
+
+    def fresh_error(self) -> BaseException:
+        return _CachedFailure._detach(error=self.error)
+
+    @staticmethod
+    def _detach(error: BaseException) -> BaseException:
+        # the constructor isn't called again, since its parameters don't necessarily match the args
+        fresh: BaseException = type(error).__new__(type(error), *error.args)
+        fresh.args = error.args
+        if hasattr(error, "__dict__"):
+            fresh.__dict__.update(error.__dict__)
+        fresh.__cause__ = error.__cause__
+        fresh.__suppress_context__ = error.__suppress_context__
+        return fresh
+
+
+class ResultCache:
+    """Bounded LRU cache of validator and converter results
+
+    Results are cached per (owner, value type, value), where the owner is the validator or converter
+    instance (compared by identity), so equal values of different types (e.g. "1" and "True") are
+    cached separately. Exceptions are cached as well, and a copy of the exception is raised on each
+    hit. Unhashable values are never cached. The cache is thread-safe, the cached function itself
+    runs outside of the lock. Validators and converters with "cacheable" set use the shared cache,
+    unless they are assigned their own.
+
+    Args:
+        max_size (int): maximum number of cached results
+    """
+
+    _shared: 'ResultCache or None' = None
+    _shared_lock: threading.Lock = threading.Lock()
+
+    def __init__(self, max_size: int = RESULT_CACHE_SIZE):
+        self._max_size: int = max_size
+        # the owner is stored with its results, so its id can't be reused while they are cached
+        self._results: 'OrderedDict[Tuple[int, type, Any], Tuple[Any, Any]]' = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+        self._hits: int = 0
+        self._misses: int = 0
+        self._uncacheable: int = 0
+
+    @staticmethod
+    def shared() -> 'ResultCache':
+        """Get the cache shared by all cacheable validators and converters"""
+        if ResultCache._shared == None:
+            with ResultCache._shared_lock:
+                if ResultCache._shared == None:
+                    ResultCache._shared = ResultCache()
+        return ResultCache._shared
+
+    def call(self, owner: Any, value: Any, compute: Callable[[], Any]) -> Any:
+        """Get the cached result for a value, or compute and cache it"""
+        key: Tuple[int, type, Any] = (id(owner), type(value), value)
+        try:
+            with self._lock:
+                entry: Tuple[Any, Any] or None = self._results.get(key, None)
+                result: Any = _MISSING
+                if entry != None:
+                    result = entry[1]
+                    self._results.move_to_end(key)
+                    self._hits += 1
+        except TypeError:
+            with self._lock:
+                self._uncacheable += 1
+            return compute()
+
+        if result is _MISSING:
+            try:
+                result = compute()
+            except Exception as error:
+                self._store(key=key, owner=owner, result=_CachedFailure(error=error))
+                raise
+            self._store(key=key, owner=owner, result=result)
+        elif type(result) is _CachedFailure:
+            raise result.fresh_error()
+        return result
+
+    def _store(self, key: Tuple[int, type, Any], owner: Any, result: Any):
+        with self._lock:
+            self._misses += 1
+            self._results[key] = (owner, result)
+            if len(self._results) > self._max_size:
+                self._results.popitem(last=False)
+
+    def statistics(self) -> ResultCacheStatistics:
+        with self._lock:
+            return ResultCacheStatistics(
+                hits=self._hits,
+                misses=self._misses,
+                uncacheable=self._uncacheable,
+                size=len(self._results),
+                max_size=self._max_size,
+            )
+
+    def clear(self):
+        """Remove all cached results and reset the statistics"""
+        with self._lock:
+            self._results.clear()
+            self._hits = 0
+            self._misses = 0
+            self._uncacheable = 0
+
@@ -4,6 +4,7 @@ from enum import Enum
 from pathlib import Path
 from typing import Callable, Dict, List, Type
 from structured_config.cli_args.config_argument import ConfigArgument
+from structured_config.cli_args.override_file_argument import OverrideFileArgument
 from structured_config.cli_args.override_list_argument import OverrideListArgument
 from structured_config.cli_args.schema_argument import SchemaArgument
 from structured_config.cli_args.schema_output_argument import SchemaOutputArgument
@@ -15,6 +16,7 @@ from structured_config.io.case_translation.pascal_case import PascalCase
 from structured_config.io.case_translation.snake_case import SnakeCase
 
 from structured_config.io.overrides.mapper import Mapper
+from structured_config.io.overrides.override_file_reader import OverrideFileReader
 from structured_config.io.overrides.mapper_builder import (
     MapperBuilder,
     MapperExtractorBuilder,
@@ -23,6 +25,7 @@ from structured_config.io.reader.config_reader_base import ConfigReaderBase
 from structured_config.io.reader.json_reader import JsonReader
 from structured_config.io.reader.yaml_reader import YamlReader
 from structured_config.spec.config_value_base import ConfigValueBase
+from structured_config.spec.converted_config import ConvertedConfig
 from structured_config.base.typedefs import ConfigObjectType, ConversionTargetType
 
 
@@ -47,6 +50,8 @@ class ArgparseConfig:
         config_file_argument_short_name (str or None): config file short argument name, will not be added if "None"
         overrides_list_name (str or None): override list argument name, will not be added if "None"
         overrides_list_short_name (str or None): override list short argument name, will not be added if "None"
+        overrides_file (OverrideFileArgument or None): optional override file argument (e.g. "--override-file"), files 
+                                                       may contain "key=value" lines or JSON Lines, see OverrideFileReader
     """
 
     parser: argparse.ArgumentParser
@@ -75,6 +80,8 @@ class ArgparseConfig:
         )
     )
 
+    overrides_file: OverrideFileArgument or None = None
+
     schema_options: List[SchemaArgument] = field(default_factory=lambda: [])
 
     def setup(self, config: ConfigValueBase) -> argparse.Namespace:
@@ -83,6 +90,8 @@ class ArgparseConfig:
                 self.config_file.apply(self.parser)
             if self.overrides_list:
                 self.overrides_list.apply(self.parser)
+            if self.overrides_file:
+                self.overrides_file.apply(self.parser)
 
             if len(self.schema_options) > 0:
                 # required for screen schema output
@@ -110,6 +119,10 @@ class ArgparseConfig:
         self, override_config: "OverrideConfig", arguments: argparse.Namespace
     ):
         if self.use_for_overrides:
+            # stream override files first, so that the override list takes precedence
+            if self.overrides_file:
+                for file in getattr(arguments, self.overrides_file.get_destination(), None) or []:
+                    override_config.mapper.direct_many(overrides=OverrideFileReader(file=file).read())
             override_config.mapper.build().from_argparse_keylist(
                 arguments=arguments, list_name=self.overrides_list.get_destination()
             ).all().apply().apply()
@@ -123,10 +136,13 @@ class OverrideConfig:
         mapper (Mapper): override mapper config (will be populated automatically with argparse config list if specified)
         mapping_modifier (Callable[[MapperBuilder], MapperBuilder): add extractors using the mapper builder (use this if
                                                                     you don't want to specify the entire mapper)
+        reject_unknown_keys (bool): raise an exception for overrides that don't target a value in the specification,
+                                    instead of adding them to the config data
     """
 
     mapper: Mapper = field(default_factory=lambda: Mapper())
     mapping_modifier: Callable[[MapperBuilder], MapperBuilder] = lambda m: m
+    reject_unknown_keys: bool = False
 
     def modify(self):
         self.mapping_modifier(self.mapper.build()).apply()
@@ -214,7 +230,12 @@ class ConfigSpecification:
 
     def get_config(self) -> ConversionTargetType:
         self._validate_config()
-        return self.specification.convert(input=self._prepare_config())
+        return self.specification.convert_deferred(input=self._prepare_config())
+
+    def get_converted_config(self) -> ConvertedConfig:
+        """Get the converted config, which can be re-derived with different overrides later on"""
+        self._validate_config()
+        return ConvertedConfig(specification=self.specification, data=self._prepare_config())
 
     def _prepare_config(self) -> ConfigObjectType:
         # initialize datan object
@@ -247,9 +268,12 @@ class ConfigSpecification:
 
         # modify mapper and apply overrides
         self.override_config.modify()
-        return self.override_config.mapper.with_source_case(
+        mapper: Mapper = self.override_config.mapper.with_source_case(
             source_case=self.specification.get_source_case()
-        ).apply(to=data)
+        )
+        if self.override_config.reject_unknown_keys:
+            self.specification.index().validate(overrides=mapper.overrides())
+        return mapper.apply(to=data)
 
     def _validate_config(self):
         # check config file location
@@ -1,9 +1,10 @@
 
 import argparse
+import sys
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, TextIO
 
 from structured_config.cli_args.argparse_argument import ArgparseArgument
 from structured_config.cli_args.schema_argument import SchemaArgument
@@ -46,17 +47,19 @@ class SchemaOutputArgument(SchemaArgument):
                 filepath.parent.mkdir(parents=True)
 
             with open(file=filepath, mode="w") as file:
-                file.write(self._write_schema(config=config))
+                self._write_schema(config=config, file=file)
 
             return False
     
         elif getattr(args, self._dest, False) and self.output_type == SchemaOutputType.Screen:
             # yes: print the schema, and exit
-            print(f"{self.prefix}{self._write_schema(config=config)}")
+            sys.stdout.write(self.prefix)
+            self._write_schema(config=config, file=sys.stdout)
+            sys.stdout.write("\n")
             return False
         
         # no: keep executing
         return True
     
-    def _write_schema(self, config: ConfigValueBase) -> str:
-        return self.writer.define(config=config)
\ No newline at end of file
+    def _write_schema(self, config: ConfigValueBase, file: TextIO):
+        self.writer.write(config=config, file=file)
\ No newline at end of file
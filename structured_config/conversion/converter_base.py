@@ -2,19 +2,41 @@
 from typing import Any, Type
 from structured_config.base.typedefs import ConversionSourceType, ConversionTargetType
 from structured_config.conversion.conversion_type_exception import ConversionTypeException
+from structured_config.base.result_cache import ResultCache
 
 class ConverterBase:
+    """Base class for converters
+    
+    Converters that are expensive, and always produce the same result for the same value, may set
+    "cacheable" to "True" (or call "set_cacheable()"). Their results, including failures, are then 
+    cached per value in a "ResultCache". Cached results are shared, so they should not be modified.
+    """
+
+    # cache results per value
+    cacheable: bool = False
+    # cache of cacheable converters, "None" for the shared cache
+    result_cache: ResultCache or None = None
 
     def __call__(self, other: ConversionSourceType, parent: str, current: str) -> ConversionTargetType:
         try:
             self.current: str = current
             self.parent: str = parent
+            if self.cacheable:
+                return (self.result_cache or ResultCache.shared()).call(
+                    owner=self, value=other, compute=lambda: self.convert(other=other)
+                )
             return self.convert(other=other)
         except ConversionTypeException as error:
             raise error
         except:
             raise ConversionTypeException(type(other), self.expected_type(), parent=parent, current=current)
         
+    def set_cacheable(self, cacheable: bool = True, cache: ResultCache or None = None) -> 'ConverterBase':
+        """Enable or disable result caching for this converter, optionally with its own cache"""
+        self.cacheable = cacheable
+        self.result_cache = cache
+        return self
+        
     def expected_type(self) -> ConversionTargetType or None:
         return None
 
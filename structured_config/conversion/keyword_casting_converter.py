@@ -0,0 +1,37 @@
+from typing import Callable, Dict, List, Type
+from structured_config.base.typedefs import ConversionSourceType, ConversionTargetType
+
+from structured_config.conversion.converter_base import ConverterBase
+
+class KeywordCastingConverter(ConverterBase):
+    """Construct the target type with the keys of a dictionary as keyword arguments (e.g. dataclasses)
+
+    Args:
+        to (ConversionTargetType): type to construct
+        factories (Dict[str, Callable[[], ConversionTargetType]] or None): optional, keys whose missing 
+            values ("None") are replaced by the result of the factory, called on each conversion
+        omitted (List[str] or None): optional, keys that aren't passed at all if their value is missing
+    """
+    
+    def __init__(self, 
+                 to: ConversionTargetType, 
+                 factories: Dict[str, Callable[[], ConversionTargetType]] or None = None,
+                 omitted: List[str] or None = None):
+        self.to: ConversionTargetType = to
+        self.factories: Dict[str, Callable[[], ConversionTargetType]] = factories or {}
+        self.omitted: List[str] = omitted or []
+
+    def convert(self, other: ConversionSourceType) -> ConversionTargetType:
+        if len(self.factories) == 0 and len(self.omitted) == 0:
+            return self.to(**other)
+        arguments: Dict[str, ConversionTargetType] = dict(other)
+        for key, factory in self.factories.items():
+            if arguments.get(key, None) == None:
+                arguments[key] = factory()
+        for key in self.omitted:
+            if key in arguments and arguments[key] == None:
+                del arguments[key]
+        return self.to(**arguments)
+    
+    def expected_type(self) -> ConversionTargetType or None:
+        return self.to
@@ -1,10 +1,9 @@
 
 from structured_config.io.case_translation.case_translator_base import CaseTranslatorBase, ConfigObjectType
-
-import stringcase
+from structured_config.io.case_translation.case_conversion import camel_case
 
 class CamelCase(CaseTranslatorBase):
 
     def translate(self, key: str) -> str:
-        return stringcase.camelcase(string=key)
-        
\ No newline at end of file
+        return camel_case(str(key))
+        
@@ -0,0 +1,44 @@
+
+from functools import lru_cache
+import re
+
+# maximum number of distinct keys memoized per case conversion
+CASE_CONVERSION_CACHE_SIZE: int = 16384
+
+# Precompiled patterns of the case conversions. The conversions produce exactly the same results as 
+# the "stringcase" package, which was used by earlier versions of this package.
+_SNAKE_SEPARATORS: re.Pattern = re.compile(r"[\-\.\s]")
+_SNAKE_UPPERCASE: re.Pattern = re.compile(r"[A-Z]")
+_CAMEL_REMOVED: re.Pattern = re.compile(r"\w[\s\W]+\w")
+_CAMEL_SEPARATED: re.Pattern = re.compile(r"[\-_\.\s]([a-z])")
+
+def _snake_replacement(match: re.Match) -> str:
+    return "_" + match.group(0).lower()
+
+def _camel_replacement(match: re.Match) -> str:
+    return match.group(1).upper()
+
+@lru_cache(maxsize=CASE_CONVERSION_CACHE_SIZE)
+def snake_case(key: str) -> str:
+    key = _SNAKE_SEPARATORS.sub("_", key)
+    if not key:
+        return key
+    return key[0].lower() + _SNAKE_UPPERCASE.sub(_snake_replacement, key[1:])
+
+@lru_cache(maxsize=CASE_CONVERSION_CACHE_SIZE)
+def camel_case(key: str) -> str:
+    key = _CAMEL_REMOVED.sub("", key)
+    if not key:
+        return key
+    return key[0].lower() + _CAMEL_SEPARATED.sub(_camel_replacement, key[1:])
+
+@lru_cache(maxsize=CASE_CONVERSION_CACHE_SIZE)
+def pascal_case(key: str) -> str:
+    key = camel_case(key)
+    if not key:
+        return key
+    return key[0].upper() + key[1:]
+
+@lru_cache(maxsize=CASE_CONVERSION_CACHE_SIZE)
+def macro_case(key: str) -> str:
+    return snake_case(key).upper()
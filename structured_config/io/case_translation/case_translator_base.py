@@ -1,15 +1,42 @@
 
+from typing import Any, Dict, Iterable, List, Tuple
 from structured_config.base.typedefs import ConfigObjectType
 
 class CaseTranslatorBase:
 
     def translate_keys(self, input: ConfigObjectType) -> ConfigObjectType:
-        if type(input) is list:
-            return [self.translate_keys(input=element) for element in input]
-        elif type(input) is dict:
-            return {self.translate(key=key): self.translate_keys(input=value) for key, value in input.items()}
-        else:
+        """Translate all dictionary keys in a config object
+        
+        The config object is walked without recursion, so arbitrarily deep config objects are supported.
+        """
+        if type(input) is not list and type(input) is not dict:
             return input
 
+        # each stack entry holds a source container and the translated container that is filled from it
+        output: ConfigObjectType = [] if type(input) is list else {}
+        stack: List[Tuple[ConfigObjectType, ConfigObjectType]] = [(input, output)]
+        while len(stack) > 0:
+            source, target = stack.pop()
+            if type(source) is list:
+                for element in source:
+                    target.append(self._translated_child(value=element, stack=stack))
+            else:
+                for key, value in source.items():
+                    target[self.translate(key=key)] = self._translated_child(value=value, stack=stack)
+        return output
+    
+    def translate_many(self, keys: Iterable[str]) -> List[str]:
+        """Translate a batch of keys"""
+        translate = self.translate
+        return [translate(key=key) for key in keys]
+
     def translate(self, key: str) -> str:
-        raise NotImplementedError()
\ No newline at end of file
+        raise NotImplementedError()
+    
+    def _translated_child(self, value: Any, stack: List[Tuple[ConfigObjectType, ConfigObjectType]]) -> Any:
+        # containers are filled later, scalars are used as-is
+        if type(value) is list or type(value) is dict:
+            child: ConfigObjectType = [] if type(value) is list else {}
+            stack.append((value, child))
+            return child
+        return value
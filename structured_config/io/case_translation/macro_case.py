@@ -1,10 +1,9 @@
 
 from structured_config.io.case_translation.case_translator_base import CaseTranslatorBase, ConfigObjectType
-
-import stringcase
+from structured_config.io.case_translation.case_conversion import macro_case
 
 class MacroCase(CaseTranslatorBase):
 
     def translate(self, key: str) -> str:
-        return stringcase.uppercase(string=stringcase.snakecase(string=key))
-        
\ No newline at end of file
+        return macro_case(str(key))
+        
@@ -1,7 +1,6 @@
 
 from structured_config.io.case_translation.case_translator_base import CaseTranslatorBase, ConfigObjectType
 
-import stringcase
 
 class NoTranslation(CaseTranslatorBase):
 
@@ -1,10 +1,9 @@
 
 from structured_config.io.case_translation.case_translator_base import CaseTranslatorBase, ConfigObjectType
-
-import stringcase
+from structured_config.io.case_translation.case_conversion import pascal_case
 
 class PascalCase(CaseTranslatorBase):
 
     def translate(self, key: str) -> str:
-        return stringcase.pascalcase(string=key)
-        
\ No newline at end of file
+        return pascal_case(str(key))
+        
@@ -1,10 +1,9 @@
 
 from structured_config.io.case_translation.case_translator_base import CaseTranslatorBase, ConfigObjectType
-
-import stringcase
+from structured_config.io.case_translation.case_conversion import snake_case
 
 class SnakeCase(CaseTranslatorBase):
 
     def translate(self, key: str) -> str:
-        return stringcase.snakecase(string=key)
-        
\ No newline at end of file
+        return snake_case(str(key))
+        
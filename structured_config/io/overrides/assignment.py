@@ -1,28 +1,45 @@
 
-from dataclasses import dataclass
-from typing import List, Dict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import List, Dict, Tuple
 from structured_config.io.overrides.invalid_override_type_exception import InvalidOverrideTypeException
 from structured_config.io.overrides.invalid_override_specification_exception import InvalidOverrideSpecificationException
 from structured_config.base.typedefs import ConfigObjectType
 import re
 
-@dataclass
+# list SET directive, e.g. "[3]" or "[-1]"
+_INDEX_PATTERN: re.Pattern = re.compile(r"\[(-1|([0-9])+)\]")
+
+# maximum number of distinct override keys kept in the shared key cache
+OVERRIDE_KEY_CACHE_SIZE: int = 65536
+
+@dataclass(frozen=True)
 class OverrideKeyPart:
     part: str
     array: bool
 
     @staticmethod
     def from_str_part(str_part: str) -> 'OverrideKeyPart':
-        index_pattern: str = r"\[(-1|([0-9])+)\]"
         if str_part == "+":
             return OverrideKeyPart(part="array.add", array=True)
-        elif re.search(pattern=index_pattern, string=str_part):
+        
+        match: re.Match or None = _INDEX_PATTERN.search(str_part)
+        if match:
             return OverrideKeyPart(
-                part=f"array.set:{re.search(pattern=index_pattern, string=str_part)[1]}",
+                part=f"array.set:{match[1]}",
                 array=True,
             )
         else:
             return OverrideKeyPart(part=str_part, array=False)
+    
+    @staticmethod
+    def parse_key(key: str) -> Tuple['OverrideKeyPart', ...]:
+        """Split a full override key into its (immutable) path of key parts
+        
+        Parsed keys are cached in a bounded LRU cache shared by all overrides and mappers, so
+        each distinct key is only parsed once.
+        """
+        return _parse_key(key)
         
     def __str__(self) -> str:
         return self.part
@@ -75,65 +92,172 @@ class Override:
     When specifying multiple overrides where some SET directive depend on previous ADD directives, 
     the order of application is relevant. This is why the "Mapper" class sorts all overrides before 
     applying them to ensure that all ADD directives are run before the SET directives.  
+
+    The key is parsed exactly once on construction, the resulting tuple of key parts is available as "path".
     """
 
     key: str
     value: str or int or float or bool
+    path: Tuple[OverrideKeyPart, ...] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         # force type check of "value": we need this to be a scalar type that could be the output
         # of a config file reader, in order to keep consistency with that the converters may expect
         if type(self.value) is not str and type(self.value) is not int and type(self.value) is not float and type(self.value) is not bool:
             raise InvalidOverrideTypeException(location=self.key, type=type(self.value))
+        
+        # parse the key once, sorting and assignment both work on the parsed path
+        self.path = OverrideKeyPart.parse_key(key=self.key)
 
     def split_key(self) -> List[OverrideKeyPart]:
-        parts: List[str] = self.key.split(".")
-        return [OverrideKeyPart.from_str_part(str_part=part) for part in parts]
+        return list(self.path)
+
+@lru_cache(maxsize=OVERRIDE_KEY_CACHE_SIZE)
+def _parse_key(key: str) -> Tuple[OverrideKeyPart, ...]:
+    return tuple(OverrideKeyPart.from_str_part(str_part=part) for part in key.split("."))
+
+@dataclass
+class _OverrideLeaf:
+    value: str or int or float or bool
+
+class _OverrideTrieNode:
+    """Prefix trie node grouping all overrides below one config location
+
+    Entries are kept in application order. Each entry is either a child node (all overrides continuing
+    below the same key part), or a leaf value assigned to a key part. Overrides are only merged into an 
+    existing child if that doesn't change the result compared to applying them one by one: each ADD 
+    directive creates its own child, an ADD closes any open "[-1]" child (the last element changes), and
+    assigning a value to a key part closes the child for that key part. Repeated value assignments to the 
+    same key part collapse to the last one.
+    """
+
+    def __init__(self, location: str, next_part: OverrideKeyPart or None = None):
+        self.location: str = location
+        self.next_part: OverrideKeyPart or None = next_part
+        self.entries: List[Tuple[OverrideKeyPart, '_OverrideTrieNode' or _OverrideLeaf]] = []
+        self._open_children: Dict[str, _OverrideTrieNode] = {}
+        self._leaves: Dict[str, int] = {}
+
+    def insert(self, override: Override):
+        node: _OverrideTrieNode = self
+        path: Tuple[OverrideKeyPart, ...] = override.path
+        for index in range(len(path) - 1):
+            node = node._child(part=path[index], next_part=path[index + 1])
+        node._assign(part=path[-1], value=override.value)
+
+    def _child(self, part: OverrideKeyPart, next_part: OverrideKeyPart) -> '_OverrideTrieNode':
+        if part.part == "array.add":
+            # every ADD directive creates a new list element
+            self._close_last_element()
+        elif part.part in self._open_children:
+            return self._open_children[part.part]
+        
+        child: _OverrideTrieNode = _OverrideTrieNode(
+            location=f"{self.location}.{part.part}" if self.location else part.part, 
+            next_part=next_part,
+        )
+        self.entries.append((part, child))
+        if part.part != "array.add":
+            self._open_children[part.part] = child
+            # a later value assignment must not be moved before this child
+            self._leaves.pop(part.part, None)
+        return child
+
+    def _assign(self, part: OverrideKeyPart, value: str or int or float or bool):
+        if part.part == "array.add":
+            self._close_last_element()
+            self.entries.append((part, _OverrideLeaf(value=value)))
+        elif part.part in self._leaves:
+            # last writer wins
+            self.entries[self._leaves[part.part]][1].value = value
+        else:
+            self._open_children.pop(part.part, None)
+            self._leaves[part.part] = len(self.entries)
+            self.entries.append((part, _OverrideLeaf(value=value)))
+        
+    def _close_last_element(self):
+        self._open_children.pop("array.set:-1", None)
+        self._leaves.pop("array.set:-1", None)
 
 class Assignment:
+    """Apply a list of overrides to config data
+
+    By default, the data is modified in-place. If "in_place" is "False", the data is treated as an 
+    immutable base document instead: only the dictionaries and lists along the paths touched by the
+    overrides are (shallowly) copied, while all other subtrees are shared with the base. This allows
+    applying many different override sets to the same base without deep-copying it every time.
 
-    def __init__(self, overrides: List[Override], data: ConfigObjectType):
+    Args:
+        overrides (List[Override]): overrides to apply, in application order
+        data (ConfigObjectType): config data the overrides are applied to
+        in_place (bool): modify the data in-place, defaults to "True"
+    """
+
+    def __init__(self, overrides: List[Override], data: ConfigObjectType, in_place: bool = True):
         self._overrides = overrides
         self._data = data
+        self._in_place = in_place
 
     def apply(self) -> ConfigObjectType:
+        # group the overrides by their shared key prefixes, so every shared part of a 
+        # path is only traversed and type-checked once
+        root: _OverrideTrieNode = _OverrideTrieNode(location="")
         for override in self._overrides:
-            self._process_one_override(override=override)
-        return self._data
-
-    def _process_one_override(self, override: Override):
-        # split key into parts
-        key: List[OverrideKeyPart] = override.split_key()
-
-        # start with the data as the current object
-        current: ConfigObjectType = self._data
-
-        # go through each part
-        for index in range(len(key)):
-            
-            # check position in key chain
-            if index >= len(key) - 1:
-                # last key in the chain, we need to assign the value here
+            root.insert(override=override)
+        return self._apply_node(node=root, current=self._data, copy=not self._in_place)
+
+    def _apply_node(self, node: _OverrideTrieNode, current: ConfigObjectType, copy: bool) -> ConfigObjectType:
+        # copy-on-write: copy the container before it is modified, the caller stores the copy in its parent
+        if copy and (type(current) is dict or type(current) is list):
+            current = current.copy()
+
+        # list element checks only need to be repeated once the list was modified on this level
+        elements_checked: bool = False
+        scalars_checked: bool = False
+        for part, entry in node.entries:
+            if type(entry) is _OverrideLeaf:
+                # assign the value on this level
                 self._assign_value(
-                    current_part=key[index], 
-                    current_object=current, 
-                    value=override.value, 
-                    parent_key=".".join([str(k) for k in key[:index]]),
+                    current_part=part,
+                    current_object=current,
+                    value=entry.value,
+                    parent_key=node.location,
+                    check_elements=not scalars_checked,
                 )
+                scalars_checked = True
+                elements_checked = False
             else:
-                # not at the end of the chain yet, we need to keep going
-                current = self._advance(
-                    current_part=key[index],
-                    next_part=key[index + 1],
+                # containers created by this assignment don't need to be copied
+                created: bool = part.part == "array.add" or (not part.array and type(current) is dict and part.part not in current)
+
+                # advance once, and apply all overrides below that part
+                next_object: ConfigObjectType = self._advance(
+                    current_part=part,
+                    next_part=entry.next_part,
                     current_object=current,
-                    parent_key=".".join([str(k) for k in key[:index]]),
+                    parent_key=node.location,
+                    check_elements=not elements_checked,
                 )
+                elements_checked = True
+                scalars_checked = False
+                applied: ConfigObjectType = self._apply_node(node=entry, current=next_object, copy=copy and not created)
+                if applied is not next_object:
+                    self._replace(current_part=part, current_object=current, value=applied)
+        return current
+    
+    def _replace(self, current_part: OverrideKeyPart, current_object: ConfigObjectType, value: ConfigObjectType):
+        # store a copied child in its (already copied) parent
+        if current_part.array:
+            current_object[int(current_part.part.split(":")[1])] = value
+        else:
+            current_object[current_part.part] = value
 
     def _advance(self,
                  current_part: OverrideKeyPart,
                  next_part: OverrideKeyPart,
                  current_object: ConfigObjectType,
-                 parent_key: str) -> ConfigObjectType:
+                 parent_key: str,
+                 check_elements: bool = True) -> ConfigObjectType:
         # check part type
         if current_part.array:
             # current stage should be a list
@@ -143,7 +267,8 @@ class Assignment:
                     current_part=current_part,
                     next_part=next_part,
                     current_object=current_object,
-                    parent_key=parent_key
+                    parent_key=parent_key,
+                    check_elements=check_elements,
                 )
             else:
                 # current object is not a list
@@ -172,12 +297,13 @@ class Assignment:
                       current_part: OverrideKeyPart,
                       next_part: OverrideKeyPart,
                       current_object: List[ConfigObjectType],
-                      parent_key: str):
+                      parent_key: str,
+                      check_elements: bool = True):
         
         # because we have a list, and want to access either an object or a list
         # next, we need to make sure that the list is either empty, or that all
         # elements are either objects or lists
-        if len(current_object) > 0 and (not all([type(e) is list for e in current_object]) and not all([type(e) is dict for e in current_object])):
+        if check_elements and len(current_object) > 0 and (not all(type(e) is list for e in current_object) and not all(type(e) is dict for e in current_object)):
             raise InvalidOverrideSpecificationException(reason=f"List '{parent_key}' contains mismatched element types, all elements "
                                                                f"must be either objects or lists")
 
@@ -221,7 +347,8 @@ class Assignment:
                       current_part: OverrideKeyPart, 
                       current_object: ConfigObjectType,
                       value: str or int or float or bool,
-                      parent_key: str):
+                      parent_key: str,
+                      check_elements: bool = True):
         if current_part.array:
             # current key part is assigning referring to an array entry,
             # so we need to check if the current object is a list
@@ -231,6 +358,7 @@ class Assignment:
                     current_object=current_object,
                     value=value,
                     parent_key=parent_key,
+                    check_elements=check_elements,
                 )
             else:
                 # current object is not a list
@@ -254,13 +382,14 @@ class Assignment:
                               current_part: OverrideKeyPart, 
                               current_object: List[ConfigObjectType],
                               value: str or int or float or bool,
-                              parent_key: str):
+                              parent_key: str,
+                              check_elements: bool = True):
         # we have a list, and want to assign this value to that list
         # to ensure that we don't mix scalars with objects in lists (this is
         # not supported by the later specification framework), we check that 
         # the list is either empty, or every element in the list is not another 
         # list, dict, or object
-        if len(current_object) > 0 and any([type(e) is list or type(e) is dict or type(e) is object for e in current_object]):
+        if check_elements and len(current_object) > 0 and any(type(e) is list or type(e) is dict or type(e) is object for e in current_object):
             raise InvalidOverrideSpecificationException(reason=f"List {parent_key} contains objects, but must contain only scalars "
                                                                f"for a scalar override value to be valid")        
 
@@ -1,6 +1,5 @@
 from enum import Enum
-import itertools
-from typing import Any, Callable, List, Type
+from typing import Any, Dict, List, Protocol, Type
 
 
 class DictionaryNodeClassification(Enum):
@@ -18,39 +17,72 @@ class InconsistentDictionaryListNode(Exception):
         )
 
 
+class DictionaryNodeLocationFunction(Protocol):
+    def __call__(self) -> str: ...
+
+
 class DictionaryNodeClassifier:
+    """Classify dictionary nodes as trees, lists, leaves, or multi-leaves
+
+    List nodes are classified by looking at their elements once: dictionaries are tree nodes, scalars 
+    are leaf nodes, and only nested lists need to be classified themselves. Classifications of nested
+    lists can be memoized in a cache that is shared across one walk over a dictionary, so that shared
+    and nested lists are only classified once. Node locations are only needed for error messages, so
+    they are passed as functions and only evaluated when an error is raised.
+    """
+
     def __init__(self):
         self._tree_type: Type = dict
         self._list_type: Type = list
 
     def classify(
-        self, value: Any, location: str, multidict: bool
+        self, 
+        value: Any, 
+        location: str or DictionaryNodeLocationFunction, 
+        multidict: bool,
+        cache: Dict[int, DictionaryNodeClassification] or None = None,
     ) -> DictionaryNodeClassification:
         if type(value) is self._tree_type:
             return DictionaryNodeClassification.Tree
         elif type(value) is self._list_type:
-            return self._classify_list(
-                list=value, location=location, multidict=multidict
+            # check for memoized classifications first
+            if cache != None and id(value) in cache:
+                return cache[id(value)]
+            classification: DictionaryNodeClassification = self._classify_list(
+                list=value, 
+                location=location if callable(location) else lambda: location, 
+                multidict=multidict,
+                cache=cache,
             )
+            if cache != None:
+                cache[id(value)] = classification
+            return classification
         else:
             return DictionaryNodeClassification.Leaf
 
     def _classify_list(
-        self, list: List[Any], location: str, multidict: bool
+        self, 
+        list: List[Any], 
+        location: DictionaryNodeLocationFunction, 
+        multidict: bool,
+        cache: Dict[int, DictionaryNodeClassification] or None,
     ) -> DictionaryNodeClassification:
-        # classify all list elements
-        classifications: List[DictionaryNodeClassification] = [
-            self.classify(
-                value=value, location=".".join(location.split(".") + [f"[{index}]"])
+        # classify all list elements, and verify that they all have the same classification
+        first: DictionaryNodeClassification or None = None
+        for index, value in enumerate(list):
+            classification: DictionaryNodeClassification = self.classify(
+                value=value, 
+                location=lambda: self._element_location(location=location(), index=index), 
+                multidict=multidict, 
+                cache=cache,
             )
-            for index, value in enumerate(list)
-        ]
-
-        # validate the classifications
-        self._verify_list_validity(list=classifications, location=location)
+            if first == None:
+                first = classification
+            elif classification != first:
+                raise InconsistentDictionaryListNode(location=location())
 
         # determine the type
-        if all([c == DictionaryNodeClassification.Leaf for c in classifications]):
+        if first == None or first == DictionaryNodeClassification.Leaf:
             return (
                 DictionaryNodeClassification.MultiLeaf
                 if multidict
@@ -59,15 +91,5 @@ class DictionaryNodeClassifier:
         else:
             return DictionaryNodeClassification.List
 
-    def _list_element_types(self, list: List[Any]) -> List[Type]:
-        return [type(element) for element in list]
-
-    def _list_has_same_elements(self, list: List[Any]) -> bool:
-        grouped = itertools.groupby(list)
-        return next(grouped, True) and not next(grouped, False)
-
-    def _verify_list_validity(
-        self, list: List[DictionaryNodeClassification], location: str
-    ):
-        if not self._list_has_same_elements(list=list):
-            raise InconsistentDictionaryListNode(location=location)
+    def _element_location(self, location: str, index: int) -> str:
+        return f"{location}.[{index}]" if len(location) > 0 else f"[{index}]"
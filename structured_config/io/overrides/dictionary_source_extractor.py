@@ -1,8 +1,12 @@
-from typing import Any, Dict, List, Protocol, Tuple
+import itertools
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterator, List, Protocol, Tuple
+from structured_config.io.overrides.assignment import Override
 from structured_config.io.overrides.dictionary_node_classifier import (
     DictionaryNodeClassification,
     DictionaryNodeClassifier,
 )
+from structured_config.io.overrides.extractor_base import ExtractorKeyFilterFunction
 from structured_config.io.overrides.functional_extractor import (
     SourceConvertingFunctionalExtractor,
     StringKeyMappingFunction,
@@ -14,6 +18,41 @@ class DictionaryKeyExtractorFunction(Protocol):
         ...
 
 
+class _FlattenedSourceView(Mapping):
+    """Read-only flattened source, passed to the mapping function when all pairs are streamed
+
+    The pair currently passed to the mapping function is returned without flattening the source. The
+    source is only flattened into a dictionary once any other key is accessed, or the view is iterated.
+    """
+
+    def __init__(self, flatten: Callable[[], Dict[str, Any]]):
+        self._flatten: Callable[[], Dict[str, Any]] = flatten
+        self._flattened: Dict[str, Any] or None = None
+        self._key: str or None = None
+        self._value: Any = None
+
+    def current(self, key: str, value: Any) -> '_FlattenedSourceView':
+        self._key = key
+        self._value = value
+        return self
+
+    def __getitem__(self, key: str) -> Any:
+        if key == self._key:
+            return self._value
+        return self._all()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._all())
+
+    def __len__(self) -> int:
+        return len(self._all())
+
+    def _all(self) -> Dict[str, Any]:
+        if self._flattened == None:
+            self._flattened = self._flatten()
+        return self._flattened
+
+
 class DictionarySourceExtractor(SourceConvertingFunctionalExtractor):
     """Extractor working on dictionaries
 
@@ -30,7 +69,11 @@ class DictionarySourceExtractor(SourceConvertingFunctionalExtractor):
 
     The data parameter is the default source, and it should be a dictionary or list. This source
     is flattened as described above, which is the internal data source used to actually retrieve
-    override values.
+    override values. When collecting all overrides from the default source or an alternate source, the 
+    flattened pairs are streamed into the mapping function one at a time. The mapping function then 
+    receives a read-only mapping of the flattened source instead of a dictionary: it returns the value of 
+    the key it was called with directly, and only flattens the entire source if any other key is accessed.
+    The default source is only flattened into a dictionary when single keys are requested from it.
     """
 
     def __init__(
@@ -44,46 +87,84 @@ class DictionarySourceExtractor(SourceConvertingFunctionalExtractor):
         self._multidict: bool = multidict
         self._keep_nones: bool = keep_nones
         super().__init__(
-            lambda source: [k for k in list(source.keys())],
+            lambda source: source.keys(),
             self._flatten,
             mapping,
             data,
         )
 
-    def _flatten(self, source: Any) -> Any:
-        return dict(self._key_value_pairs(current=source, keys=[]))
-
-    def _key_value_pairs(
-        self, current: Dict[str, Any] or List[str] or Any, keys: List[str]
-    ) -> List[Tuple[str, Any]]:
-        pairs: List[Tuple[str, Any]] = []
-
-        # classify the curren node
-        combined_key: str = ".".join(keys)
-        classification: DictionaryNodeClassification = self._node_classifier.classify(
-            value=current,
-            location=combined_key,
-            multidict=self._multidict,
+    def all_available(self, key_filter: ExtractorKeyFilterFunction or None = None) -> Iterator[Override]:
+        # stream the default source in the same way as alternate sources
+        return self.all_available_from_source(source=self._source, key_filter=key_filter)
+
+    def all_available_from_source(self, source: Any, key_filter: ExtractorKeyFilterFunction or None = None) -> Iterator[Override]:
+        # stream the flattened pairs of the source directly into the mapping function, the flattened 
+        # dictionary is only materialized if the mapping accesses any other key
+        view: _FlattenedSourceView = _FlattenedSourceView(flatten=lambda: dict(self._key_value_pairs(source=source)))
+        return itertools.chain.from_iterable(
+            self._get_from_converted(key=key, converted=view.current(key=key, value=value))
+            for key, value in self._key_value_pairs(source=source) if key_filter == None or key_filter(key=key)
         )
 
-        # collect key-value-pairs accordingly
-        if classification == DictionaryNodeClassification.Tree:
-            for key, value in current.items():
-                pairs.extend(self._key_value_pairs(current=value, keys=keys + [key]))
-        elif classification == DictionaryNodeClassification.List:
-            for i, value in enumerate(current):
-                pairs.extend(
-                    self._key_value_pairs(current=value, keys=keys + [f"[{i}]"])
-                )
-        else:
-            pairs.extend([(".".join(keys), current)])
-
-        # return all pairs wwith valid keys
-        return list(
-            filter(
-                lambda p: len(p[0]) > 1 and (self._keep_nones or p[1] != None), pairs
+    def _flatten(self, source: Any) -> Any:
+        return dict(self._key_value_pairs(source=source))
+
+    def flattened_keys(self, source: Any) -> Iterator[str]:
+        """Lazily get all flattened keys of a (not yet flattened) source"""
+        return (key for key, _ in self._key_value_pairs(source=source))
+
+    def _key_value_pairs(self, source: Dict[str, Any] or List[Any] or Any) -> Iterator[Tuple[str, Any]]:
+        # Walk the source depth-first without recursion. Each stack entry holds the depth of 
+        # its children and an iterator over them, and all levels share one key buffer, so the 
+        # combined key is only joined for the pairs that are actually produced.
+        keys: List[str] = []
+        stack: List[Tuple[int, Iterator[Tuple[str, Any]]]] = []
+        # list classifications are memoized for this walk, nested lists are classified once
+        cache: Dict[int, DictionaryNodeClassification] = {}
+        children: Iterator[Tuple[str, Any]] or None = self._children(value=source, keys=keys, cache=cache)
+        if children != None:
+            stack.append((0, children))
+
+        while len(stack) > 0:
+            depth, children = stack[-1]
+            entry: Tuple[str, Any] or None = next(children, None)
+            if entry == None:
+                stack.pop()
+                continue
+
+            # replace the key on this level
+            key, value = entry
+            del keys[depth:]
+            keys.append(key)
+
+            # descend into trees and lists, and collect leaves
+            next_children: Iterator[Tuple[str, Any]] or None = self._children(value=value, keys=keys, cache=cache)
+            if next_children != None:
+                stack.append((depth + 1, next_children))
+            elif self._keep_nones or value != None:
+                combined_key: str = ".".join(keys)
+                # only pairs with valid keys are returned
+                if len(combined_key) > 1:
+                    yield (combined_key, value)
+
+    def _children(self, 
+                  value: Any, 
+                  keys: List[str], 
+                  cache: Dict[int, DictionaryNodeClassification]) -> Iterator[Tuple[str, Any]] or None:
+        # get the children of tree and list nodes, or None for leaves
+        if type(value) is dict:
+            return iter(value.items())
+        elif type(value) is list:
+            classification: DictionaryNodeClassification = self._node_classifier.classify(
+                value=value,
+                # the location is only joined if the list is invalid
+                location=lambda: ".".join(keys),
+                multidict=self._multidict,
+                cache=cache,
             )
-        )
+            if classification == DictionaryNodeClassification.List:
+                return ((f"[{i}]", element) for i, element in enumerate(value))
+        return None
 
     @staticmethod
     def direct(data: Dict[str, Any] or List[Any]):
@@ -1,9 +1,12 @@
 
 import itertools
-from typing import Any, List
+from typing import Any, Iterable, Iterator, List, Protocol
 
 from structured_config.io.overrides.assignment import Override
 
+class ExtractorKeyFilterFunction(Protocol):
+    def __call__(self, key: Any) -> bool: ...
+
 class ExtractorBase:
     """Override extractor base class
     
@@ -18,13 +21,18 @@ class ExtractorBase:
     "available_keys() and "available_keys_for_source()" should return all valid keys for the default source,
     or an alternate source, respectively. "all_available()" and "all_available_from_source()" use these 
     lists of valid keys to collect all overrides that either the default source or an alternate source can
-    provide to this extractor.
+    provide to this extractor. Both return iterators, so overrides can be streamed from the source to the mapper
+    without materializing them. An optional key filter drops keys before any overrides are created for them (e.g. 
+    keys the config specification doesn't know).
+
+    Available keys may be returned as any iterable, and "get()" and "get_from_source()" may return any iterable 
+    of overrides.
     """
 
-    def available_keys(self) -> List[Any]:
+    def available_keys(self) -> Iterable[Any]:
         """Get a list of all available keys for the default source"""
         raise NotImplementedError()
-    def available_keys_for_source(self, source: Any) -> List[Any]:
+    def available_keys_for_source(self, source: Any) -> Iterable[Any]:
         """Get a list for all available keys from an alternate source
         
         Args:
@@ -32,7 +40,7 @@ class ExtractorBase:
         """
         raise NotImplementedError()
 
-    def get(self, key: Any) -> List[Override]:
+    def get(self, key: Any) -> Iterable[Override]:
         """Get overrides for a specified (available) key from the default source
         
         Args:
@@ -40,7 +48,7 @@ class ExtractorBase:
         """
         raise NotImplementedError()
     
-    def get_from_source(self, key: Any, source: Any) -> List[Override]:
+    def get_from_source(self, key: Any, source: Any) -> Iterable[Override]:
         """Get overrides for a specified (available) key from an alternate source
         
         Args:
@@ -49,18 +57,24 @@ class ExtractorBase:
         """
         raise NotImplementedError()
     
-    def all_available(self) -> List[Override]:
-        """Get all available overrides for the default source"""
-        return list(itertools.chain.from_iterable([
-           self.get(key=key) for key in self.available_keys()
-        ]))
+    def all_available(self, key_filter: ExtractorKeyFilterFunction or None = None) -> Iterator[Override]:
+        """Get all available overrides for the default source
+        
+        Args:
+            key_filter (ExtractorKeyFilterFunction or None): only get overrides for keys passing this filter, optional
+        """
+        return itertools.chain.from_iterable(
+           self.get(key=key) for key in self.available_keys() if key_filter == None or key_filter(key=key)
+        )
     
-    def all_available_from_source(self, source: Any) -> List[Override]:
+    def all_available_from_source(self, source: Any, key_filter: ExtractorKeyFilterFunction or None = None) -> Iterator[Override]:
         """Get all available overrides for an alternate source
         
         Args:
             source (Any): the alternate source
+            key_filter (ExtractorKeyFilterFunction or None): only get overrides for keys passing this filter, optional
         """
-        return list(itertools.chain.from_iterable([
-            self.get_from_source(key=key, source=source) for key in self.available_keys_for_source(source=None)
-        ]))
\ No newline at end of file
+        return itertools.chain.from_iterable(
+            self.get_from_source(key=key, source=source) 
+            for key in self.available_keys_for_source(source=source) if key_filter == None or key_filter(key=key)
+        )
@@ -1,8 +1,9 @@
 
-from typing import Any, Callable, List, Protocol
+import itertools
+from typing import Any, Callable, Iterable, Iterator, List, Protocol
 from structured_config.io.overrides.assignment import Override
 from structured_config.io.overrides.invalid_override_key_type_exception import InvalidOverrideKeyTypeException
-from structured_config.io.overrides.extractor_base import ExtractorBase
+from structured_config.io.overrides.extractor_base import ExtractorBase, ExtractorKeyFilterFunction
 
 class StringKeyMappingFunction(Protocol):
     
@@ -14,7 +15,7 @@ class SourceConverterFunction(Protocol):
 
 class KeyListFunction(Protocol):
 
-    def __call__(self, source: Any or None) -> List[str]: ...
+    def __call__(self, source: Any or None) -> Iterable[str]: ...
 
 class FunctionalExtractor(ExtractorBase):
     """Simplified extractor base class
@@ -51,7 +52,8 @@ class FunctionalExtractor(ExtractorBase):
     
     def get_from_source(self, key: Any, source: Any) -> List[Override]:
         self._check_key_type(key=key)
-        return self._mapping(str(key), source, *self._payload)
+        # the alternate source replaces the default source
+        return self._mapping(str(key), source, *self._payload[1:])
     
     def available_keys(self) -> List[Any]:
         if callable(self._keys):
@@ -77,24 +79,52 @@ class SourceConvertingFunctionalExtractor(FunctionalExtractor):
     However, your sources may be objects that need to be converted to dictionaries first.
     You can do this by specifying the appropriate conversion function here, and then using
     the extractor as if the internal source type matches any object type you throw at it.
+    The default source is converted when it is first accessed through "get()" or "available_keys()".
     """
     def __init__(self, 
                  keys: List[str] or KeyListFunction, 
                  source_converter: SourceConverterFunction, 
                  mapping: StringKeyMappingFunction, source: Any, *payload):
         self._converter = source_converter
-        converted_payload = (source, *payload)
-        if len(converted_payload) > 0:
-            converted_payload = (self._converter(source=converted_payload[0]), *converted_payload[1:])
-        super().__init__(keys, mapping, *converted_payload)
+        # the unconverted default source, derived extractors may stream it instead of converting it
+        self._source: Any = source
+        self._source_converted: bool = False
+        super().__init__(keys, mapping, source, *payload)
+
+    def get(self, key: Any) -> List[Override]:
+        self._convert_default_source()
+        return super().get(key=key)
+
+    def available_keys(self) -> List[Any]:
+        self._convert_default_source()
+        return super().available_keys()
 
     def get_from_source(self, key: Any, source: Any) -> List[Override]:
         self._check_key_type(key=key)
-        return self._mapping(str(key), self._converter(source=source), *self._payload)
+        return self._get_from_converted(key=key, converted=self._converter(source=source))
     
     def available_keys_for_source(self, source: Any) -> List[Any]:
         if callable(self._keys):
             return self._keys(source=self._converter(source=source))
         else:
             return self._keys
+    
+    def all_available_from_source(self, source: Any, key_filter: ExtractorKeyFilterFunction or None = None) -> Iterator[Override]:
+        # convert the alternate source only once, instead of once per key
+        converted: Any = self._converter(source=source)
+        keys: Iterable[Any] = self._keys(source=converted) if callable(self._keys) else self._keys
+        return itertools.chain.from_iterable(
+            self._get_from_converted(key=key, converted=converted) 
+            for key in keys if key_filter == None or key_filter(key=key)
+        )
+    
+    def _convert_default_source(self):
+        if not self._source_converted:
+            self._payload = (self._converter(source=self._source), *self._payload[1:])
+            self._source_converted = True
+
+    def _get_from_converted(self, key: Any, converted: Any) -> List[Override]:
+        self._check_key_type(key=key)
+        # the alternate source replaces the default source
+        return self._mapping(str(key), converted, *self._payload[1:])
             
@@ -1,5 +1,5 @@
 
-from typing import List
+from typing import Dict, Iterable, List, Tuple
 from structured_config.io.case_translation.case_translator_base import CaseTranslatorBase
 from structured_config.io.case_translation.no_translation import NoTranslation
 from structured_config.io.overrides.assignment import Assignment, Override, OverrideKeyPart
@@ -18,38 +18,66 @@ class Mapper:
     def __init__(self, source_case: CaseTranslatorBase = NoTranslation()):
 
         self._overrides: List[Override] = []
+        self._sort_keys: List[Tuple[Tuple[int, int, str], ...]] = []
+        self._sorted: bool = True
         self._source_case = source_case
+        self._translated_parts: Dict[str, str] = {}
 
     def with_source_case(self, source_case: CaseTranslatorBase):
         """Change the source case after construction"""
 
         # change the source case
         self._source_case = source_case
+        self._translated_parts = {}
         # and re-key all overrides
         self._overrides = [
-            Override(key=".".join(
-                [self._source_case.translate(key=part) for part in override.key.split(".")]
-            ), value=override.value) for override in self._overrides
+            Override(key=self._translate_key(key=override.key), value=override.value) for override in self._overrides
         ]
+        self._sort_keys = [self._sort_key(override=override) for override in self._overrides]
+        self._sorted = False
         return self
 
     def direct(self, key: str, value: str or int or float or bool) -> 'Mapper':
         """Add a direct key-value override"""
-        self._overrides.append(Override(key=".".join(
-            [self._source_case.translate(key=part) for part in key.split(".")]
-        ), value=value))
+        return self.direct_many(overrides=[(key, value)])
+    
+    def direct_many(self, overrides: Iterable[Tuple[str, str or int or float or bool]]) -> 'Mapper':
+        """Add any number of direct key-value overrides
+        
+        The overrides are consumed lazily, so this may be used to stream large override sets (e.g. 
+        from an OverrideFileReader) into the mapper. Key parts are case-translated once and cached.
+        If the stream raises, the overrides consumed before the error are kept.
+        """
+        # the stream may raise after some overrides were added, which must not be skipped by sorting
+        self._sorted = False
+        for key, value in overrides:
+            override: Override = Override(key=self._translate_key(key=key), value=value)
+            self._overrides.append(override)
+            self._sort_keys.append(self._sort_key(override=override))
         return self
 
-    def apply(self, to: ConfigObjectType) -> ConfigObjectType:
-        """Apply all stored overrides"""
+    def apply(self, to: ConfigObjectType, in_place: bool = True) -> ConfigObjectType:
+        """Apply all stored overrides
+        
+        If "in_place" is "False", the provided data is not modified: only the objects and lists on the 
+        overridden paths are copied, everything else is shared with the provided data. Use this to apply
+        different override sets to the same base config data.
+        """
 
         # sort the overrides and apply it to provided data
         self._sort()
-        return Assignment(overrides=self._overrides, data=to).apply()
+        return Assignment(overrides=self._overrides, data=to, in_place=in_place).apply()
+    
+    def overrides(self) -> List[Override]:
+        """Get all stored overrides in application order"""
+        self._sort()
+        return list(self._overrides)
     
     def clear(self) -> 'Mapper':
         """Clear all stored overrides"""
-        self.overrides = []
+        self._overrides = []
+        self._sort_keys = []
+        self._sorted = True
         return self
     
     def build(self) -> MapperBuilder:
@@ -63,28 +91,47 @@ class Mapper:
         """
         return MapperBuilder(mapper=self)
 
+    def _translate_key(self, key: str) -> str:
+        # no need to split the key if it wouldn't be translated anyway
+        if type(self._source_case) is NoTranslation:
+            return key
+        
+        parts: List[str] = key.split(".")
+        for index, part in enumerate(parts):
+            translated: str or None = self._translated_parts.get(part, None)
+            if translated == None:
+                translated = self._source_case.translate(key=part)
+                self._translated_parts[part] = translated
+            parts[index] = translated
+        return ".".join(parts)
+
     def _sort(self):
-        self._overrides = sorted(self._overrides, key=self._lex_sort_key)
+        # the sorted order stays valid until the override set changes
+        if self._sorted:
+            return
+        order: List[int] = sorted(range(len(self._overrides)), key=self._sort_keys.__getitem__)
+        self._overrides = [self._overrides[index] for index in order]
+        self._sort_keys = [self._sort_keys[index] for index in order]
+        self._sorted = True
 
-    def _lex_sort_key(self, override: Override) -> str:
+    def _sort_key(self, override: Override) -> Tuple[Tuple[int, int, str], ...]:
         # We want to sort the overrides lexicographically to ensure consistent
         # application order (since that does make a difference). However, we need 
         # to make sure that any list ADD operations are executed before any list SET
         # operations, to avoid trying to access indices that don't exist yet.
-        # To achieve this, we transform the sort key slightly: We replace any "+"
-        # "-1", and replace any SET section with the index we try to access.
-        parts: List[OverrideKeyPart] = override.split_key()
-        full_key: str = ".".join([str(p) for p in parts])
-        return ".".join([self._transform_sort_key_part(key=part, full_key=full_key) for part in parts])
+        # To achieve this, every key part is transformed into a tuple: ADD directives
+        # rank first, then SET directives ordered by their numeric index, then plain 
+        # keys ordered by name. The key is computed once when the override is added.
+        return tuple(self._transform_sort_key_part(key=part, full_key=override.key) for part in override.path)
 
-    def _transform_sort_key_part(self, key: OverrideKeyPart, full_key: str) -> str:
+    def _transform_sort_key_part(self, key: OverrideKeyPart, full_key: str) -> Tuple[int, int, str]:
 
         if key.array and key.part == "array.add":
-            return "0:arrayadd"
+            return (0, 0, "")
         elif key.array and key.part.startswith("array.set:"):
             try:
-                return key.part.split(":")[1] + ":arrayset"
+                return (1, int(key.part.split(":")[1]), "")
             except:
                 raise InvalidOverrideSpecificationException(reason=f"Unrecognized array directive '{key.part}' in '{full_key}'")
         else:
-            return key.part
\ No newline at end of file
+            return (2, 0, key.part)
@@ -1,59 +1,70 @@
 
 import argparse
 import itertools
-from typing import TYPE_CHECKING, Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List
 from structured_config.io.overrides.argparse_extractor import ArgparseOverrideKeyMappingFunction, ArgparseOverrides, DictionaryKeyFilterFunction
 from structured_config.io.overrides.assignment import Override
 
-from structured_config.io.overrides.extractor_base import ExtractorBase
+from structured_config.io.overrides.extractor_base import ExtractorBase, ExtractorKeyFilterFunction
 if TYPE_CHECKING:
     from structured_config.io.overrides.mapper import Mapper
 
 class MapperExtractorBuilder:
-    """Configure one extractor for override mapping"""
+    """Configure one extractor for override mapping
+    
+    Overrides are not extracted until the mapper builder is applied, and they are then streamed 
+    directly into the mapper. Optional key filters drop extractor keys before any overrides are
+    created for them.
+    """
 
     def __init__(self, mapper_builder: 'MapperBuilder', extractor: ExtractorBase):
         self._builder: MapperBuilder = mapper_builder
         self._extractor: ExtractorBase = extractor
-        self._overrides: List[Override] = []
+        self._overrides: List[Iterable[Override]] = []
 
     def only_one(self, key: str, alternate_source: Any or None = None) -> 'MapperExtractorBuilder':
         """Add only one override to the mapper, optionally from a non-default source"""
 
         if alternate_source == None:
-            self._overrides.extend(self._extractor.get(key=key))
+            self._overrides.append(self._extractor.get(key=key))
         else:
-            self._overrides.extend(self._extractor.get_from_source(key=key, source=alternate_source))
+            self._overrides.append(self._extractor.get_from_source(key=key, source=alternate_source))
             
         return self
             
-    def only(self, keys: List[str], alternate_source: Any or None = None) -> 'MapperExtractorBuilder':
+    def only(self, 
+             keys: Iterable[str], 
+             alternate_source: Any or None = None, 
+             key_filter: ExtractorKeyFilterFunction or None = None) -> 'MapperExtractorBuilder':
         """Add only the specified list of overrides to the mapper, optionally from a non-default source"""
 
+        filtered: Iterable[str] = (key for key in keys if key_filter == None or key_filter(key=key))
         if alternate_source == None:
-            self._overrides.extend(list(itertools.chain.from_iterable([self._extractor.get(key=key) for key in keys])))
+            self._overrides.append(itertools.chain.from_iterable(self._extractor.get(key=key) for key in filtered))
         else:
-            self._overrides.extend(list(itertools.chain.from_iterable([self._extractor.get_from_source(
+            self._overrides.append(itertools.chain.from_iterable(self._extractor.get_from_source(
                 key=key, 
                 source=alternate_source,
-            ) for key in keys])))
+            ) for key in filtered))
             
         return self
 
-    def all(self, alternate_source: Any or None = None) -> 'MapperExtractorBuilder':
+    def all(self, 
+            alternate_source: Any or None = None, 
+            key_filter: ExtractorKeyFilterFunction or None = None) -> 'MapperExtractorBuilder':
         """Add all available overrides to the mapper, optionally from a non-default source"""
 
         if alternate_source == None:
-            self._overrides.extend(self._extractor.all_available())
+            self._overrides.append(self._extractor.all_available(key_filter=key_filter))
         else:
-            self._overrides.extend(self._extractor.all_available_from_source(source=alternate_source))
+            self._overrides.append(self._extractor.all_available_from_source(source=alternate_source, key_filter=key_filter))
 
         return self
 
     def apply(self) -> 'MapperBuilder':
         """Apply the configuration and return the builder"""
 
-        self._builder.overrides.extend(self._overrides)
+        self._builder.add_overrides(overrides=itertools.chain.from_iterable(self._overrides))
         return self._builder
 
 
@@ -62,7 +73,19 @@ class MapperBuilder:
 
     def __init__(self, mapper: 'Mapper'):
         self._mapper: 'Mapper' = mapper
-        self.overrides: List[Override] = []
+        self._overrides: List[Iterable[Override]] = []
+
+    @property
+    def overrides(self) -> List[Override]:
+        """All configured overrides (this extracts all overrides that weren't extracted yet)"""
+        extracted: List[Override] = list(itertools.chain.from_iterable(self._overrides))
+        self._overrides = [extracted]
+        return extracted
+
+    def add_overrides(self, overrides: Iterable[Override]) -> 'MapperBuilder':
+        """Add overrides, these are only consumed when the builder is applied"""
+        self._overrides.append(overrides)
+        return self
 
     def extract(self, extractor: ExtractorBase) -> MapperExtractorBuilder:
         """Configure an arbitrary extractor"""
@@ -116,6 +139,6 @@ class MapperBuilder:
     
     def apply(self) -> 'Mapper':
         """Apply all configured overrides and return to the mapper"""
-        for override in self.overrides:
-            self._mapper.direct(override.key, override.value)
-        return self._mapper
+        return self._mapper.direct_many(overrides=(
+            (override.key, override.value) for override in itertools.chain.from_iterable(self._overrides)
+        ))
@@ -0,0 +1,61 @@
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterator, Tuple
+from structured_config.io.overrides.invalid_override_source_exception import InvalidOverrideSourceException
+from structured_config.io.reader.config_file_not_found_exception import ConfigFileNotFoundException
+
+class OverrideFileReader:
+    """Stream overrides from a file
+
+    Override files contain one or more overrides per line. Two line formats are supported, and they
+    may be mixed within one file:
+
+        key=value lines, where everything before the first "=" is the override key, and everything
+        after it is the (string) override value:
+
+            addresses.[0].street=Musterstr
+
+        JSON Lines, where each line is a JSON object mapping override keys to scalar values:
+
+            {"addresses.+.street": "Musterstr", "addresses.[0].number": 10}
+
+    Empty lines and lines starting with "#" are ignored. The file is read lazily, so the result
+    of "read()" can be passed directly to "Mapper.direct_many()" without keeping the entire override
+    set in memory twice.
+
+    Args:
+        file (str): override file location
+    """
+
+    def __init__(self, file: str):
+        self.file: Path = Path(file).resolve()
+        if not self.file.exists():
+            raise ConfigFileNotFoundException(file=self.file)
+
+    def read(self) -> Iterator[Tuple[str, Any]]:
+        with open(file=self.file, mode="r") as override_file:
+            for number, line in enumerate(override_file, start=1):
+                line = line.strip()
+                if len(line) == 0 or line.startswith("#"):
+                    continue
+                elif line.startswith("{"):
+                    yield from self._json_line(line=line, number=number)
+                else:
+                    yield self._key_value_line(line=line, number=number)
+
+    def _json_line(self, line: str, number: int) -> Iterator[Tuple[str, Any]]:
+        try:
+            overrides: Dict[str, Any] = json.loads(line)
+        except json.JSONDecodeError as error:
+            raise InvalidOverrideSourceException(reason=f"Invalid JSON in override file '{self.file}', line {number}: {error}")
+        if type(overrides) is not dict:
+            raise InvalidOverrideSourceException(reason=f"JSON line {number} in override file '{self.file}' must be an object")
+        yield from overrides.items()
+
+    def _key_value_line(self, line: str, number: int) -> Tuple[str, str]:
+        key, separator, value = line.partition("=")
+        if not separator or len(key.strip()) == 0:
+            raise InvalidOverrideSourceException(reason=f"Line {number} in override file '{self.file}' must have the "
+                                                        f"format '<key>=<value>'")
+        return (key.strip(), value.strip())
@@ -1,30 +1,68 @@
 
-from structured_config.io.schema.schema_writer_base import SchemaWriterBase
+import io
+from structured_config.io.schema.schema_writer_base import SchemaWriterBase, DefinitionBase, ObjectDefinition, ListDefinition, ValueDefinition
+from structured_config.spec.config_value_base import ConfigValueBase
 from dataclasses import dataclass
+from typing import Iterator, List, TextIO, Tuple
 
 @dataclass
 class IndentationConfig:
     level: int = 0
     token: str = "  "
 
-    def next(self) -> 'IndentationConfig':
-        return IndentationConfig(
-            level=self.level + 1, 
-            token=self.token,
-        )
-
 class IndentedSchemaWriter(SchemaWriterBase):
+    """Schema writer that streams an indented text schema to a file object
+
+    The definition tree is walked iteratively with an explicit stack of part generators, so the nesting
+    depth of a specification is not limited by the recursion limit, and the schema is never built as one
+    string in memory. Derived writers implement "write_parts()", which writes the text of one definition
+    and yields each child definition (with its indentation level) at the position where the child's text 
+    belongs. "define()" and the "define_*()" methods are still available, and write to a string buffer.
+    """
 
     def __init__(self, indentation: IndentationConfig):
         self.indentation = indentation
+        # indentation strings, by level
+        self._indents: List[str] = [""]
+
+    def indent_level(self, level: int) -> str:
+        while len(self._indents) <= level:
+            self._indents.append(self._indents[-1] + self.indentation.token)
+        return self._indents[level]
+
+    def define(self, config: ConfigValueBase) -> str:
+        buffer: io.StringIO = io.StringIO()
+        self.write(config=config, file=buffer)
+        return buffer.getvalue()
 
-    def construct_next(self, next_indentation: IndentationConfig) -> 'IndentedSchemaWriter':
+    def write(self, config: ConfigValueBase, file: TextIO):
+        self.write_definition(definition=config.specify(), file=file)
+
+    def write_definition(self, definition: DefinitionBase, file: TextIO):
+        """Write a definition tree to a text file object, starting at the current indentation level"""
+        stack: List[Iterator[Tuple[DefinitionBase, int]]] = [
+            self.write_parts(definition=definition, level=self.indentation.level, file=file)
+        ]
+        while len(stack) > 0:
+            child: Tuple[DefinitionBase, int] or None = next(stack[-1], None)
+            if child == None:
+                stack.pop()
+            else:
+                stack.append(self.write_parts(definition=child[0], level=child[1], file=file))
+
+    def write_parts(self, definition: DefinitionBase, level: int, file: TextIO) -> Iterator[Tuple[DefinitionBase, int]]:
         raise NotImplementedError()
 
-    def next(self):
-        return self.construct_next(next_indentation=self.indentation.next())
-    
-    def indent(self, offset: int = 0):
-        return self.indentation.token * (self.indentation.level + offset)
+    def define_object(self, obj: ObjectDefinition) -> str:
+        return self._define_one(definition=obj)
+
+    def define_list(self, list: ListDefinition) -> str:
+        return self._define_one(definition=list)
+
+    def define_value(self, value: ValueDefinition) -> str:
+        return self._define_one(definition=value)
 
-    
+    def _define_one(self, definition: DefinitionBase) -> str:
+        buffer: io.StringIO = io.StringIO()
+        self.write_definition(definition=definition, file=buffer)
+        return buffer.getvalue()
@@ -2,10 +2,9 @@
 from structured_config.io.case_translation.case_translator_base import CaseTranslatorBase
 from structured_config.io.case_translation.snake_case import SnakeCase
 from structured_config.io.schema.indented_schema_writer import IndentedSchemaWriter, IndentationConfig
-from structured_config.io.schema.schema_writer_base import ObjectDefinition, ListDefinition, ValueDefinition
-from structured_config.spec.config_value_base import ConfigValueBase
+from structured_config.io.schema.schema_writer_base import DefinitionBase, ObjectDefinition, ListDefinition, ValueDefinition, SpecType
 
-from typing import List
+from typing import Iterator, TextIO, Tuple
 
 class JsonLikeWriter(IndentedSchemaWriter):
 
@@ -16,47 +15,45 @@ class JsonLikeWriter(IndentedSchemaWriter):
         self._schema_case = schema_case
         self._with_schema_case = with_schema_case
 
-    def define(self, config: ConfigValueBase) -> str:
+    def write_definition(self, definition: DefinitionBase, file: TextIO):
+        # the schema case is applied to a copy of the definition, the specification is not changed
         if self._with_schema_case:
-            current_case = config.get_source_case()
-            result: str = super().define(config.expect_source_case(source=self._schema_case))
-            config.expect_source_case(source=current_case)
-            return result
-        else:
-            return super().define(config)
-
-    def construct_next(self, next_indentation: IndentationConfig) -> 'IndentedSchemaWriter':
-        return JsonLikeWriter(indentation=next_indentation, 
-                              with_schema_case=self._with_schema_case,
-                              schema_case=self._schema_case)
+            definition = definition.with_key_case(key_case=self._schema_case)
+        super().write_definition(definition=definition, file=file)
 
-    def define_list(self, list: ListDefinition) -> str:
+    def write_parts(self, definition: DefinitionBase, level: int, file: TextIO) -> Iterator[Tuple[DefinitionBase, int]]:
+        if definition.spec_type == SpecType.Value:
+            file.write(self._value(value=definition))
+        elif definition.spec_type == SpecType.List:
+            yield from self._list_parts(list=definition, level=level, file=file)
+        elif definition.spec_type == SpecType.Object:
+            yield from self._object_parts(obj=definition, level=level, file=file)
+        else:
+            file.write("{}")
 
-        # start specification string construction 
-        specification: str = f"[{list.limits_summary}\n{self.indent(offset=1)}"
-        
-        # add child specification
-        specification = (f"{specification}{list.children.define(self.next())}")
+    def _list_parts(self, list: ListDefinition, level: int, file: TextIO) -> Iterator[Tuple[DefinitionBase, int]]:
+        # the list limits, and the child specification on the next line
+        file.write(f"[{list.limits_summary}\n{self.indent_level(level=level + 1)}")
+        yield (list.children, level + 1)
 
         # finish list specification
-        return f"{specification}\n{self.indent()}]"
+        file.write(f"\n{self.indent_level(level=level)}]")
     
-    def define_object(self, obj: ObjectDefinition) -> str:        
-        # start specification string construction 
-        specification: str = f"{{\n"
+    def _object_parts(self, obj: ObjectDefinition, level: int, file: TextIO) -> Iterator[Tuple[DefinitionBase, int]]:
+        file.write("{\n")
 
-        # get the specification from each child
-        speclist: List[str] = [
-            f"{self.indent(offset=1)}\"{self._translate_key(key=key, obj=obj)}\": {child.define(self.next())}"
-            for key, child in obj.children.items()
-        ]
-        specification += ',\n'.join(speclist) + "\n"
+        # write the specification of each child, separated by commas
+        child_indent: str = self.indent_level(level=level + 1)
+        separator: str = ""
+        for key, child in obj.children.items():
+            file.write(f"{separator}{child_indent}\"{self._translate_key(key=key, obj=obj)}\": ")
+            yield (child, level + 1)
+            separator = ",\n"
             
         # close the object specification
-        return f"{specification}{self.indent()}}}"
-
+        file.write(f"\n{self.indent_level(level=level)}}}")
     
-    def define_value(self, value: ValueDefinition) -> str:
+    def _value(self, value: ValueDefinition) -> str:
 
         # get requirement string
         requirement: str = "required"
@@ -72,4 +69,4 @@ class JsonLikeWriter(IndentedSchemaWriter):
         return f"\"'{type}' value, {requirement}\""
     
     def _translate_key(self, key: str, obj: ObjectDefinition):
-        return self._schema_case.translate(key=key) if self._with_schema_case else obj.key_case.translate(key=key)
\ No newline at end of file
+        return obj.key_case.translate(key=key)
\ No newline at end of file
@@ -0,0 +1,258 @@
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Set, TextIO, Tuple, Type
+
+from structured_config.io.schema.schema_writer_base import SchemaWriterBase, DefinitionBase, ObjectDefinition, ListDefinition, ValueDefinition, SpecType
+from structured_config.spec.config_value_base import ConfigValueBase
+
+# JSON Schema dialect of the written schemas
+JSON_SCHEMA_DIALECT: str = "https://json-schema.org/draft/2020-12/schema"
+
+
+@dataclass
+class _SchemaNode:
+    # schema keywords of the node, without its children
+    keywords: Dict[str, Any]
+    # property name and digest of each object property
+    properties: List[Tuple[str, str]] = field(default_factory=lambda: [])
+    # digest of the list element schema
+    items: str or None = None
+    # name of the "$defs" entry, if the node is hoisted
+    name: str = ""
+
+
+class JsonSchemaWriter(SchemaWriterBase):
+    """Write a specification as a JSON Schema document
+
+    Objects are written as "object" schemas with their properties. Required scalars and lists, and
+    objects without a default that contain any required value, are listed as required properties.
+    Lists are written as "array" schemas with the list count limits, and scalars with the JSON types
+    of their config types (if they are known) and their default value (if it can be represented as
+    JSON).
+
+    With "deduplicate" set, object schemas that occur at least "min_references" times are written once
+    under "$defs", and referenced from every place where they occur. Schemas are identified by a hash of
+    their content, so structurally identical objects are shared even if they were specified separately.
+
+    Args:
+        indent (int or None): JSON indentation, or "None" for a compact schema
+        deduplicate (bool): hoist repeated object schemas into "$defs"
+        min_references (int): minimum number of occurrences of a hoisted object schema
+        dialect (str): value of the "$schema" keyword
+    """
+
+    _json_types: Dict[Type, str] = {
+        str: "string",
+        int: "integer",
+        float: "number",
+        bool: "boolean",
+        list: "array",
+        dict: "object",
+        type(None): "null",
+    }
+
+    def __init__(self,
+                 indent: int or None = 2,
+                 deduplicate: bool = True,
+                 min_references: int = 2,
+                 dialect: str = JSON_SCHEMA_DIALECT):
+        self._indent: int or None = indent
+        self._deduplicate: bool = deduplicate
+        self._min_references: int = min_references
+        self._dialect: str = dialect
+
+    def define(self, config: ConfigValueBase) -> str:
+        return json.dumps(self.schema(definition=config.specify()), indent=self._indent)
+
+    def write(self, config: ConfigValueBase, file: TextIO):
+        json.dump(self.schema(definition=config.specify()), file, indent=self._indent)
+
+    def define_object(self, obj: ObjectDefinition) -> str:
+        return json.dumps(self.schema(definition=obj), indent=self._indent)
+
+    def define_list(self, list: ListDefinition) -> str:
+        return json.dumps(self.schema(definition=list), indent=self._indent)
+
+    def define_value(self, value: ValueDefinition) -> str:
+        return json.dumps(self.schema(definition=value), indent=self._indent)
+
+    def schema(self, definition: DefinitionBase) -> Dict[str, Any]:
+        """Get the JSON Schema document of a definition tree"""
+        nodes, root = self._collect(definition=definition)
+        hoisted: Dict[str, _SchemaNode] = self._hoist(nodes=nodes, root=root)
+
+        # children precede their parents, so every child is rendered before it is referenced
+        rendered: Dict[str, Dict[str, Any]] = {}
+        for digest, node in nodes.items():
+            rendered[digest] = self._render(node=node, rendered=rendered, hoisted=hoisted)
+
+        document: Dict[str, Any] = {"$schema": self._dialect, **rendered[root]}
+        if len(hoisted) > 0:
+            document["$defs"] = {node.name: rendered[digest] for digest, node in nodes.items() if digest in hoisted}
+        return document
+
+    def _collect(self, definition: DefinitionBase) -> Tuple[Dict[str, _SchemaNode], str]:
+        # walk the tree in post-order, and identify every node by the digest of its schema and child digests
+        nodes: Dict[str, _SchemaNode] = {}
+        digests: Dict[int, str] = {}
+        # whether each visited object is required
+        required: Dict[int, bool] = {}
+        stack: List[Tuple[DefinitionBase, str, bool]] = [(definition, "root", False)]
+        while len(stack) > 0:
+            current, name, expanded = stack.pop()
+            children: List[Tuple[str, DefinitionBase]] = self._children(definition=current, name=name)
+            if not expanded and len(children) > 0:
+                stack.append((current, name, True))
+                stack.extend((child, child_name, False) for child_name, child in reversed(children))
+                continue
+
+            if current.spec_type == SpecType.Object:
+                required[id(current)] = not current.has_default and \
+                    any(self._is_required(definition=child, required=required) for _, child in children)
+
+            node: _SchemaNode = self._node(definition=current, name=name, required=required)
+            if current.spec_type == SpecType.Object:
+                node.properties = [(key, digests[id(child)]) for key, child in children]
+            elif current.spec_type == SpecType.List:
+                node.items = digests[id(children[0][1])]
+
+            digest: str = self._digest(node=node)
+            digests[id(current)] = digest
+            nodes.setdefault(digest, node)
+        return nodes, digests[id(definition)]
+
+    def _hoist(self, nodes: Dict[str, _SchemaNode], root: str) -> Dict[str, _SchemaNode]:
+        # count how often each schema would occur in the document, parents before children
+        occurrences: Dict[str, int] = dict.fromkeys(nodes.keys(), 0)
+        occurrences[root] = 1
+        hoisted: Dict[str, _SchemaNode] = {}
+        names: Set[str] = set()
+        for digest in reversed(nodes.keys()):
+            node: _SchemaNode = nodes[digest]
+            if self._deduplicate and digest != root and \
+                    node.keywords.get("type", None) == "object" and occurrences[digest] >= self._min_references:
+                node.name = self._unique_name(name=node.name, names=names)
+                hoisted[digest] = node
+
+            # a hoisted schema is written once, all other schemas are written at each occurrence
+            count: int = 1 if digest in hoisted else occurrences[digest]
+            for child in self._child_digests(node=node):
+                occurrences[child] += count
+        return hoisted
+
+    def _render(self, node: _SchemaNode, rendered: Dict[str, Dict[str, Any]], hoisted: Dict[str, _SchemaNode]) -> Dict[str, Any]:
+        def reference(digest: str) -> Dict[str, Any]:
+            return {"$ref": f"#/$defs/{hoisted[digest].name}"} if digest in hoisted else rendered[digest]
+
+        schema: Dict[str, Any] = dict(node.keywords)
+        if schema.get("type", None) == "object":
+            schema["properties"] = {key: reference(digest) for key, digest in node.properties}
+            # keep "required" after the properties
+            if "required" in schema:
+                schema["required"] = schema.pop("required")
+        elif node.items != None:
+            schema["items"] = reference(node.items)
+        return schema
+
+    def _node(self, definition: DefinitionBase, name: str, required: Dict[int, bool]) -> _SchemaNode:
+        if definition.spec_type == SpecType.Value:
+            return _SchemaNode(keywords=self._value_keywords(value=definition), name=name)
+        elif definition.spec_type == SpecType.List:
+            return _SchemaNode(keywords=self._list_keywords(list=definition), name=name)
+        elif definition.spec_type == SpecType.Object:
+            return _SchemaNode(keywords=self._object_keywords(obj=definition, required=required), name=name)
+        else:
+            return _SchemaNode(keywords={}, name=name)
+
+    def _object_keywords(self, obj: ObjectDefinition, required: Dict[int, bool]) -> Dict[str, Any]:
+        keywords: Dict[str, Any] = {"type": "object"}
+        required_keys: List[str] = [
+            obj.key_case.translate(key=key) for key, child in obj.children.items()
+            if self._is_required(definition=child, required=required)
+        ]
+        if len(required_keys) > 0:
+            keywords["required"] = required_keys
+        return keywords
+
+    def _is_required(self, definition: DefinitionBase, required: Dict[int, bool]) -> bool:
+        # objects are required if they have a required descendant, and were visited before their parent
+        if definition.spec_type == SpecType.Object:
+            return required[id(definition)]
+        return getattr(definition, "required", False)
+
+    def _list_keywords(self, list: ListDefinition) -> Dict[str, Any]:
+        keywords: Dict[str, Any] = {"type": "array"}
+        if list.strict != None:
+            keywords["minItems"] = list.strict
+            keywords["maxItems"] = list.strict
+        else:
+            if list.min != None:
+                keywords["minItems"] = list.min + 1 if list.min_exclusive else list.min
+            if list.max != None:
+                keywords["maxItems"] = list.max - 1 if list.max_exclusive else list.max
+        if not list.required and list.default != None and self._is_json(value=list.default):
+            keywords["default"] = list.default
+        return keywords
+
+    def _value_keywords(self, value: ValueDefinition) -> Dict[str, Any]:
+        keywords: Dict[str, Any] = {}
+        json_types: List[str] = self._json_type_names(value=value)
+        if len(json_types) == 1:
+            keywords["type"] = json_types[0]
+        elif len(json_types) > 1:
+            keywords["type"] = json_types
+        if not value.required and value.default != None and self._is_json(value=value.default):
+            keywords["default"] = value.default
+        return keywords
+
+    def _json_type_names(self, value: ValueDefinition) -> List[str]:
+        # only config type checks with known types restrict the JSON type
+        specific_types = getattr(value.type, "specific_types", None)
+        types: List[Type] or None = specific_types() if callable(specific_types) else None
+        if not types or not all(type in JsonSchemaWriter._json_types for type in types):
+            return []
+        return list(dict.fromkeys(JsonSchemaWriter._json_types[type] for type in types))
+
+    def _children(self, definition: DefinitionBase, name: str) -> List[Tuple[str, DefinitionBase]]:
+        # list elements are named after their list
+        if definition.spec_type == SpecType.Object:
+            return [(definition.key_case.translate(key=key), child) for key, child in definition.children.items()]
+        elif definition.spec_type == SpecType.List:
+            return [(name, definition.children)]
+        return []
+
+    def _child_digests(self, node: _SchemaNode) -> List[str]:
+        if node.items != None:
+            return [node.items]
+        return [digest for _, digest in node.properties]
+
+    def _digest(self, node: _SchemaNode) -> str:
+        # property order doesn't change the structure of an object
+        keywords: Dict[str, Any] = dict(node.keywords)
+        if "required" in keywords:
+            keywords["required"] = sorted(keywords["required"])
+        content: str = json.dumps(
+            [keywords, sorted(node.properties), node.items],
+            sort_keys=True,
+            default=repr,
+        )
+        return hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _unique_name(self, name: str, names: Set[str]) -> str:
+        unique: str = name
+        count: int = 1
+        while unique in names:
+            count += 1
+            unique = f"{name}{count}"
+        names.add(unique)
+        return unique
+
+    def _is_json(self, value: Any) -> bool:
+        # NaN and infinity aren't valid JSON
+        try:
+            json.dumps(value, allow_nan=False)
+            return True
+        except (TypeError, ValueError):
+            return False
\ No newline at end of file
@@ -1,8 +1,8 @@
 
 from structured_config.io.case_translation.case_translator_base import CaseTranslatorBase
 from structured_config.spec.config_value_base import ConfigValueBase
-from dataclasses import dataclass, field
-from typing import Type, Dict, List
+from dataclasses import dataclass, field, replace
+from typing import Any, TextIO, Tuple, Type, Dict, List
 from enum import Enum
 
 from structured_config.type_checking.type_config import ConfigTypeCheckingFunction
@@ -12,6 +12,10 @@ class SchemaWriterBase:
     def define(self, config: ConfigValueBase) -> str:
         return config.specify().define(schema_writer=self)
 
+    def write(self, config: ConfigValueBase, file: TextIO):
+        """Write the schema of a specification to a text file object"""
+        file.write(self.define(config=config))
+
     def define_object(self, obj: 'ObjectDefinition') -> str:
         raise NotImplementedError()
     def define_list(self, list: 'ListDefinition') -> str:
@@ -39,6 +43,37 @@ class DefinitionBase:
         else:
             return '{}'
 
+    def with_key_case(self, key_case: CaseTranslatorBase) -> 'DefinitionBase':
+        """Get a copy of this definition tree with a different key case, this tree is not changed"""
+        copies: Dict[int, DefinitionBase] = {}
+        stack: List[Tuple[DefinitionBase, bool]] = [(self, False)]
+        while len(stack) > 0:
+            definition, expanded = stack.pop()
+            if id(definition) in copies:
+                continue
+            children: List[DefinitionBase] = definition.child_definitions()
+            if not expanded and len(children) > 0:
+                stack.append((definition, True))
+                stack.extend((child, False) for child in children)
+                continue
+
+            if definition.spec_type == SpecType.Object:
+                copies[id(definition)] = replace(definition, key_case=key_case, children={
+                    key: copies[id(child)] for key, child in definition.children.items()
+                })
+            elif definition.spec_type == SpecType.List:
+                copies[id(definition)] = replace(definition, key_case=key_case, children=copies[id(definition.children)])
+            else:
+                copies[id(definition)] = replace(definition, key_case=key_case)
+        return copies[id(self)]
+
+    def child_definitions(self) -> List['DefinitionBase']:
+        if self.spec_type == SpecType.Object:
+            return list(self.children.values())
+        elif self.spec_type == SpecType.List:
+            return [self.children]
+        return []
+
 @dataclass
 class ValueDefinition(DefinitionBase):
     type: ConfigTypeCheckingFunction or None
@@ -51,6 +86,8 @@ class ValueDefinition(DefinitionBase):
 @dataclass
 class ObjectDefinition(DefinitionBase):
     children: Dict[str, DefinitionBase]
+    # objects with a default are created from it when they are missing, instead of from their children
+    has_default: bool = False
 
     def __post_init__(self):
         self.spec_type = SpecType.Object
@@ -64,6 +101,8 @@ class ListDefinition(DefinitionBase):
     max_exclusive: bool
     strict: int or None
     limits_summary: str
+    required: bool = True
+    default: Any = None
 
     def __post_init__(self):
         self.spec_type = SpecType.List
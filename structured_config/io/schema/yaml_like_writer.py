@@ -2,10 +2,55 @@
 from structured_config.io.case_translation.case_translator_base import CaseTranslatorBase
 from structured_config.io.case_translation.pascal_case import PascalCase
 from structured_config.io.schema.indented_schema_writer import IndentedSchemaWriter, IndentationConfig
-from structured_config.io.schema.schema_writer_base import ObjectDefinition, ListDefinition, ValueDefinition, SpecType
-from structured_config.spec.config_value_base import ConfigValueBase
-
-from typing import List
+from structured_config.io.schema.schema_writer_base import DefinitionBase, ObjectDefinition, ListDefinition, ValueDefinition, SpecType
+
+from typing import Iterator, List, TextIO, Tuple
+
+
+class _ListItemFile:
+    """Text file wrapper that prefixes every line with the markers of the enclosing list items
+
+    The first line of a list item is prefixed with "- ", all following lines with "  " (both after the
+    indentation of the list). Prefixes of nested list items are written after those of their parents.
+    """
+
+    def __init__(self, file: TextIO):
+        self._file: TextIO = file
+        # indentation and "first line written" flag of each enclosing list item
+        self._items: List[List] = []
+        self._line_start: bool = True
+
+    def write(self, text: str):
+        # outside of list items, and within a line, the text is written as-is
+        if len(self._items) == 0 or (not self._line_start and "\n" not in text):
+            self._file.write(text)
+            if len(text) > 0:
+                self._line_start = text[-1] == "\n"
+            return
+        lines: List[str] = text.split("\n")
+        for index, line in enumerate(lines):
+            if index > 0:
+                self._file.write("\n")
+                self._line_start = True
+            # the prefix of the last line is only written once the line has any text
+            if self._line_start and (len(line) > 0 or index < len(lines) - 1):
+                self._write_prefix()
+            self._file.write(line)
+
+    def begin_item(self, indentation: str):
+        self._items.append([indentation, False])
+
+    def end_item(self):
+        # items without any text, and empty last lines still have their prefix
+        if not self._items[-1][1] or self._line_start:
+            self._write_prefix()
+        self._items.pop()
+
+    def _write_prefix(self):
+        for item in self._items:
+            self._file.write(item[0] + ("  " if item[1] else "- "))
+            item[1] = True
+        self._line_start = False
 
 
 class YamlLikeWriter(IndentedSchemaWriter):
@@ -18,53 +63,42 @@ class YamlLikeWriter(IndentedSchemaWriter):
         self._schema_case = schema_case
         self._with_schema_case = with_schema_case
 
-    def define(self, config: ConfigValueBase) -> str:
+    def write_definition(self, definition: DefinitionBase, file: TextIO):
+        # the schema case is applied to a copy of the definition, the specification is not changed
         if self._with_schema_case:
-            current_case = config.get_source_case()
-            result: str = super().define(config.expect_source_case(source=self._schema_case))
-            config.expect_source_case(source=current_case)
-            return result
+            definition = definition.with_key_case(key_case=self._schema_case)
+        super().write_definition(definition=definition, file=_ListItemFile(file=file))
+
+    def write_parts(self, definition: DefinitionBase, level: int, file: _ListItemFile) -> Iterator[Tuple[DefinitionBase, int]]:
+        if definition.spec_type == SpecType.Value:
+            file.write(self._value(value=definition))
+        elif definition.spec_type == SpecType.List:
+            yield from self._list_parts(list=definition, level=level, file=file)
+        elif definition.spec_type == SpecType.Object:
+            yield from self._object_parts(obj=definition, level=level, file=file)
         else:
-            return super().define(config)
-
-    def construct_next(self, next_indentation: IndentationConfig) -> 'IndentedSchemaWriter':
-        return YamlLikeWriter(indentation=next_indentation, 
-                              with_schema_case=self._with_schema_case,
-                              schema_case=self._schema_case)
-
-    def define_list(self, list: ListDefinition) -> str:
-        # first, process the list with reset indentation
-        no_indent: YamlLikeWriter = YamlLikeWriter(indentation=IndentationConfig(level=0, token=self.indentation.token))
-
-        # then, split the list by "\n"
-        lines: List[str] = list.children.define(no_indent).split("\n")
+            file.write("{}")
 
-        # now add "- " to the first entry, and "  " to all others (if there are any others)
-        lines[0] = "- " + lines[0]        
-        if len(lines) > 1:
-            lines[1:] = ["  " + line for line in lines[1:]]
-
-        # finally, add the next indentation to all lines
-        lines = [self.indent() + line for line in lines]
-
-        # and join the lines again
-        return "\n".join(lines)
+    def _list_parts(self, list: ListDefinition, level: int, file: _ListItemFile) -> Iterator[Tuple[DefinitionBase, int]]:
+        # the list item is written without indentation, every line is prefixed by the item markers instead
+        file.begin_item(indentation=self.indent_level(level=level))
+        yield (list.children, 0)
+        file.end_item()
     
-    def define_object(self, obj: ObjectDefinition) -> str:  
+    def _object_parts(self, obj: ObjectDefinition, level: int, file: _ListItemFile) -> Iterator[Tuple[DefinitionBase, int]]:  
 
-        # get the specification from each child
-        speclist: List[str] = []
+        # write the specification of each child, separated by newlines
+        indentation: str = self.indent_level(level=level)
+        separator: str = ""
         for key, child in obj.children.items():
             trailing: str = ""
             if child.spec_type != SpecType.Value:
                 trailing = "\n"
-            speclist.append(f"{self.indent()}{self._translate_key(key=key, obj=obj)}: {trailing}{child.define(self.next())}")
-
-        # join with newlines
-        return "\n".join(speclist)
-
+            file.write(f"{separator}{indentation}{self._translate_key(key=key, obj=obj)}: {trailing}")
+            yield (child, level + 1)
+            separator = "\n"
     
-    def define_value(self, value: ValueDefinition) -> str:
+    def _value(self, value: ValueDefinition) -> str:
 
         # get requirement string
         requirement: str = "required"
@@ -80,4 +114,4 @@ class YamlLikeWriter(IndentedSchemaWriter):
         return f"\"'{type}' value, {requirement}\""
     
     def _translate_key(self, key: str, obj: ObjectDefinition):
-        return self._schema_case.translate(key=key) if self._with_schema_case else obj.key_case.translate(key=key)
\ No newline at end of file
+        return obj.key_case.translate(key=key)
\ No newline at end of file
@@ -11,6 +11,7 @@ from structured_config.type_checking.type_config import ConfigTypeCheckingFuncti
 from structured_config.validation.pass_all_validator import PassAllValidator
 from structured_config.validation.validator_base import ValidatorBase, ValidatorPhase
 from structured_config.validation.list_validator import ListValidator
+from structured_config.validation.cross_validator_base import CrossValidatorBase
 from structured_config.conversion.no_op_converter import NoOpConverter
 from structured_config.conversion.type_casting_converter import TypeCastingConverter
 from structured_config.conversion.converter_base import ConverterBase
@@ -129,7 +130,9 @@ class Config:
     @staticmethod
     def typed_object(entries: List[EntryBase],
                      cast_to: ConversionTargetType,
-                     requirements: ObjectRequirements or None = None) -> ObjectConfigValue:
+                     requirements: ObjectRequirements or None = None,
+                     cross_validators: List[CrossValidatorBase] or None = None,
+                     default_factory: Callable[[], ConversionTargetType] or None = None) -> ObjectConfigValue:
         """Create a typed object value
         
         During the conversion process, the dictionary created by the entry list will be passed to the type's 
@@ -146,6 +149,10 @@ class Config:
             entries (List[EntryBase]): list of children for this object
             cast_to (ConversionTargetType): config entry type, must be constructible from a dictionary
             requirements (ObjectRequirements): optional requirements object
+            cross_validators (List[CrossValidatorBase]): optional validators of relations between the converted 
+                children, see "CrossValidatorBase"
+            default_factory (Callable[[], ConversionTargetType] or None): optional, creates the object when it is 
+                missing from the config, instead of converting it from the defaults of its children
         """
         
         return ObjectConfigValue(
@@ -154,13 +161,17 @@ class Config:
             ]),
             converter=TypeCastingConverter(to=cast_to),
             converted_type_check=RequireConvertedType.from_type_list(types=[cast_to]),
+            cross_validators=cross_validators,
+            default_factory=default_factory,
         )
 
     @staticmethod
     def object(entries: List[EntryBase],
                converter: ConverterBase = NoOpConverter(),
                type: ScalarConvertedTypeRequirements = None,
-               requirements: ObjectRequirements or None = None) -> ObjectConfigValue:
+               requirements: ObjectRequirements or None = None,
+               cross_validators: List[CrossValidatorBase] or None = None,
+               default_factory: Callable[[], ConversionTargetType] or None = None) -> ObjectConfigValue:
         """Create an object with a custom type converter
         
         If your target type does not support a dictionary constructor, or you want to perform some complex
@@ -172,6 +183,10 @@ class Config:
             converter (ConverterBase): type converter, takes a dictionary as its input
             type (ConversionTargetType): optional target type for required and default values
             requirements (ObjectRequirements): optional requirements object
+            cross_validators (List[CrossValidatorBase]): optional validators of relations between the converted 
+                children, see "CrossValidatorBase"
+            default_factory (Callable[[], ConversionTargetType] or None): optional, creates the object when it is 
+                missing from the config, instead of converting it from the defaults of its children
         """
         
         return ObjectConfigValue(
@@ -182,7 +197,9 @@ class Config:
             converted_type_check=RequireConvertedType.make_type_checking_function(
                 expected_types=type,
                 default=RequireConvertedType.none(),
-            )
+            ),
+            cross_validators=cross_validators,
+            default_factory=default_factory,
         )
     
     @staticmethod
@@ -241,3 +258,21 @@ class Config:
                 default=RequireConvertedType.none(),
             ),
         )
+    
+    @staticmethod
+    def from_dataclass(cls: Type, cached: bool = True) -> ObjectConfigValue:
+        """Derive an object value from the annotations of a dataclass or TypedDict
+
+        Fields with default values are optional, all other fields are required. Nested dataclasses and 
+        TypedDicts become nested objects, and lists of supported types become lists. The specification 
+        is created once per class: by default, all callers share the same specification, so changing 
+        its case affects all of them. Use "cached=False" to create a separate specification. See 
+        "DataclassSpec" for details on how fields are mapped to config values.
+
+        Args:
+            cls (Type): dataclass or TypedDict type
+            cached (bool): reuse the specification created for this class, defaults to "True"
+        """
+        # the derived specification is made of entries, which depend on this module
+        from structured_config.spec.dataclass_spec import DataclassSpec
+        return DataclassSpec.make(cls=cls, cached=cached)
@@ -3,8 +3,13 @@
 from structured_config.base.typedefs import ConfigObjectType, ConversionTargetType
 from structured_config.io.case_translation.case_translator_base import CaseTranslatorBase
 from structured_config.io.case_translation.no_translation import NoTranslation
+from structured_config.spec.conversion_record import ConversionRecord
+from structured_config.spec.spec_index import SpecIndex
+from structured_config.type_checking.config_type_checker import ConfigTypeChecker
+from structured_config.type_checking.type_registry import TypeRegistry
+from structured_config.validation.deferred_validation import DeferredValidation
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, List, Tuple
 if TYPE_CHECKING:
     from structured_config.io.schema.schema_writer_base import DefinitionBase
 
@@ -24,8 +29,32 @@ class ConfigValueBase:
     def translate_case(self, target: CaseTranslatorBase, source: CaseTranslatorBase = NoTranslation()) -> 'ConfigValueBase':
         self._target_case: CaseTranslatorBase = target
         self._source_case: CaseTranslatorBase = source
+        # the path index uses source-case keys, and definitions include the source case
+        self._index: SpecIndex or None = None
+        self._definition: 'DefinitionBase or None' = None
         return self
     
+    def use_type_registry(self, registry: TypeRegistry) -> 'ConfigValueBase':
+        """Bind the config type checks of this value and all its children to a type registry
+        
+        The global "TypeConfig" whitelist is no longer used by this specification afterwards. Custom 
+        type checking functions are kept as they are.
+        """
+        values: List[ConfigValueBase] = [self]
+        while len(values) > 0:
+            value: ConfigValueBase = values.pop()
+            value._type_registry = registry
+            value._definition = None
+            # checkers may be shared between specifications, so the bound checker is a copy
+            type_check = getattr(value, "_config_type_check", None)
+            if isinstance(type_check, ConfigTypeChecker):
+                value._config_type_check = type_check.with_registry(registry=registry)
+            values.extend(child for _, child in value.child_values())
+        return self
+
+    def get_type_registry(self) -> TypeRegistry or None:
+        return getattr(self, "_type_registry", None)
+    
     def translate_to_target(self, key: str) -> str:
         return self.get_target_case().translate(key=key)
 
@@ -41,8 +70,68 @@ class ConfigValueBase:
         """Convert a config object to a converted application object"""
         raise NotImplementedError()
     
+    def convert_deferred(self, input: ConfigObjectType or None, max_workers: int or None = None) -> ConversionTargetType:
+        """Convert a config object, running all I/O-bound validators concurrently after the conversion
+        
+        All failed I/O-bound validations are raised together in a "DeferredValidationException".
+        """
+        with DeferredValidation(max_workers=max_workers) as deferred:
+            output: ConversionTargetType = self.convert(input)
+        deferred.run()
+        return output
+    
+    async def convert_async(self, input: ConfigObjectType or None) -> ConversionTargetType:
+        """Convert a config object, and await all I/O-bound validators, which run concurrently in threads"""
+        with DeferredValidation() as deferred:
+            output: ConversionTargetType = self.convert(input)
+        await deferred.run_async()
+        return output
+    
+    def convert_incremental(self, 
+                            input: ConfigObjectType or None, 
+                            baseline: ConversionRecord or None, 
+                            key: str = "", 
+                            parent_key: str = "") -> ConversionRecord:
+        """Convert a config object, reusing a previous conversion where the input didn't change
+
+        Values with children override this to only reconvert changed children. By default, the 
+        baseline is reused if it was created from the same input, otherwise the value is converted.
+        """
+        if baseline != None and baseline.matches(input=input):
+            return baseline
+        return ConversionRecord(input=input, output=self.convert(input, key=key, parent_key=parent_key))
+    
+    def child_values(self) -> List[Tuple[str, 'ConfigValueBase']]:
+        """Get all direct children with their source-case path element ("[*]" for list elements)"""
+        return []
+    
+    def index(self) -> SpecIndex:
+        """Get the (cached) index of all config values in this specification by their dotted source-case path"""
+        index: SpecIndex or None = getattr(self, "_index", None)
+        if index == None:
+            index = SpecIndex(specification=self)
+            self._index = index
+        return index
+    
     def specify(self) -> 'DefinitionBase':
-        """Get the specification definition object"""
+        """Get the (cached) specification definition object
+        
+        The definition is shared by all callers until the case or the type registry of this value 
+        changes, so it must not be modified. Use "DefinitionBase.with_key_case()" to get a definition 
+        with a different key case. Children may be changed separately (or be shared by several parents),
+        so the definition is also rebuilt if the definition of any child was rebuilt since.
+        """
+        definition: 'DefinitionBase or None' = getattr(self, "_definition", None)
+        children: List['DefinitionBase'] = [child.specify() for _, child in self.child_values()]
+        if definition == None or any(
+            current is not specified for current, specified in zip(children, self._specified_children)
+        ):
+            definition = self._specify()
+            self._definition = definition
+            self._specified_children: List['DefinitionBase'] = children
+        return definition
+
+    def _specify(self) -> 'DefinitionBase':
         raise NotImplementedError()
     
     def indent(self, level: int, token: str):
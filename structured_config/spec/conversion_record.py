@@ -0,0 +1,25 @@
+
+from dataclasses import dataclass
+from typing import Dict, List
+from structured_config.base.typedefs import ConfigObjectType, ConversionTargetType
+
+@dataclass
+class ConversionRecord:
+    """Result of converting one config value, together with the input it was converted from
+
+    Object and list values also keep the records of their children (by child key or list index),
+    which allows later conversions to reuse every subtree whose input didn't change.
+    """
+    input: ConfigObjectType or None
+    output: ConversionTargetType
+    children: Dict[str, 'ConversionRecord'] or List['ConversionRecord'] or None = None
+
+    def matches(self, input: ConfigObjectType or None) -> bool:
+        """Check if this record was created from the specified input
+        
+        Containers must be the identical object (copy-on-write override application only replaces
+        containers on overridden paths), scalars must have the same type and value.
+        """
+        if input is self.input:
+            return True
+        return type(input) is type(self.input) and type(input) is not dict and type(input) is not list and input == self.input
@@ -0,0 +1,54 @@
+
+from typing import Iterable
+from structured_config.base.typedefs import ConfigObjectType, ConversionTargetType
+from structured_config.io.overrides.assignment import Override
+from structured_config.io.overrides.mapper import Mapper
+from structured_config.spec.config_value_base import ConfigValueBase
+from structured_config.spec.conversion_record import ConversionRecord
+
+class ConvertedConfig:
+    """Converted config that can be cheaply re-derived with different overrides
+
+    A converted config keeps the config data it was converted from, and the conversion results of every
+    spec node. "with_overrides()" applies a set of overrides to the data without modifying it (only the
+    objects and lists on the overridden paths are copied), and then reconverts only the spec nodes on
+    the overridden paths, together with the converters of their ancestors. Every other converted subtree
+    is reused from this config. The specification must not be changed between conversions (e.g. by
+    changing its case).
+
+    Args:
+        specification (ConfigValueBase): config specification
+        data (ConfigObjectType): config data, must not be modified after conversion
+        baseline (ConversionRecord or None): previous conversion to reuse, optional
+    """
+
+    def __init__(self,
+                 specification: ConfigValueBase,
+                 data: ConfigObjectType,
+                 baseline: ConversionRecord or None = None):
+        self._specification: ConfigValueBase = specification
+        self._data: ConfigObjectType = data
+        self._record: ConversionRecord = specification.convert_incremental(input=data, baseline=baseline)
+
+    def get(self) -> ConversionTargetType:
+        """Get the converted config"""
+        return self._record.output
+
+    def data(self) -> ConfigObjectType:
+        """Get the config data this config was converted from"""
+        return self._data
+
+    def with_data(self, data: ConfigObjectType) -> 'ConvertedConfig':
+        """Convert new config data, reusing all subtrees that are identical to this config's data"""
+        return ConvertedConfig(specification=self._specification, data=data, baseline=self._record)
+
+    def with_overrides(self, overrides: Iterable[Override]) -> 'ConvertedConfig':
+        """Apply overrides to this config's data, and convert the result, reusing all unchanged subtrees
+
+        The override keys are translated to the source case of the specification, and the overrides are
+        sorted in the same way as when loading the config through a mapper.
+        """
+        mapper: Mapper = Mapper(source_case=self._specification.get_source_case()).direct_many(
+            overrides=((override.key, override.value) for override in overrides)
+        )
+        return self.with_data(data=mapper.apply(to=self._data, in_place=False))
@@ -0,0 +1,242 @@
+
+import dataclasses
+import enum
+import types
+import weakref
+from typing import Any, Callable, Dict, List, Set, Type, Union, get_args, get_origin, get_type_hints, is_typeddict
+
+from structured_config.conversion.keyword_casting_converter import KeywordCastingConverter
+from structured_config.spec.config import Config
+from structured_config.spec.config_value_base import ConfigValueBase
+from structured_config.spec.entries.entry_base import EntryBase
+from structured_config.spec.entries.list_entry import ListEntry
+from structured_config.spec.entries.object_entry import ObjectEntry
+from structured_config.spec.entries.object_requirements import MakeRequirements, ObjectRequirements
+from structured_config.spec.entries.scalar_entry import ScalarEntry
+from structured_config.spec.invalid_spec_exception import InvalidSpecException
+from structured_config.spec.object_config_value import ObjectConfigValue
+
+
+class DataclassSpec:
+    """Derive config specifications from dataclass and TypedDict annotations
+
+    Each field becomes an entry of an object config value:
+
+        str, int, float, bool: typed scalar with a config type check ("float" also accepts integers)
+        enum types: typed scalar, constructed from the config value
+        Any, unions of scalar types: untyped scalar, checking the scalar types of the union (if any)
+        dataclasses, TypedDicts: nested object, derived in the same way
+        List[T]: list of values derived from "T"
+
+    "Optional[T]" is treated the same as "T". Dataclass fields without a default are required, and
+    all other fields are optional with their default (default factories are called on each conversion,
+    so mutable defaults aren't shared). Nested objects with a default are created from that default if
+    they are missing, instead of from their own fields. TypedDict keys are required as specified by
+    the TypedDict, missing optional keys are left out of the dictionary. Dataclasses are constructed with the converted fields as keyword arguments,
+    TypedDicts are kept as dictionaries. Fields that can't be initialized (i.e. "field(init=False)")
+    are skipped.
+    """
+
+    # derived specifications, by class
+    _specs: 'weakref.WeakKeyDictionary[Type, ObjectConfigValue]' = weakref.WeakKeyDictionary()
+
+    _scalar_config_types: Dict[Type, List[Type]] = {
+        str: [str],
+        int: [int],
+        float: [int, float],
+        bool: [bool],
+    }
+
+    @staticmethod
+    def make(cls: Type, cached: bool = True) -> ObjectConfigValue:
+        """Get the specification of a dataclass or TypedDict
+
+        Cached specifications are shared by all callers, so changing their case or type registry affects
+        every caller. Use "cached=False" to get a separate specification.
+        """
+        if not cached:
+            return DataclassSpec._derive(cls=cls)
+        spec: ObjectConfigValue or None = DataclassSpec._specs.get(cls, None)
+        if spec == None:
+            spec = DataclassSpec._derive(cls=cls)
+            DataclassSpec._specs[cls] = spec
+        return spec
+
+    @staticmethod
+    def is_supported(cls: Any) -> bool:
+        return isinstance(cls, type) and (dataclasses.is_dataclass(cls) or is_typeddict(cls))
+
+    @staticmethod
+    def entries(cls: Type) -> List[EntryBase]:
+        """Get the object entries of all fields of a dataclass or TypedDict"""
+        return DataclassSpec._entries(cls=cls, parents=set())
+
+    @staticmethod
+    def requirements(cls: Type) -> ObjectRequirements:
+        """Get the required fields and defaults of a dataclass or TypedDict
+
+        Fields with a default factory are optional without a default, the factory is called by the
+        converter of the object (see "converter").
+        """
+        if is_typeddict(cls):
+            return MakeRequirements.mixed(
+                required=list(cls.__required_keys__),
+                defaults=dict.fromkeys(cls.__optional_keys__, None),
+            )
+        required: List[str] = []
+        defaults: Dict[str, Any] = {}
+        for field in DataclassSpec._fields(cls=cls):
+            if field.default is not dataclasses.MISSING:
+                defaults[field.name] = field.default
+            elif field.default_factory is dataclasses.MISSING:
+                required.append(field.name)
+        return MakeRequirements.mixed(required=required, defaults=defaults)
+
+    @staticmethod
+    def converter(cls: Type) -> KeywordCastingConverter:
+        """Get the converter constructing a dataclass or TypedDict from its converted fields
+
+        Default factories of missing dataclass fields are called on each conversion, and missing optional
+        TypedDict keys are left out. Nested objects are created by their own config values.
+        """
+        if is_typeddict(cls):
+            return KeywordCastingConverter(to=cls, omitted=list(cls.__optional_keys__))
+        hints: Dict[str, Any] = get_type_hints(cls)
+        return KeywordCastingConverter(to=cls, factories={
+            field.name: field.default_factory for field in DataclassSpec._fields(cls=cls)
+            if field.default_factory is not dataclasses.MISSING
+                and not DataclassSpec.is_supported(DataclassSpec._strip_optional(annotation=hints[field.name]))
+        })
+
+    @staticmethod
+    def _derive(cls: Type) -> ObjectConfigValue:
+        DataclassSpec._verify_supported(cls=cls, name=getattr(cls, "__name__", str(cls)))
+        return Config.object(
+            entries=DataclassSpec.entries(cls=cls),
+            converter=DataclassSpec.converter(cls=cls),
+            type=DataclassSpec._converted_type(cls=cls),
+            requirements=DataclassSpec.requirements(cls=cls),
+        )
+
+    @staticmethod
+    def _entries(cls: Type, parents: Set[Type]) -> List[EntryBase]:
+        # recursive types can't be expressed by a specification
+        if cls in parents:
+            raise InvalidSpecException(reason=f"Cannot derive a specification for the recursive type '{cls.__name__}'")
+        parents = parents | {cls}
+
+        hints: Dict[str, Any] = get_type_hints(cls)
+        names: List[str] = \
+            [field.name for field in DataclassSpec._fields(cls=cls)] \
+                if dataclasses.is_dataclass(cls) else \
+            list(hints.keys())
+        defaults: Dict[str, Callable[[], Any]] = DataclassSpec._default_factories(cls=cls)
+        return [
+            DataclassSpec._entry(name=name, annotation=hints[name], owner=cls, parents=parents, default_factory=defaults.get(name, None))
+            for name in names
+        ]
+
+    @staticmethod
+    def _default_factories(cls: Type) -> Dict[str, Callable[[], Any]]:
+        # factories of the values of optional fields, used for nested objects
+        if is_typeddict(cls):
+            return dict.fromkeys(cls.__optional_keys__, DataclassSpec._constant(value=None))
+        factories: Dict[str, Callable[[], Any]] = {}
+        for field in DataclassSpec._fields(cls=cls):
+            if field.default is not dataclasses.MISSING:
+                factories[field.name] = DataclassSpec._constant(value=field.default)
+            elif field.default_factory is not dataclasses.MISSING:
+                factories[field.name] = field.default_factory
+        return factories
+
+    @staticmethod
+    def _constant(value: Any) -> Callable[[], Any]:
+        return lambda: value
+
+    @staticmethod
+    def _entry(name: str, annotation: Any, owner: Type, parents: Set[Type], default_factory: Callable[[], Any] or None = None) -> EntryBase:
+        annotation = DataclassSpec._strip_optional(annotation=annotation)
+        if DataclassSpec.is_supported(annotation):
+            return ObjectEntry.make(
+                name=name,
+                entries=DataclassSpec._entries(cls=annotation, parents=parents),
+                converter=DataclassSpec.converter(cls=annotation),
+                type=DataclassSpec._converted_type(cls=annotation),
+                requirements=DataclassSpec.requirements(cls=annotation),
+                default_factory=default_factory,
+            )
+        elif get_origin(annotation) is list:
+            return ListEntry.make(
+                name=name,
+                elements=DataclassSpec._list_element(annotation=annotation, owner=owner, name=name, parents=parents),
+            )
+        elif annotation in DataclassSpec._scalar_config_types:
+            return ScalarEntry.typed(name=name, cast_to=annotation, type=DataclassSpec._scalar_config_types[annotation])
+        elif isinstance(annotation, type) and issubclass(annotation, enum.Enum):
+            return ScalarEntry.typed(name=name, cast_to=annotation)
+        else:
+            return ScalarEntry.make(name=name, type=DataclassSpec._scalar_union(annotation=annotation, owner=owner, name=name))
+
+    @staticmethod
+    def _value(annotation: Any, owner: Type, name: str, parents: Set[Type]) -> ConfigValueBase:
+        annotation = DataclassSpec._strip_optional(annotation=annotation)
+        if DataclassSpec.is_supported(annotation):
+            return Config.object(
+                entries=DataclassSpec._entries(cls=annotation, parents=parents),
+                converter=DataclassSpec.converter(cls=annotation),
+                type=DataclassSpec._converted_type(cls=annotation),
+                requirements=DataclassSpec.requirements(cls=annotation),
+            )
+        elif get_origin(annotation) is list:
+            return Config.list(elements=DataclassSpec._list_element(annotation=annotation, owner=owner, name=name, parents=parents))
+        elif annotation in DataclassSpec._scalar_config_types:
+            return Config.typed_scalar(cast_to=annotation, type=DataclassSpec._scalar_config_types[annotation])
+        elif isinstance(annotation, type) and issubclass(annotation, enum.Enum):
+            return Config.typed_scalar(cast_to=annotation)
+        else:
+            return Config.scalar(type=DataclassSpec._scalar_union(annotation=annotation, owner=owner, name=name))
+
+    @staticmethod
+    def _list_element(annotation: Any, owner: Type, name: str, parents: Set[Type]) -> ConfigValueBase:
+        arguments: tuple = get_args(annotation)
+        return DataclassSpec._value(annotation=arguments[0] if len(arguments) > 0 else Any, owner=owner, name=name, parents=parents)
+
+    @staticmethod
+    def _scalar_union(annotation: Any, owner: Type, name: str) -> List[Type] or None:
+        # untyped scalars accept any scalar type, unions accept their scalar members
+        if annotation is Any:
+            return None
+        members: tuple = get_args(annotation) if DataclassSpec._is_union(annotation=annotation) else (annotation,)
+        if not all(member in DataclassSpec._scalar_config_types for member in members):
+            raise InvalidSpecException(reason=f"Cannot derive a config value for field '{name}' of '{owner.__name__}': "
+                                              f"unsupported type '{annotation}'")
+        return list(dict.fromkeys(
+            config_type for member in members for config_type in DataclassSpec._scalar_config_types[member]
+        ))
+
+    @staticmethod
+    def _strip_optional(annotation: Any) -> Any:
+        if DataclassSpec._is_union(annotation=annotation):
+            members: List[Any] = [member for member in get_args(annotation) if member is not type(None)]
+            if len(members) == 1:
+                return members[0]
+            return Union[tuple(members)]
+        return annotation
+
+    @staticmethod
+    def _is_union(annotation: Any) -> bool:
+        return get_origin(annotation) is Union or isinstance(annotation, types.UnionType)
+
+    @staticmethod
+    def _converted_type(cls: Type) -> Type or None:
+        # TypedDict instances are plain dictionaries
+        return None if is_typeddict(cls) else cls
+
+    @staticmethod
+    def _fields(cls: Type) -> List[dataclasses.Field]:
+        return [field for field in dataclasses.fields(cls) if field.init]
+
+    @staticmethod
+    def _verify_supported(cls: Any, name: str):
+        if not DataclassSpec.is_supported(cls):
+            raise InvalidSpecException(reason=f"Cannot derive a specification from '{name}': not a dataclass or TypedDict")
@@ -1,4 +1,4 @@
-from typing import List, Tuple
+from typing import Callable, List, Tuple
 from structured_config.conversion.converter_base import ConverterBase
 from structured_config.conversion.no_op_converter import NoOpConverter
 from structured_config.conversion.type_casting_converter import TypeCastingConverter
@@ -8,6 +8,7 @@ from structured_config.spec.entries.entry_base import EntryBase
 from structured_config.spec.entries.object_requirements import ObjectRequirements
 from structured_config.spec.object_config_value import ObjectConfigValue
 from structured_config.type_checking.require_types import RequireConvertedType
+from structured_config.validation.cross_validator_base import CrossValidatorBase
 from structured_config.base.typedefs import ConversionTargetType, ScalarConvertedTypeRequirements
 
 
@@ -19,12 +20,16 @@ class _ObjectEntry(EntryBase):
                  entries: List[EntryBase],
                  converter: ConverterBase,
                  type: ScalarConvertedTypeRequirements,
-                 requirements: ObjectRequirements or None):
+                 requirements: ObjectRequirements or None,
+                 cross_validators: List[CrossValidatorBase] or None = None,
+                 default_factory: Callable[[], ConversionTargetType] or None = None):
         self._name: str = name
         self._entries: List[EntryBase] = entries
         self._converter: ConverterBase = converter
         self._type: ScalarConvertedTypeRequirements = type
         self._requirements: ObjectRequirements or None = requirements
+        self._cross_validators: List[CrossValidatorBase] or None = cross_validators
+        self._default_factory: Callable[[], ConversionTargetType] or None = default_factory
         
         
     def create_value(self, 
@@ -42,6 +47,8 @@ class _ObjectEntry(EntryBase):
                         expected_types=self._type,
                         default=RequireConvertedType.none(),
                     ),
+                    cross_validators=self._cross_validators,
+                    default_factory=self._default_factory,
                 )
             )
     
@@ -51,7 +58,9 @@ class ObjectEntry:
     def typed(name: str,
               entries: List[EntryBase],
               cast_to: ConversionTargetType,
-              requirements: ObjectRequirements or None = None) -> '_ObjectEntry':
+              requirements: ObjectRequirements or None = None,
+              cross_validators: List[CrossValidatorBase] or None = None,
+              default_factory: Callable[[], ConversionTargetType] or None = None) -> '_ObjectEntry':
         """Create a typed list entry for an object value
 
         See the documentation of "Config.typed_object()" for details on typed object config entries.
@@ -61,13 +70,19 @@ class ObjectEntry:
             entries (List[ObjectEntry]): list of children for this object
             type (ConversionTargetType): config entry type, must be constructible from a dictionary
             requirements (ObjectRequirements): optional requirements object
+            cross_validators (List[CrossValidatorBase]): optional validators of relations between the converted 
+                children, see "CrossValidatorBase"
+            default_factory (Callable[[], ConversionTargetType] or None): optional, creates the object when it is 
+                missing from the config, instead of converting it from the defaults of its children
         """
         return _ObjectEntry(
             name=name,
             entries=entries,
-            converter=TypeCastingConverter(to=type),
+            converter=TypeCastingConverter(to=cast_to),
             type=cast_to,
             requirements=requirements,
+            cross_validators=cross_validators,
+            default_factory=default_factory,
         )
     
     @staticmethod
@@ -75,7 +90,9 @@ class ObjectEntry:
              entries: List[EntryBase],
              converter: ConverterBase = NoOpConverter(),
              type: ScalarConvertedTypeRequirements = None,
-             requirements: ObjectRequirements or None = None) -> '_ObjectEntry':
+             requirements: ObjectRequirements or None = None,
+             cross_validators: List[CrossValidatorBase] or None = None,
+             default_factory: Callable[[], ConversionTargetType] or None = None) -> '_ObjectEntry':
         """Create an object entry for an object value
 
         See the documentation of "Config.object()" for details on object config entries.
@@ -86,6 +103,10 @@ class ObjectEntry:
             converter (ConverterBase): type converter, takes a dictionary as its input
             type (ConversionTargetType): optional target type for required and default values
             requirements (ObjectRequirements): optional requirements object
+            cross_validators (List[CrossValidatorBase]): optional validators of relations between the converted 
+                children, see "CrossValidatorBase"
+            default_factory (Callable[[], ConversionTargetType] or None): optional, creates the object when it is 
+                missing from the config, instead of converting it from the defaults of its children
         """
         return _ObjectEntry(
             name=name,
@@ -93,5 +114,7 @@ class ObjectEntry:
             converter=converter,
             type=type,
             requirements=requirements,
+            cross_validators=cross_validators,
+            default_factory=default_factory,
         )
     
\ No newline at end of file
@@ -1,6 +1,7 @@
 
+import weakref
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Type, get_type_hints
+from typing import Any, Callable, Dict, FrozenSet, List, Type, get_type_hints
 
 from structured_config.base.typedefs import ConversionTargetType
 
@@ -13,6 +14,8 @@ class ObjectRequirements:
     def __post_init__(self):
         self.required: Callable[[], List[str]] = self._get_required
         self.defaults: Callable[[], Dict[str, ConversionTargetType]] = self._get_defaults
+        # resolved by "ExtractRequirements", this is not a dataclass field, so it isn't compared
+        self._resolved: ResolvedRequirements or None = None
 
     def _get_required(self) -> List[str]:
         return self.required_list
@@ -20,6 +23,16 @@ class ObjectRequirements:
         return self.defaults_dict
     
 
+@dataclass(frozen=True)
+class ResolvedRequirements:
+    """Requirements of an object type or requirements object, resolved from its "required" and "defaults" methods
+    
+    Either member is "None" if the corresponding method doesn't exist.
+    """
+    required: FrozenSet[str] or None
+    defaults: Dict[str, ConversionTargetType or None] or None
+    
+
 class MakeRequirements:
     
     @staticmethod
@@ -35,56 +48,70 @@ class MakeRequirements:
         return ObjectRequirements(required_list=required, defaults_dict=defaults)
 
 class ExtractRequirements:
+    """Find the requirements of a single entry
+
+    The "required" and "defaults" methods of an object type or requirements object are only resolved and 
+    called once, the results are shared by all entries with the same object type or requirements object.
+    The methods therefore must always return the same values.
+    """
+
+    # resolved requirements of object types, by type
+    _resolved_types: 'weakref.WeakKeyDictionary[Any, ResolvedRequirements]' = weakref.WeakKeyDictionary()
 
     def __init__(self, name: str):
         self._name = name
 
-    def _get_required_method(self, 
-                             object_type: ConversionTargetType or None, 
-                             requirements: ObjectRequirements or None) -> Any:
-        return self._get_method_with_fallback(main=object_type, 
-                                              fallback=requirements, 
-                                              method="required",
-                                              expected_return_type=list)
-    
-    def _get_defaults_method(self, 
-                             object_type: ConversionTargetType or None, 
-                             requirements: ObjectRequirements or None) -> Any:
-        return self._get_method_with_fallback(main=object_type, 
-                                              fallback=requirements, 
-                                              method="defaults",
-                                              expected_return_type=dict)
+    @staticmethod
+    def resolve(owner: ConversionTargetType or ObjectRequirements or None) -> ResolvedRequirements:
+        """Get the (cached) requirements of an object type or requirements object"""
+        if owner == None:
+            return ResolvedRequirements(required=None, defaults=None)
+        
+        # requirements objects aren't hashable, so they store their resolved requirements themselves
+        if isinstance(owner, ObjectRequirements):
+            if owner._resolved == None:
+                owner._resolved = ExtractRequirements._resolve_methods(owner=owner)
+            return owner._resolved
+        
+        try:
+            resolved: ResolvedRequirements or None = ExtractRequirements._resolved_types.get(owner, None)
+        except TypeError:
+            # neither hashable nor weakly referencable, so the requirements can't be cached
+            return ExtractRequirements._resolve_methods(owner=owner)
+        if resolved == None:
+            resolved = ExtractRequirements._resolve_methods(owner=owner)
+            try:
+                ExtractRequirements._resolved_types[owner] = resolved
+            except TypeError:
+                pass
+        return resolved
     
-    def _get_method_with_fallback(self, 
-                                  main: Any, 
-                                  fallback: Any,
-                                  method: str,
-                                  expected_return_type: Type) -> Any:
-        """Try to get the specified method with the specified return type
+    @staticmethod
+    def _resolve_methods(owner: Any) -> ResolvedRequirements:
+        required_method: Any = ExtractRequirements._get_method(owner=owner, method="required", expected_return_type=list)
+        defaults_method: Any = ExtractRequirements._get_method(owner=owner, method="defaults", expected_return_type=dict)
+        return ResolvedRequirements(
+            required=frozenset(required_method()) if required_method != None else None,
+            defaults=dict(defaults_method()) if defaults_method != None else None,
+        )
 
-        Try the main object first, then try the fallback object. If neither has a matching attribute, 
-        return "None", otherwise return the callable attribute.
-        """
-        method_attr: Any = None
-        if main != None:
-            attr = getattr(main, method, None)
-            if attr != None and callable(attr) and get_type_hints(attr)["return"].__origin__ is expected_return_type:
-                method_attr = attr
-        if method_attr == None and fallback != None:
-            attr = getattr(fallback, method, None)
-            if attr != None and callable(attr) and get_type_hints(attr)["return"].__origin__ is expected_return_type:
-                method_attr = attr
-        return method_attr
+    @staticmethod
+    def _get_method(owner: Any, method: str, expected_return_type: Type) -> Any:
+        """Get the specified method with the specified return type, or "None" if there is no such method"""
+        attr = getattr(owner, method, None)
+        if attr != None and callable(attr) and get_type_hints(attr)["return"].__origin__ is expected_return_type:
+            return attr
+        return None
     
     def find_required(self, 
                        object_type: ConversionTargetType or None, 
                        requirements: ObjectRequirements or None) -> bool:
-        # get the "required" method
-        required_method = self._get_required_method(object_type=object_type, requirements=requirements)
-        # verify the method
-        if callable(required_method) and get_type_hints(required_method)["return"].__origin__ is list:
-            # get the default value
-            return self._name in required_method()
+        # try the object type first, then the requirements object
+        required: FrozenSet[str] or None = ExtractRequirements.resolve(owner=object_type).required
+        if required == None:
+            required = ExtractRequirements.resolve(owner=requirements).required
+        if required != None:
+            return self._name in required
         else:
             # values are required by default, because the assumption is that if a class
             # doesn't define the "required" method, it won't define the "defaults" method
@@ -94,12 +121,12 @@ class ExtractRequirements:
     def find_default(self, 
                        object_type: ConversionTargetType or None, 
                        requirements: ObjectRequirements or None) -> ConversionTargetType:
-        # get the "defaults" method
-        defaults_method = self._get_defaults_method(object_type=object_type, requirements=requirements)
-        # verify the method
-        if callable(defaults_method) and get_type_hints(defaults_method)["return"].__origin__ is dict:
-            # get the default value
-            return defaults_method().get(self._name, None)
+        # try the object type first, then the requirements object
+        defaults: Dict[str, ConversionTargetType or None] or None = ExtractRequirements.resolve(owner=object_type).defaults
+        if defaults == None:
+            defaults = ExtractRequirements.resolve(owner=requirements).defaults
+        if defaults != None:
+            return defaults.get(self._name, None)
         else:
             # we cannot have a default value if we don't have a "defaults" method
-            return None
\ No newline at end of file
+            return None
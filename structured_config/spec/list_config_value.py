@@ -10,6 +10,7 @@ from structured_config.base.typedefs import ConfigObjectType, ConversionTargetTy
 from structured_config.spec.invalid_child_type_exception import InvalidChildTypeException
 from structured_config.validation.list_validator import ListValidator
 from structured_config.spec.required_value_not_found_exception import RequiredValueNotFoundException
+from structured_config.spec.conversion_record import ConversionRecord
 from typing import List, Tuple, Any
 
 from typing import TYPE_CHECKING
@@ -42,7 +43,10 @@ class ListConfigValue(ConfigValueBase):
         self._required = required
         self._default = default
 
-    def specify(self) -> 'DefinitionBase':
+    def child_values(self) -> List[Tuple[str, ConfigValueBase]]:
+        return [("[*]", self._child_definition)]
+
+    def _specify(self) -> 'DefinitionBase':
         return ListDefinition(
             key_case=self.get_source_case(),
             children=self._child_definition.specify(),
@@ -52,6 +56,8 @@ class ListConfigValue(ConfigValueBase):
             max_exclusive=self._requirements.max_exclusive,
             strict=self._requirements.strict,
             limits_summary=self._requirements.specify(),
+            required=self._required,
+            default=self._default,
         )
 
     def convert(self, input: ConfigObjectType or None, key: str = "", parent_key: str = "") -> ConversionTargetType:
@@ -103,6 +109,36 @@ class ListConfigValue(ConfigValueBase):
 
         return output
 
+    def convert_incremental(self, 
+                            input: ConfigObjectType or None, 
+                            baseline: ConversionRecord or None, 
+                            key: str = "", 
+                            parent_key: str = "") -> ConversionRecord:
+        # nothing changed below this list, or the list isn't specified at all
+        if (baseline != None and baseline.matches(input=input)) or input == None:
+            return super().convert_incremental(input=input, baseline=baseline, key=key, parent_key=parent_key)
+        
+        this_key: str = self.extend_key(aggregate=parent_key, key=key)
+        self._config_type_check(key=key, parent_key=parent_key, obj=input, scalar=False)
+
+        # reconvert the elements, unchanged elements at the same index reuse their baseline
+        previous: List[ConversionRecord] = baseline.children if baseline != None and baseline.children != None else []
+        children: List[ConversionRecord] = [
+            self._child_definition.convert_incremental(
+                input=data,
+                baseline=previous[i] if i < len(previous) else None,
+                key=f"[{i}]",
+                parent_key=this_key,
+            ) for i, data in enumerate(input)
+        ]
+
+        # the list validation and conversion always need to be repeated
+        values: List[ConversionTargetType] = self._requirements(values=[child.output for child in children])
+        output = self._list_converter(other=values, parent=parent_key, current=key)
+        self._converted_type_check(key=key, parent_key=parent_key, obj=output)
+
+        return ConversionRecord(input=input, output=output, children=children)
+
     def _convert_one(self, 
                      value: ConfigValueBase, 
                      input: ConfigObjectType,
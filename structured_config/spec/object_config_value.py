@@ -10,7 +10,11 @@ from structured_config.validation.pass_all_validator import PassAllValidator
 from structured_config.conversion.no_op_converter import NoOpConverter
 from structured_config.base.typedefs import ConfigObjectType, ConversionTargetType
 from structured_config.spec.invalid_child_type_exception import InvalidChildTypeException
-from typing import Dict, Tuple, List
+from structured_config.spec.conversion_record import ConversionRecord
+from structured_config.validation.cross_validation_context import CrossValidationContext
+from structured_config.validation.cross_validation_exception import CrossValidationException
+from structured_config.validation.cross_validator_base import CrossValidationViolation, CrossValidatorBase
+from typing import Callable, Dict, Tuple, List
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -25,47 +29,59 @@ class ObjectConfigValue(ConfigValueBase):
     conversion operation can be applied to the collection of all children, which is
     a dictionary of keys to converted child types. If no converter is specified, the 
     object value will simply be that dictionary. An object value is considered 
-    optional if it has no required children.
+    optional if it has no required children, or if it has a default factory.
 
     Args:
         expected_children (Dict[str, ConfigValueBase]): child key-value definitions
         converter (ConverterBase): optional converter for the entire object value
+        cross_validators (List[CrossValidatorBase] or None): optional validators of relations between 
+            children, run on the converted children (with defaults applied, and keys in the target case)
+            before the object converter
+        default_factory (Callable[[], ConversionTargetType] or None): optional, called to create the object 
+            value when the object is missing from the config (once per conversion)
     """
 
     def __init__(self,
                  expected_children: Dict[str, ConfigValueBase],
                  config_type_check: ConfigTypeCheckingFunction = RequireConfigType.object(),
                  converted_type_check: ConvertedTypeCheckingFunction = TypeConfig.no_converted_checks(),
-                 converter: ConverterBase = NoOpConverter()):
+                 converter: ConverterBase = NoOpConverter(),
+                 cross_validators: List[CrossValidatorBase] or None = None,
+                 default_factory: Callable[[], ConversionTargetType] or None = None):
         self._config_type_check: ConfigTypeCheckingFunction = config_type_check
         self._converted_type_check: ConvertedTypeCheckingFunction = converted_type_check
         self._children: Dict[str, ConfigValueBase] = expected_children
         self._converter: ConverterBase = converter
+        self._cross_validators: List[CrossValidatorBase] = cross_validators or []
+        self._default_factory: Callable[[], ConversionTargetType] or None = default_factory
+        self._keys: List[Tuple[str, str, str, ConfigValueBase]] or None = None
 
-    def specify(self) -> 'DefinitionBase':
+    def child_values(self) -> List[Tuple[str, ConfigValueBase]]:
+        return [(source_key, child) for _, source_key, _, child in self._child_keys()]
+
+    def _specify(self) -> 'DefinitionBase':
         return ObjectDefinition(
             key_case=self.get_source_case(),
             children={key: value.specify() for key, value in self._children.items()},
+            has_default=self._default_factory != None,
         )
 
     def convert(self, input: ConfigObjectType or None, key: str = "", parent_key: str = "") -> ConversionTargetType:
 
+        # missing objects with a default factory aren't converted at all
+        if input == None and self._default_factory != None:
+            return self._default_factory()
+
         this_key: str = self.extend_key(aggregate=parent_key, key=key)
         values: Dict[str, ConversionTargetType] = {}
 
         # check for "None": we can still return a valid object if each of
         # the children entries are optional
         if input == None:
-            values = dict(
-                [
-                    self._convert_one(
-                        value=child, 
-                        input=None, 
-                        key=self.translate_to_source(key=child_key), 
-                        parent_key=this_key
-                    ) for child_key, child in self._children.items()
-                ]
-            )
+            values = {
+                target_key: child.convert(input=None, key=source_key, parent_key=this_key)
+                for _, source_key, target_key, child in self._child_keys()
+            }
 
         # # the config input must be a dictionary if it isn't "None"
         # elif type(input) is not dict:
@@ -81,20 +97,20 @@ class ObjectConfigValue(ConfigValueBase):
             # validate config type
             self._config_type_check(key=key, parent_key=parent_key, obj=input, scalar=False)
 
-            values = dict(
-                [
-                    self._convert_one(
-                        value=child, 
-                        # instead of passing "None" like we did above, we 
-                        # try and retrieve the child object from the input
-                        # if that fails, we use "None" as the default to 
-                        # trigger the default/requirement check in the child
-                        input=input.get(self.translate_to_source(child_key), None), 
-                        key=self.translate_to_source(child_key), 
-                        parent_key=this_key
-                    ) for child_key, child in self._children.items()
-                ]
-            )
+            values = {
+                target_key: child.convert(
+                    # instead of passing "None" like we did above, we 
+                    # try and retrieve the child object from the input
+                    # if that fails, we use "None" as the default to 
+                    # trigger the default/requirement check in the child
+                    input=input.get(source_key, None), 
+                    key=source_key, 
+                    parent_key=this_key
+                ) for _, source_key, target_key, child in self._child_keys()
+            }
+
+            # check the relations between the converted children
+            self._cross_validate(values=values, this_key=this_key)
 
         # finally, we apply the conversion to the value dictionary
         output = self._converter(other=values, parent=parent_key, current=key)
@@ -104,22 +120,67 @@ class ObjectConfigValue(ConfigValueBase):
 
         return output
 
-    def _convert_one(self, 
-                     value: ConfigValueBase, 
-                     input: ConfigObjectType or None, 
-                     key: str, 
-                     parent_key: str) -> Tuple[str, ConversionTargetType]:
-        # Apply case translation to the key: this way the original case will be checked
-        # as required, but the user-specified conversion routines will receive the key in 
-        # the case they expect.
-        return (self.translate_to_target(key=key), value.convert(
-            input=input,
-            key=key,
-            parent_key=parent_key
-        ))
+    def convert_incremental(self, 
+                            input: ConfigObjectType or None, 
+                            baseline: ConversionRecord or None, 
+                            key: str = "", 
+                            parent_key: str = "") -> ConversionRecord:
+        # nothing changed below this object
+        if baseline != None and baseline.matches(input=input):
+            return baseline
+        if input == None and self._default_factory != None:
+            return ConversionRecord(input=input, output=self._default_factory())
+        
+        this_key: str = self.extend_key(aggregate=parent_key, key=key)
+        if input != None:
+            # validate config type
+            self._config_type_check(key=key, parent_key=parent_key, obj=input, scalar=False)
+
+        # reconvert the children, every unchanged child reuses its baseline
+        children: Dict[str, ConversionRecord] = {}
+        values: Dict[str, ConversionTargetType] = {}
+        for child_key, source_key, target_key, child in self._child_keys():
+            children[child_key] = child.convert_incremental(
+                input=input.get(source_key, None) if input != None else None,
+                baseline=baseline.children.get(child_key, None) if baseline != None and baseline.children != None else None,
+                key=source_key,
+                parent_key=this_key,
+            )
+            values[target_key] = children[child_key].output
+        if input != None:
+            self._cross_validate(values=values, this_key=this_key)
+
+        # the object conversion itself always needs to be repeated
+        output = self._converter(other=values, parent=parent_key, current=key)
+        self._converted_type_check(key=key, parent_key=parent_key, obj=output)
+
+        return ConversionRecord(input=input, output=output, children=children)
+
+    def _cross_validate(self, values: Dict[str, ConversionTargetType], this_key: str):
+        if len(self._cross_validators) == 0:
+            return
+        # all validators share one context, so each path is resolved and indexed only once
+        context: CrossValidationContext = CrossValidationContext(data=values, path=this_key)
+        violations: List[CrossValidationViolation] = []
+        for validator in self._cross_validators:
+            violations.extend(validator.validate(context=context))
+        if len(violations) > 0:
+            raise CrossValidationException(object_key=this_key, violations=violations)
+
+    def _child_keys(self) -> List[Tuple[str, str, str, ConfigValueBase]]:
+        # Each child is looked up by its source-case key: this way the original case will be 
+        # checked as required, but the user-specified conversion routines will receive the key 
+        # in the target case they expect. Both keys are translated once per case change.
+        if self._keys == None:
+            self._keys = []
+            for child_key, child in self._children.items():
+                source_key: str = self.translate_to_source(key=child_key)
+                self._keys.append((child_key, source_key, self.translate_to_target(key=source_key), child))
+        return self._keys
     
     def translate_case(self, target: CaseTranslatorBase, source: CaseTranslatorBase = ...) -> 'ConfigValueBase':
         super().translate_case(target, source)
+        self._keys = None
         for child in self._children.values():
             child.translate_case(target=target, source=source)
         return self
@@ -7,6 +7,7 @@ from structured_config.type_checking.require_types import RequireConfigType
 from structured_config.type_checking.type_config import ConfigTypeCheckingFunction, ConvertedTypeCheckingFunction, TypeConfig
 from structured_config.validation.validator_base import ValidatorBase, ValidatorPhase
 from structured_config.validation.pass_all_validator import PassAllValidator
+from structured_config.validation.deferred_validation import DeferredValidation
 from structured_config.conversion.no_op_converter import NoOpConverter
 from structured_config.base.typedefs import ConfigObjectType, ConversionTargetType
 from structured_config.spec.required_value_not_found_exception import RequiredValueNotFoundException
@@ -58,7 +59,7 @@ class ScalarConfigValue(ConfigValueBase):
         if self._default != None and self._required:
             raise InvalidSpecException(reason="Cannot have default values for required config values")
         
-    def specify(self) -> 'DefinitionBase':
+    def _specify(self) -> 'DefinitionBase':
         return ValueDefinition(
             key_case=self.get_source_case(),
             type=self._config_type_check, 
@@ -80,7 +81,7 @@ class ScalarConfigValue(ConfigValueBase):
 
         # do we need to validate before we convert?
         if self._validator_phase == ValidatorPhase.BeforeConversion:
-            input = self._validator(data=input)
+            input = self._validate(data=input, key=key, parent_key=parent_key)
 
         # perform data conversion
         output: ConversionTargetType = self._converter(input, parent=parent_key, current=key)
@@ -90,8 +91,16 @@ class ScalarConfigValue(ConfigValueBase):
 
         # do we need to validate after we convert?
         if (self._validator_phase == ValidatorPhase.AfterConversion):
-            output = self._validator(data=output)
+            output = self._validate(data=output, key=key, parent_key=parent_key)
 
         # return final result
         return output
-
+    
+    def _validate(self, data: ConversionTargetType, key: str, parent_key: str) -> ConversionTargetType:
+        # I/O-bound validators run after the conversion if a deferred validation is active
+        if getattr(self._validator, "io_bound", False):
+            deferred: DeferredValidation or None = DeferredValidation.current()
+            if deferred != None:
+                deferred.defer(validator=self._validator, data=data, path=self.extend_key(aggregate=parent_key, key=key))
+                return data
+        return self._validator(data=data)
@@ -0,0 +1,70 @@
+
+from typing import Dict, Iterable, List, Tuple
+from structured_config.io.case_translation.case_translator_base import CaseTranslatorBase
+from structured_config.io.case_translation.no_translation import NoTranslation
+from structured_config.io.overrides.assignment import Override
+from structured_config.io.overrides.invalid_override_specification_exception import InvalidOverrideSpecificationException
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from structured_config.spec.config_value_base import ConfigValueBase
+
+class SpecIndex:
+    """Index of all config values in a specification by their dotted source-case path
+
+    Object children are addressed by their source-case keys, and list elements by "[*]", e.g. 
+    "addresses.[*].street". The root value has the empty path "". The index is built once, use 
+    "ConfigValueBase.index()" to get a cached index that is rebuilt after the case of the specification
+    changed. Override keys can be looked up directly: any list directive ("+" or "[<index>]") matches the
+    "[*]" path element, and "knows" may be used as an extractor key filter to drop unknown keys early (it 
+    translates the key to the source case first, in the same way as the mapper).
+
+    Args:
+        specification (ConfigValueBase): the root config value
+    """
+
+    def __init__(self, specification: 'ConfigValueBase'):
+        self._values: Dict[str, ConfigValueBase] = {}
+        self._source_case: CaseTranslatorBase = specification.get_source_case()
+
+        # walk the specification without recursion
+        stack: List[Tuple[str, ConfigValueBase]] = [("", specification)]
+        while len(stack) > 0:
+            path, value = stack.pop()
+            self._values[path] = value
+            for part, child in value.child_values():
+                stack.append((f"{path}.{part}" if len(path) > 0 else part, child))
+
+    def get(self, path: str) -> 'ConfigValueBase' or None:
+        """Get the config value at a dotted path, or None if the path doesn't exist"""
+        return self._values.get(path, None)
+    
+    def paths(self) -> Iterable[str]:
+        """Get all indexed paths"""
+        return self._values.keys()
+    
+    def find(self, override: Override) -> 'ConfigValueBase' or None:
+        """Get the config value targeted by an override, or None if the override key is unknown"""
+        return self._values.get(self._path(override=override), None)
+
+    def knows(self, key: str) -> bool:
+        """Check if an override key targets a config value of this specification
+        
+        The key doesn't need to be in the source case, each part is translated to the source case before 
+        the lookup.
+        """
+        return self._path(override=Override(key=self._translate_key(key=key), value="")) in self._values
+    
+    def validate(self, overrides: Iterable[Override]):
+        """Raise an exception if any of the overrides targets a config value that doesn't exist"""
+        unknown: List[str] = [override.key for override in overrides if self._path(override=override) not in self._values]
+        if len(unknown) > 0:
+            raise InvalidOverrideSpecificationException(reason=f"Unknown override keys {unknown}")
+
+    def _translate_key(self, key: str) -> str:
+        if type(self._source_case) is NoTranslation:
+            return key
+        return ".".join(self._source_case.translate(key=part) for part in key.split("."))
+
+    def _path(self, override: Override) -> str:
+        return ".".join(["[*]" if part.array else part.part for part in override.path])
@@ -1,28 +1,54 @@
 
-from typing import Any, List, Type
+from typing import Any, Dict, FrozenSet, List, Type
 
 from structured_config.type_checking.type_config import TypeConfig
+from structured_config.type_checking.type_registry import TypeRegistry
 
 
 class ConfigTypeChecker:
 
-    def __init__(self, allow_instance_of: bool, specific_types: List[Type] or None = None): 
+    def __init__(self, 
+                 allow_instance_of: bool, 
+                 specific_types: List[Type] or None = None,
+                 registry: TypeRegistry or None = None): 
         self._instance_of = allow_instance_of
         self._specific_types = specific_types
+        self._registry: TypeRegistry or None = registry
+        # allowed types and the per-type check results, rebuilt when the whitelist changes
+        self._version: int or None = None
+        self._scalar_types: FrozenSet[Type] = frozenset()
+        self._object_types: FrozenSet[Type] = frozenset()
+        self._scalar_dispatch: Dict[Type, bool] or None = {}
+        self._object_dispatch: Dict[Type, bool] or None = {}
+
+        # a registry never changes, so the allowed types can be computed right away
+        if registry != None:
+            self._compile(whitelist=registry)
 
     def __call__(self, key: str, parent_key: str, obj: Any, scalar: bool):
         if not self._verify(obj=obj, scalar=scalar):
             # get the list of allowed typenames
+            whitelist: TypeRegistry or type[TypeConfig] = self._registry or TypeConfig
             typenames: List[str] = \
-                TypeConfig.stringify_scalar_whitelist(specific_types=self._specific_types) \
+                whitelist.stringify_scalar_whitelist(specific_types=self._specific_types) \
                     if scalar else \
-                TypeConfig.stringify_object_whitelist(specific_types=self._specific_types)
+                whitelist.stringify_object_whitelist(specific_types=self._specific_types)
             
             # show the error
             raise TypeError(f"Invalid config type: Object '{key}' under '{parent_key}' has "
                             f"invalid type '{type(obj).__name__}': expected one of "
                             f"'{typenames}'")
         
+    def with_registry(self, registry: TypeRegistry) -> 'ConfigTypeChecker':
+        """Create a copy of this checker that uses a type registry instead of the "TypeConfig" whitelist"""
+        return ConfigTypeChecker(allow_instance_of=self._instance_of, specific_types=self._specific_types, registry=registry)
+
+    def registry(self) -> TypeRegistry or None:
+        return self._registry
+
+    def specific_types(self) -> List[Type] or None:
+        return self._specific_types
+        
     def typename(self) -> str:
         if not self._specific_types or len(self._specific_types) == 0:
             return "any-type"
@@ -32,7 +58,27 @@ class ConfigTypeChecker:
             return f"{[type.__name__ for type in self._specific_types]}"
 
     def _verify(self, obj: Any, scalar: bool) -> bool:
-        return \
-            TypeConfig.is_valid_scalar(obj=obj, allow_instance_of=self._instance_of, specific_types=self._specific_types) \
-                if scalar else \
-            TypeConfig.is_valid_object(obj=obj, allow_instance_of=self._instance_of, specific_types=self._specific_types)
\ No newline at end of file
+        if self._registry == None and self._version != TypeConfig.version():
+            self._version = TypeConfig.version()
+            self._compile(whitelist=TypeConfig)
+        
+        # the result usually only depends on the type of the object, so it is computed once per type
+        allowed: FrozenSet[Type] = self._scalar_types if scalar else self._object_types
+        dispatch: Dict[Type, bool] or None = self._scalar_dispatch if scalar else self._object_dispatch
+        if dispatch == None:
+            return TypeConfig.is_allowed(obj=obj, allowed=allowed, allow_instance_of=self._instance_of)
+        obj_type: Type = type(obj)
+        valid: bool or None = dispatch.get(obj_type, None)
+        if valid == None:
+            valid = TypeConfig.is_allowed(obj=obj, allowed=allowed, allow_instance_of=self._instance_of)
+            dispatch[obj_type] = valid
+        return valid
+    
+    def _compile(self, whitelist: TypeRegistry or type[TypeConfig]):
+        self._scalar_types = whitelist.allowed_scalar_types(specific_types=self._specific_types)
+        self._object_types = whitelist.allowed_object_types(specific_types=self._specific_types)
+        # types with custom instance checks are checked for each object
+        self._scalar_dispatch = \
+            {} if TypeConfig.is_type_dependent(allowed=self._scalar_types, allow_instance_of=self._instance_of) else None
+        self._object_dispatch = \
+            {} if TypeConfig.is_type_dependent(allowed=self._object_types, allow_instance_of=self._instance_of) else None
@@ -1,5 +1,7 @@
 
-from typing import Any, List, Type
+from typing import Any, Dict, FrozenSet, List, Type
+
+from structured_config.type_checking.type_config import TypeConfig
 
 
 class ConvertedTypeChecker:
@@ -7,6 +9,11 @@ class ConvertedTypeChecker:
     def __init__(self, any_of: List[Type], allow_instance_of: bool):
         self._any_of: List[Type] = any_of
         self._instance_of: bool = allow_instance_of
+        # precomputed type set and per-type check results (types with custom instance checks are
+        # checked for each object instead)
+        self._types: FrozenSet[Type] = frozenset(any_of)
+        self._dispatch: Dict[Type, bool] or None = \
+            {} if TypeConfig.is_type_dependent(allowed=any_of, allow_instance_of=allow_instance_of) else None
 
     def __call__(self, key: str, parent_key: str, obj: Any):
         if not self._verify(obj=obj):
@@ -14,10 +21,17 @@ class ConvertedTypeChecker:
                             f"invalid type '{type(obj).__name__}': expected one of '{self._stringify_types()}'")
     
     def _verify(self, obj: Any) -> bool:
-        return \
-            any([isinstance(obj, one_type) for one_type in self._any_of]) \
-                if self._instance_of else \
-            any([type(obj) is one_type for one_type in self._any_of])
+        if self._dispatch == None:
+            return any(isinstance(obj, one_type) for one_type in self._any_of)
+        obj_type: Type = type(obj)
+        valid: bool or None = self._dispatch.get(obj_type, None)
+        if valid == None:
+            valid = \
+                any(isinstance(obj, one_type) for one_type in self._any_of) \
+                    if self._instance_of else \
+                obj_type in self._types
+            self._dispatch[obj_type] = valid
+        return valid
     
     def _stringify_types(self) -> List[str]:
         return [self._stringify_one_type(type=one_type) for one_type in self._any_of]
@@ -1,4 +1,6 @@
 import inspect
+import weakref
+from functools import lru_cache
 from structured_config.type_checking.config_type_checker import ConfigTypeChecker
 from structured_config.type_checking.converted_type_checker import ConvertedTypeChecker
 from structured_config.type_checking.type_config import (
@@ -7,60 +9,75 @@ from structured_config.type_checking.type_config import (
     TypeConfig,
 )
 
-from typing import Any, Callable, Dict, List, Type, TypeVar
+from typing import Any, Callable, Dict, List, Tuple, Type, TypeVar
 
 from structured_config.base.typedefs import (
     ScalarConfigTypeRequirements,
     ScalarConvertedTypeRequirements,
 )
 
+# maximum number of distinct type lists whose config type checker is shared
+CONFIG_TYPE_CHECKER_CACHE_SIZE: int = 1024
+
+# config type checkers never change after construction, so each type list only needs one
+@lru_cache(maxsize=CONFIG_TYPE_CHECKER_CACHE_SIZE)
+def _shared_config_type_checker(allow_instance_of: bool, types: Tuple[Type, ...] or None) -> ConfigTypeChecker:
+    return ConfigTypeChecker(allow_instance_of=allow_instance_of, specific_types=list(types) if types != None else None)
+
 
 class RequireConfigType:
+
     @staticmethod
     def none() -> ConfigTypeCheckingFunction:
         return TypeConfig.no_config_checks()
 
     @staticmethod
     def scalar() -> ConfigTypeCheckingFunction:
-        return ConfigTypeChecker(allow_instance_of=False)
+        return RequireConfigType._shared(allow_instance_of=False, types=None)
 
     @staticmethod
     def string() -> ConfigTypeCheckingFunction:
-        return ConfigTypeChecker(allow_instance_of=False, specific_types=[str])
+        return RequireConfigType._shared(allow_instance_of=False, types=[str])
 
     @staticmethod
     def integer() -> ConfigTypeCheckingFunction:
-        return ConfigTypeChecker(allow_instance_of=False, specific_types=[int])
+        return RequireConfigType._shared(allow_instance_of=False, types=[int])
 
     @staticmethod
     def decimal() -> ConfigTypeCheckingFunction:
-        return ConfigTypeChecker(allow_instance_of=False, specific_types=[float])
+        return RequireConfigType._shared(allow_instance_of=False, types=[float])
 
     @staticmethod
     def number() -> ConfigTypeCheckingFunction:
-        return ConfigTypeChecker(allow_instance_of=False, specific_types=[int, float])
+        return RequireConfigType._shared(allow_instance_of=False, types=[int, float])
 
     @staticmethod
     def boolean() -> ConfigTypeCheckingFunction:
-        return ConfigTypeChecker(allow_instance_of=False, specific_types=[bool])
+        return RequireConfigType._shared(allow_instance_of=False, types=[bool])
 
     @staticmethod
     def object() -> ConfigTypeCheckingFunction:
-        return ConfigTypeChecker(
-            allow_instance_of=False, specific_types=[Dict[str, Any]]
-        )
+        return RequireConfigType._shared(allow_instance_of=False, types=[Dict[str, Any]])
 
     @staticmethod
     def list() -> ConfigTypeCheckingFunction:
-        return ConfigTypeChecker(allow_instance_of=False, specific_types=[List[Any]])
+        return RequireConfigType._shared(allow_instance_of=False, types=[List[Any]])
 
     @staticmethod
     def from_type_list(
         types: List[Type], allow_instance_of: bool = False
     ) -> ConfigTypeCheckingFunction:
-        return ConfigTypeChecker(
-            allow_instance_of=allow_instance_of, specific_types=types
-        )
+        return RequireConfigType._shared(allow_instance_of=allow_instance_of, types=types)
+
+    @staticmethod
+    def _shared(allow_instance_of: bool, types: List[Type] or None) -> ConfigTypeChecker:
+        shared_types: Tuple[Type, ...] or None = tuple(types) if types != None else None
+        try:
+            hash(shared_types)
+        except TypeError:
+            # unhashable types can't be shared
+            return ConfigTypeChecker(allow_instance_of=allow_instance_of, specific_types=types)
+        return _shared_config_type_checker(allow_instance_of=allow_instance_of, types=shared_types)
 
     @staticmethod
     def make_type_checking_function(
@@ -78,6 +95,12 @@ class RequireConfigType:
 
 
 class RequireConvertedType:
+
+    # signature classification of callables, by callable (bound methods by their function, as a new
+    # method object is created on each attribute access)
+    _type_checking_functions: "weakref.WeakKeyDictionary[Callable, bool]" = weakref.WeakKeyDictionary()
+    _type_checking_methods: "weakref.WeakKeyDictionary[Callable, bool]" = weakref.WeakKeyDictionary()
+
     @staticmethod
     def none() -> ConvertedTypeCheckingFunction:
         return TypeConfig.no_converted_checks()
@@ -106,6 +129,29 @@ class RequireConvertedType:
 
     @staticmethod
     def _is_type_checking_function(type_object: Callable) -> bool:
+        # the same types and functions are usually passed for many spec values, so
+        # the signature is only inspected once per callable
+        cache: "weakref.WeakKeyDictionary[Callable, bool]" = RequireConvertedType._type_checking_functions
+        key: Callable = type_object
+        if inspect.ismethod(type_object):
+            # the signature of a bound method is its function's signature without the first parameter
+            cache = RequireConvertedType._type_checking_methods
+            key = type_object.__func__
+        try:
+            cached: bool or None = cache.get(key, None)
+        except TypeError:
+            # neither hashable nor weakly referencable
+            return RequireConvertedType._has_type_checking_signature(type_object)
+        if cached == None:
+            cached = RequireConvertedType._has_type_checking_signature(type_object)
+            try:
+                cache[key] = cached
+            except TypeError:
+                pass
+        return cached
+
+    @staticmethod
+    def _has_type_checking_signature(type_object: Callable) -> bool:
         # get the signature
         signature: inspect.Signature = inspect.signature(type_object)
 
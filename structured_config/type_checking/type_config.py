@@ -1,5 +1,5 @@
 
-from typing import Any, Dict, List, Type, Protocol
+from typing import Any, Dict, FrozenSet, Iterable, List, Type, Protocol
 
 class ConfigTypeCheckingFunction(Protocol):
     def __call__(self, key: str, parent_key: str, obj: Any, scalar: bool): ...
@@ -18,18 +18,29 @@ class TypeConfig:
         List[Any], Dict[str, Any]
     ]
 
+    # incremented on each whitelist change, type checkers compare it to invalidate their caches
+    _version: int = 0
+
     @classmethod
     def allow_scalar_type(cls, new_type: Type): 
         cls._scalar_whitelist.append(new_type)
+        cls._version += 1
 
     @classmethod
     def disallow_scalar_type(cls, type: Type):
         if type in cls._scalar_whitelist:
             cls._scalar_whitelist.remove(type)
+            cls._version += 1
 
     @classmethod
     def change_scalar_whitelist(cls, whitelist: List[Type]):
         cls._scalar_whitelist = whitelist
+        cls._version += 1
+
+    @classmethod
+    def version(cls) -> int:
+        """Get the whitelist version, which changes whenever the scalar whitelist is changed"""
+        return cls._version
 
     @classmethod
     def stringify_scalar_whitelist(cls, specific_types: List[Type] or None) -> List[str]:
@@ -39,22 +50,51 @@ class TypeConfig:
     def stringify_object_whitelist(cls, specific_types: List[Type] or None) -> List[str]:
         return [type.__name__ for type in TypeConfig._origins(list(set(cls._object_whitelist) & set(specific_types or cls._object_whitelist)))]
 
+    @classmethod
+    def allowed_scalar_types(cls, specific_types: List[Type] or None) -> FrozenSet[Type]:
+        """Get the (origin) types of all whitelisted scalar types that are part of the specific types"""
+        return TypeConfig._allowed_types(whitelist=cls._scalar_whitelist, specific_types=specific_types)
+    
+    @classmethod
+    def allowed_object_types(cls, specific_types: List[Type] or None) -> FrozenSet[Type]:
+        """Get the (origin) types of all whitelisted object types that are part of the specific types"""
+        return TypeConfig._allowed_types(whitelist=cls._object_whitelist, specific_types=specific_types)
+
     @classmethod
     def is_valid_scalar(cls, obj: Any, specific_types: List[Type] or None, allow_instance_of: bool = False):
-        return cls._check_whitelist(
+        return TypeConfig.is_allowed(
             obj=obj, 
-            whitelist=list(set(cls._scalar_whitelist) & set(specific_types or cls._scalar_whitelist)), 
+            allowed=cls.allowed_scalar_types(specific_types=specific_types), 
             allow_instance_of=allow_instance_of,
         )
     
     @classmethod
     def is_valid_object(cls, obj: Any, specific_types: List[Type] or None, allow_instance_of: bool = False):
-        return cls._check_whitelist(
+        return TypeConfig.is_allowed(
             obj=obj, 
-            whitelist=list(set(cls._object_whitelist) & set(specific_types or cls._object_whitelist)),
+            allowed=cls.allowed_object_types(specific_types=specific_types),
             allow_instance_of=allow_instance_of,
         )
     
+    @staticmethod
+    def is_allowed(obj: Any, allowed: FrozenSet[Type], allow_instance_of: bool) -> bool:
+        """Check the type of an object against a set of allowed types, either exactly or as an instance"""
+        return \
+            type(obj) in allowed if not allow_instance_of else \
+            any(isinstance(obj, type) for type in allowed)
+
+    @staticmethod
+    def is_type_dependent(allowed: Iterable[Type], allow_instance_of: bool) -> bool:
+        """Check if "is_allowed()" only depends on the type of the object, so it can be cached per type
+
+        Exact type checks only depend on the type. Instance checks only do if each allowed type is a 
+        plain class without a custom "__instancecheck__" (e.g. not a runtime-checkable Protocol).
+        """
+        return not allow_instance_of or all(
+            isinstance(allowed_type, type) and type(allowed_type).__instancecheck__ is type.__instancecheck__
+            for allowed_type in allowed
+        )
+    
     @staticmethod
     def no_config_checks() -> ConfigTypeCheckingFunction:
         return lambda key, parent_key, obj, scalar: None
@@ -64,10 +104,8 @@ class TypeConfig:
         return lambda key, parent_key, obj: None
 
     @staticmethod
-    def _check_whitelist(obj: Any, whitelist: List[Type], allow_instance_of: bool) -> bool:
-        return \
-            type(obj) in TypeConfig._origins(whitelist) if not allow_instance_of else \
-            any([isinstance(obj, type) for type in TypeConfig._origins(whitelist)])
+    def _allowed_types(whitelist: List[Type], specific_types: List[Type] or None) -> FrozenSet[Type]:
+        return frozenset(TypeConfig._origins(list(set(whitelist) & set(specific_types or whitelist))))
 
     @staticmethod
     def _origins(types: List[Type]) -> List[Type]:
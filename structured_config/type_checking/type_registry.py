@@ -0,0 +1,87 @@
+
+from typing import Any, Dict, FrozenSet, Iterable, List, Tuple, Type
+
+from structured_config.type_checking.type_config import TypeConfig
+
+
+class TypeRegistry:
+    """Immutable set of allowed config types
+
+    A type registry is an alternative to the process-wide whitelist in "TypeConfig". It is attached to a
+    specification with "ConfigValueBase.use_type_registry()", which binds all config type checkers of that
+    specification to the registry. Since a registry never changes, the checkers bound to it compute their
+    allowed types once, and the specification is unaffected by any later changes to "TypeConfig", or to
+    the registries of other specifications. Use "with_scalar_type()" and "without_scalar_type()" to derive
+    registries with a different type policy.
+
+    Args:
+        scalar_types (Iterable[Type]): allowed scalar config types, by default the same as in "TypeConfig"
+        object_types (Iterable[Type]): allowed object and list config types, by default the same as in "TypeConfig"
+    """
+
+    def __init__(self,
+                 scalar_types: Iterable[Type] = (str, float, bool, int),
+                 object_types: Iterable[Type] = (List[Any], Dict[str, Any])):
+        self._scalar_whitelist: Tuple[Type, ...] = tuple(scalar_types)
+        self._object_whitelist: Tuple[Type, ...] = tuple(object_types)
+        # allowed types per set of specific types, only derived from the immutable whitelists
+        self._allowed: Dict[Tuple[bool, Tuple[Type, ...]], FrozenSet[Type]] = {}
+
+    @staticmethod
+    def from_type_config() -> 'TypeRegistry':
+        """Create a registry from the current state of the "TypeConfig" whitelist"""
+        return TypeRegistry(scalar_types=TypeConfig._scalar_whitelist, object_types=TypeConfig._object_whitelist)
+
+    def scalar_types(self) -> Tuple[Type, ...]:
+        return self._scalar_whitelist
+
+    def object_types(self) -> Tuple[Type, ...]:
+        return self._object_whitelist
+
+    def with_scalar_type(self, new_type: Type) -> 'TypeRegistry':
+        """Create a copy of this registry that additionally allows a scalar type"""
+        return TypeRegistry(scalar_types=self._scalar_whitelist + (new_type,), object_types=self._object_whitelist)
+
+    def without_scalar_type(self, type: Type) -> 'TypeRegistry':
+        """Create a copy of this registry that doesn't allow a scalar type"""
+        return TypeRegistry(
+            scalar_types=[scalar_type for scalar_type in self._scalar_whitelist if scalar_type != type],
+            object_types=self._object_whitelist,
+        )
+
+    def stringify_scalar_whitelist(self, specific_types: List[Type] or None) -> List[str]:
+        return [type.__name__ for type in self.allowed_scalar_types(specific_types=specific_types)]
+
+    def stringify_object_whitelist(self, specific_types: List[Type] or None) -> List[str]:
+        return [type.__name__ for type in self.allowed_object_types(specific_types=specific_types)]
+
+    def allowed_scalar_types(self, specific_types: List[Type] or None) -> FrozenSet[Type]:
+        return self._allowed_types(scalar=True, specific_types=specific_types)
+
+    def allowed_object_types(self, specific_types: List[Type] or None) -> FrozenSet[Type]:
+        return self._allowed_types(scalar=False, specific_types=specific_types)
+
+    def is_valid_scalar(self, obj: Any, specific_types: List[Type] or None, allow_instance_of: bool = False) -> bool:
+        return TypeConfig.is_allowed(
+            obj=obj,
+            allowed=self.allowed_scalar_types(specific_types=specific_types),
+            allow_instance_of=allow_instance_of,
+        )
+
+    def is_valid_object(self, obj: Any, specific_types: List[Type] or None, allow_instance_of: bool = False) -> bool:
+        return TypeConfig.is_allowed(
+            obj=obj,
+            allowed=self.allowed_object_types(specific_types=specific_types),
+            allow_instance_of=allow_instance_of,
+        )
+
+    def _allowed_types(self, scalar: bool, specific_types: List[Type] or None) -> FrozenSet[Type]:
+        cache_key: Tuple[bool, Tuple[Type, ...]] = (scalar, tuple(specific_types or ()))
+        allowed: FrozenSet[Type] or None = self._allowed.get(cache_key, None)
+        if allowed == None:
+            allowed = TypeConfig._allowed_types(
+                whitelist=list(self._scalar_whitelist if scalar else self._object_whitelist),
+                specific_types=specific_types,
+            )
+            self._allowed[cache_key] = allowed
+        return allowed
@@ -0,0 +1,20 @@
+from typing import FrozenSet, Iterable
+from structured_config.base.typedefs import ValidatorSourceType
+from structured_config.validation.compiled_validator import CompiledValidator, guarded
+
+
+class ChoiceValidator(CompiledValidator):
+    """Require a value to be one of a fixed set of choices
+
+    The choices must be hashable, and unhashable values are invalid.
+
+    Args:
+        choices (Iterable[Any]): allowed values
+    """
+
+    def __init__(self, choices: Iterable[ValidatorSourceType]):
+        self.choices: FrozenSet[ValidatorSourceType] = frozenset(choices)
+        super().__init__(check=guarded(self.choices.__contains__))
+
+    def reason(self, data: ValidatorSourceType) -> str:
+        return f"Value '{data}' is not one of {sorted(str(choice) for choice in self.choices)}"
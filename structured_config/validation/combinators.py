@@ -0,0 +1,75 @@
+from functools import reduce
+from typing import List
+from structured_config.base.typedefs import ValidatorSourceType
+from structured_config.validation.compiled_validator import CompiledValidator, ValidatorCheckFunction
+from structured_config.validation.validator_base import ValidatorBase
+
+
+def _both(first: ValidatorCheckFunction, second: ValidatorCheckFunction) -> ValidatorCheckFunction:
+    return lambda data: first(data) and second(data)
+
+def _either(first: ValidatorCheckFunction, second: ValidatorCheckFunction) -> ValidatorCheckFunction:
+    return lambda data: first(data) or second(data)
+
+
+class AllOf(CompiledValidator):
+    """Require a value to pass all validators
+
+    The validators are checked in order, and checking stops at the first failure. Any validator may
+    be used, but only compiled validators are fused into a single check function. The combination is
+    I/O-bound if any of its validators is.
+
+    Args:
+        validators (ValidatorBase): validators to combine
+    """
+
+    def __init__(self, *validators: ValidatorBase):
+        self.validators: List[ValidatorBase] = list(validators)
+        self.io_bound: bool = any(validator.io_bound for validator in self.validators)
+        checks: List[ValidatorCheckFunction] = [CompiledValidator.check_of(validator) for validator in self.validators]
+        super().__init__(check=reduce(_both, checks) if len(checks) > 0 else lambda data: True)
+
+    def reason(self, data: ValidatorSourceType) -> str:
+        for validator in self.validators:
+            if not CompiledValidator.check_of(validator)(data):
+                return CompiledValidator.reason_of(validator, data=data)
+        return "Unknown validation failure"
+
+
+class AnyOf(CompiledValidator):
+    """Require a value to pass at least one validator
+
+    The validators are checked in order, and checking stops at the first success. Any validator may
+    be used, but only compiled validators are fused into a single check function. The combination is
+    I/O-bound if any of its validators is.
+
+    Args:
+        validators (ValidatorBase): validators to combine
+    """
+
+    def __init__(self, *validators: ValidatorBase):
+        self.validators: List[ValidatorBase] = list(validators)
+        self.io_bound: bool = any(validator.io_bound for validator in self.validators)
+        checks: List[ValidatorCheckFunction] = [CompiledValidator.check_of(validator) for validator in self.validators]
+        super().__init__(check=reduce(_either, checks) if len(checks) > 0 else lambda data: False)
+
+    def reason(self, data: ValidatorSourceType) -> str:
+        reasons: List[str] = [CompiledValidator.reason_of(validator, data=data) for validator in self.validators]
+        return f"Value '{data}' failed all alternatives: {reasons}"
+
+
+class Not(CompiledValidator):
+    """Require a value to fail a validator, I/O-bound if the validator is
+
+    Args:
+        validator (ValidatorBase): validator to invert
+    """
+
+    def __init__(self, validator: ValidatorBase):
+        self.validator: ValidatorBase = validator
+        self.io_bound: bool = validator.io_bound
+        check: ValidatorCheckFunction = CompiledValidator.check_of(validator)
+        super().__init__(check=lambda data: not check(data))
+
+    def reason(self, data: ValidatorSourceType) -> str:
+        return f"Value '{data}' must not pass '{type(self.validator).__name__}'"
@@ -0,0 +1,77 @@
+from typing import Protocol, Tuple
+from structured_config.base.typedefs import ValidatorSourceType
+from structured_config.validation.validation_exception import ValidationException
+from structured_config.validation.validator_base import ValidatorBase
+
+
+class ValidatorCheckFunction(Protocol):
+    def __call__(self, data: ValidatorSourceType) -> bool: ...
+
+
+def guarded(check: ValidatorCheckFunction) -> ValidatorCheckFunction:
+    """Treat values that can't be checked (e.g. comparing a string to a number) as invalid"""
+    def guarded_check(data: ValidatorSourceType) -> bool:
+        try:
+            return check(data)
+        except TypeError:
+            return False
+    return guarded_check
+
+
+class CompiledValidator(ValidatorBase):
+    """Validator with a precompiled check function
+
+    The check function is built once when the validator is created, and called directly for each 
+    validated value. Compiled validators are combined with "AllOf", "AnyOf", and "Not", which fuse the 
+    check functions of their validators into a single check function. The failure reason is only 
+    computed when a value is invalid. Subclasses pass their check function to the constructor, and 
+    implement "reason()".
+
+    Args:
+        check (ValidatorCheckFunction): returns "True" for valid values
+    """
+
+    def __init__(self, check: ValidatorCheckFunction):
+        super().__init__()
+        self._check: ValidatorCheckFunction = check
+
+    def __call__(self, data: ValidatorSourceType) -> ValidatorSourceType:
+        if self.cacheable:
+            return super().__call__(data=data)
+        if self._check(data):
+            return data
+        raise ValidationException(value=data, reason=self.reason(data=data))
+
+    def outcome(self, data: ValidatorSourceType) -> Tuple[bool, str or None]:
+        if self._check(data):
+            return (True, None)
+        return (False, self.reason(data=data))
+
+    def validate(self, data: ValidatorSourceType) -> bool:
+        if self._check(data):
+            return True
+        self.fail_reason = self.reason(data=data)
+        return False
+    
+    def check(self) -> ValidatorCheckFunction:
+        """Get the check function of this validator"""
+        return self._check
+
+    def reason(self, data: ValidatorSourceType) -> str:
+        """Get the failure reason for an invalid value"""
+        raise NotImplementedError()
+
+    @staticmethod
+    def check_of(validator: ValidatorBase) -> ValidatorCheckFunction:
+        """Get the check function of any validator"""
+        if isinstance(validator, CompiledValidator):
+            return validator.check()
+        return validator.validate
+
+    @staticmethod
+    def reason_of(validator: ValidatorBase, data: ValidatorSourceType) -> str:
+        """Get the failure reason of any validator for an invalid value"""
+        if isinstance(validator, CompiledValidator):
+            return validator.reason(data=data)
+        validator.validate(data=data)
+        return validator.get_fail_reason()
@@ -0,0 +1,120 @@
+import re
+from typing import Any, Dict, List, Tuple
+from structured_config.base.typedefs import ConfigObjectType
+
+# "routes[*].backend" is the same path as "routes.[*].backend"
+_WILDCARD_PATTERN: re.Pattern = re.compile(r"(?<!\.)\[\*\]")
+
+
+class CrossValidationContext:
+    """Values and indexes of one config object, shared by all of its cross validators
+
+    Paths are dotted paths relative to the object, with "[*]" for all elements of a list, e.g. 
+    "backends.[*].name" (or "backends[*].name"). Path parts address dictionary keys, or the attributes
+    of other objects (e.g. dataclasses). Each path is resolved once per context, and each index is built
+    once, no matter how many validators use it. Missing keys and values of the wrong type are skipped, 
+    they are reported by the type checks of the specification. The concrete paths of the values start 
+    with the path of the object.
+
+    Indexes are keyed by "CrossValidationContext.index_key()", the type and value, so equal values of 
+    different types (e.g. "1" and "True") are different index entries.
+
+    Args:
+        data (ConfigObjectType): converted object data
+        path (str): dotted path of the object, optional
+    """
+
+    def __init__(self, data: ConfigObjectType, path: str = ""):
+        self._data: ConfigObjectType = data
+        self._path: str = path
+        self._values: Dict[str, List[Any]] = {}
+        self._paths: Dict[str, List[str]] = {}
+        self._indexes: Dict[str, Dict[Tuple[type, Any], int]] = {}
+
+    def values(self, path: str) -> List[Any]:
+        """Get all values at a path"""
+        values: List[Any] or None = self._values.get(path, None)
+        if values == None:
+            values = self._resolve(parts=CrossValidationContext.parts(path=path))
+            self._values[path] = values
+        return values
+    
+    def paths(self, path: str) -> List[str]:
+        """Get the concrete paths of all values at a path, e.g. "backends.[3].name"
+        
+        Concrete paths are only needed to report violations, so they are resolved separately.
+        """
+        paths: List[str] or None = self._paths.get(path, None)
+        if paths == None:
+            paths = self._resolve_paths(parts=CrossValidationContext.parts(path=path))
+            self._paths[path] = paths
+        return paths
+
+    def index(self, path: str) -> Dict[Tuple[type, Any], int]:
+        """Get a hash index of all hashable values at a path, mapping each index key to its first position"""
+        index: Dict[Tuple[type, Any], int] or None = self._indexes.get(path, None)
+        if index == None:
+            index = {}
+            for position, value in enumerate(self.values(path=path)):
+                try:
+                    index.setdefault(CrossValidationContext.index_key(value=value), position)
+                except TypeError:
+                    continue
+            self._indexes[path] = index
+        return index
+
+    @staticmethod
+    def index_key(value: Any) -> Tuple[type, Any]:
+        """Get the index key of a value, raises a "TypeError" for unhashable values"""
+        key: Tuple[type, Any] = (type(value), value)
+        hash(key)
+        return key
+
+    @staticmethod
+    def parts(path: str) -> List[str]:
+        return [part for part in _WILDCARD_PATTERN.sub(".[*]", path).split(".") if len(part) > 0]
+
+    def _resolve(self, parts: List[str]) -> List[Any]:
+        # breadth-first over the path parts, without recursion
+        current: List[Any] = [self._data]
+        for part in parts:
+            following: List[Any] = []
+            for value in current:
+                if part == "[*]":
+                    if type(value) is list:
+                        following.extend(value)
+                else:
+                    following.extend(CrossValidationContext._child(value=value, part=part))
+            current = following
+        return current
+
+    def _resolve_paths(self, parts: List[str]) -> List[str]:
+        # same as above, but with the concrete path of each value
+        current: List[Tuple[str, Any]] = [(self._path, self._data)]
+        for part in parts:
+            following: List[Tuple[str, Any]] = []
+            for concrete_path, value in current:
+                if part == "[*]":
+                    if type(value) is list:
+                        following.extend(
+                            (self._extend(path=concrete_path, part=f"[{i}]"), element) for i, element in enumerate(value)
+                        )
+                else:
+                    following.extend(
+                        (self._extend(path=concrete_path, part=part), child) 
+                        for child in CrossValidationContext._child(value=value, part=part)
+                    )
+            current = following
+        return [concrete_path for concrete_path, _ in current]
+
+    @staticmethod
+    def _child(value: Any, part: str) -> List[Any]:
+        # dictionary keys, or instance attributes of converted objects
+        if type(value) is dict:
+            return [value[part]] if part in value else []
+        elif type(value) is not list and hasattr(value, "__dict__") and part in vars(value):
+            return [vars(value)[part]]
+        return []
+
+    def _extend(self, path: str, part: str) -> str:
+        return f"{path}.{part}" if len(path) > 0 else part
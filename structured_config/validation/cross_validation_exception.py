@@ -0,0 +1,13 @@
+from typing import List
+from structured_config.validation.cross_validator_base import CrossValidationViolation
+from structured_config.validation.validation_exception import ValidationException
+
+
+class CrossValidationException(ValidationException):
+
+    def __init__(self, object_key: str, violations: List[CrossValidationViolation]):
+        self.violations: List[CrossValidationViolation] = violations
+        super().__init__(
+            value=object_key,
+            reason=f"{len(violations)} cross validation violation(s):\n" + "\n".join(str(violation) for violation in violations),
+        )
@@ -0,0 +1,29 @@
+from dataclasses import dataclass
+from typing import Any, List
+from structured_config.validation.cross_validation_context import CrossValidationContext
+
+
+@dataclass
+class CrossValidationViolation:
+    path: str
+    value: Any
+    reason: str
+
+    def __str__(self) -> str:
+        return f"'{self.path}' = '{self.value}': {self.reason}"
+
+
+class CrossValidatorBase:
+    """Base class for validators that check relations between several values of a config object
+
+    Cross validators are attached to an object config value, and run after all of its children were 
+    converted, before the converter of the object itself. They check the converted children, so defaults
+    are applied and scalars have their converted types. Paths are relative to the object and use the 
+    target-case keys of the converted children, nested objects that were converted to other types (e.g.
+    dataclasses) are accessed by their attributes. Validators return all violations instead of failing at
+    the first one. Use the context to resolve paths and to get hash indexes, these are shared by all cross
+    validators of the object.
+    """
+
+    def validate(self, context: CrossValidationContext) -> List[CrossValidationViolation]:
+        raise NotImplementedError()
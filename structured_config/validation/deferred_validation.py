@@ -0,0 +1,123 @@
+import threading
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from typing import Any, Dict, List
+from structured_config.base.typedefs import ValidatorSourceType
+from structured_config.validation.compiled_validator import CompiledValidator
+from structured_config.validation.validation_exception import ValidationException
+from structured_config.validation.validator_base import ValidatorBase
+
+
+@dataclass
+class DeferredValidationFailure:
+    path: str
+    value: Any
+    reason: str
+
+    def __str__(self) -> str:
+        return f"'{self.path}' = '{self.value}': {self.reason}"
+
+
+class DeferredValidationException(ValidationException):
+
+    def __init__(self, failures: List[DeferredValidationFailure]):
+        self.failures: List[DeferredValidationFailure] = failures
+        super().__init__(
+            value=f"{len(failures)} value(s)",
+            reason="I/O-bound validation failed:\n" + "\n".join(str(failure) for failure in failures),
+        )
+
+
+@dataclass
+class _DeferredCheck:
+    validator: ValidatorBase
+    data: ValidatorSourceType
+    path: str
+
+
+# deferred validation of the conversion running in the current thread or task
+_active: ContextVar['DeferredValidation or None'] = ContextVar("structured_config_deferred_validation", default=None)
+
+
+class DeferredValidation:
+    """Collect I/O-bound validations during a conversion, and run them concurrently afterwards
+
+    While a deferred validation is active, scalar values pass their value to "defer()" instead of 
+    calling I/O-bound validators (see "ValidatorBase.io_bound"). The values are validated by "run()",
+    on a thread pool, or by "run_async()", in threads awaited by the running event loop. All failures
+    are collected and raised together, with the paths of the failed values. Other validators are not
+    affected. Compiled validators are run fully in parallel, other validators keep their failure 
+    reason in the validator object, so each of them only validates one value at a time.
+
+        with DeferredValidation() as deferred:
+            output = spec.convert(input=data)
+        deferred.run()
+
+    Args:
+        max_workers (int or None): maximum number of threads, by default chosen by the thread pool
+    """
+
+    def __init__(self, max_workers: int or None = None):
+        self._max_workers: int or None = max_workers
+        self._checks: List[_DeferredCheck] = []
+        self._locks: Dict[int, threading.Lock] = {}
+        self._token: Token or None = None
+
+    def __enter__(self) -> 'DeferredValidation':
+        self._token = _active.set(self)
+        return self
+
+    def __exit__(self, *args):
+        _active.reset(self._token)
+        self._token = None
+
+    @staticmethod
+    def current() -> 'DeferredValidation or None':
+        """Get the active deferred validation, if there is any"""
+        return _active.get()
+
+    def defer(self, validator: ValidatorBase, data: ValidatorSourceType, path: str):
+        self._checks.append(_DeferredCheck(validator=validator, data=data, path=path))
+        if not isinstance(validator, CompiledValidator) and id(validator) not in self._locks:
+            self._locks[id(validator)] = threading.Lock()
+
+    def pending(self) -> int:
+        return len(self._checks)
+
+    def run(self):
+        """Run all deferred validations on a thread pool, and raise all failures"""
+        if len(self._checks) == 0:
+            return
+        # imported on use, since most conversions never run deferred validations
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            results: List[DeferredValidationFailure or None] = list(executor.map(self._check, self._checks))
+        self._finish(results=results)
+
+    async def run_async(self):
+        """Run all deferred validations in threads awaited by the running event loop, and raise all failures"""
+        import asyncio
+        results: List[DeferredValidationFailure or None] = list(await asyncio.gather(
+            *[asyncio.to_thread(self._check, check) for check in self._checks]
+        ))
+        self._finish(results=results)
+
+    def _finish(self, results: List['DeferredValidationFailure or None']):
+        self._checks = []
+        failures: List[DeferredValidationFailure] = [result for result in results if result != None]
+        if len(failures) > 0:
+            raise DeferredValidationException(failures=failures)
+
+    def _check(self, check: _DeferredCheck) -> DeferredValidationFailure or None:
+        try:
+            # compiled validators don't store any state while validating
+            if isinstance(check.validator, CompiledValidator):
+                if check.validator.check()(check.data):
+                    return None
+                return DeferredValidationFailure(path=check.path, value=check.data, reason=check.validator.reason(data=check.data))
+            with self._locks[id(check.validator)]:
+                if check.validator.validate(data=check.data):
+                    return None
+                return DeferredValidationFailure(path=check.path, value=check.data, reason=check.validator.get_fail_reason())
+        except Exception as error:
+            return DeferredValidationFailure(path=check.path, value=check.data, reason=f"{type(error).__name__}: {error}")
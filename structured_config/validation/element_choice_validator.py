@@ -0,0 +1,36 @@
+from structured_config.base.typedefs import ConversionTargetType
+from structured_config.validation.element_validator_base import ElementValidatorBase
+from typing import FrozenSet, Iterable, List
+
+
+class ElementChoiceValidator(ElementValidatorBase):
+    """Require all list elements to be one of a fixed set of choices
+
+    The choices must be hashable. The list is checked with a single set operation, and unhashable
+    elements are invalid. The list count limits are the same as in "ListValidator".
+
+    Args:
+        choices (Iterable[Any]): allowed element values
+    """
+
+    def __init__(self, choices: Iterable[ConversionTargetType], **count_limits):
+        super().__init__(**count_limits)
+        self.choices: FrozenSet[ConversionTargetType] = frozenset(choices)
+
+    def validate(self, values: List[ConversionTargetType]) -> bool:
+        try:
+            return self.choices.issuperset(values)
+        except TypeError:
+            return False
+
+    def find_invalid(self, values: List[ConversionTargetType]) -> int or None:
+        for index, value in enumerate(values):
+            try:
+                if value not in self.choices:
+                    return index
+            except TypeError:
+                return index
+        return None
+
+    def describe_elements(self) -> str:
+        return f"must be one of {sorted(str(choice) for choice in self.choices)}"
@@ -0,0 +1,96 @@
+import operator
+from structured_config.base.typedefs import ConversionTargetType
+from structured_config.validation.element_validator_base import ElementValidatorBase
+from typing import List
+
+# NumPy is optional, it's only used to speed up checks of long numeric lists
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# shorter lists are checked in Python, since creating an array isn't worth it
+NUMPY_MIN_LENGTH: int = 1024
+
+
+class ElementRangeValidator(ElementValidatorBase):
+    """Require all list elements to be within a range
+
+    Either limit may be omitted, and each limit may be exclusive. Elements that can't be compared 
+    to the limits, and NaN values, are invalid. Without NumPy, the smallest and largest elements are 
+    compared to the limits. With NumPy, long numeric lists are compared as arrays instead. The list 
+    count limits are the same as in "ListValidator".
+
+    Args:
+        min (Any or None): lower element limit, optional
+        max (Any or None): upper element limit, optional
+        min_exclusive (bool): should min be exclusive, defaults to False
+        max_exclusive (bool): should max be exclusive, defaults to False
+    """
+
+    def __init__(self, 
+                 min: ConversionTargetType or None = None,
+                 max: ConversionTargetType or None = None,
+                 min_exclusive: bool = False,
+                 max_exclusive: bool = False,
+                 **count_limits):
+        super().__init__(**count_limits)
+        self.min_element: ConversionTargetType or None = min
+        self.max_element: ConversionTargetType or None = max
+        self.min_element_exclusive: bool = min_exclusive
+        self.max_element_exclusive: bool = max_exclusive
+        # "min < element" or "min <= element", and "element < max" or "element <= max"
+        self._above = operator.lt if min_exclusive else operator.le
+        self._below = operator.lt if max_exclusive else operator.le
+
+    def validate(self, values: List[ConversionTargetType]) -> bool:
+        if len(values) == 0:
+            return True
+        if numpy != None and len(values) >= NUMPY_MIN_LENGTH:
+            valid: bool or None = self._validate_array(values=values)
+            if valid != None:
+                return valid
+        try:
+            # NaN isn't equal to itself, and it breaks min() and max()
+            return \
+                (self.min_element == None or self._above(self.min_element, min(values))) and \
+                (self.max_element == None or self._below(max(values), self.max_element)) and \
+                all(map(operator.eq, values, values))
+        except TypeError:
+            return False
+
+    def find_invalid(self, values: List[ConversionTargetType]) -> int or None:
+        for index, value in enumerate(values):
+            try:
+                if value != value or \
+                   (self.min_element != None and not self._above(self.min_element, value)) or \
+                   (self.max_element != None and not self._below(value, self.max_element)):
+                    return index
+            except TypeError:
+                return index
+        return None
+
+    def describe_elements(self) -> str:
+        lower_bound: str = "(" if self.min_element_exclusive else "["
+        upper_bound: str = ")" if self.max_element_exclusive else "]"
+        lower: str = "-inf" if self.min_element == None else str(self.min_element)
+        upper: str = "inf" if self.max_element == None else str(self.max_element)
+        return f"must be in {lower_bound}{lower}, {upper}{upper_bound}"
+
+    def _validate_array(self, values: List[ConversionTargetType]) -> bool or None:
+        # only lists of numbers (and booleans) are checked as arrays
+        try:
+            array = numpy.asarray(values)
+        except (ValueError, TypeError, OverflowError):
+            return None
+        if array.dtype.kind not in "biuf":
+            return None
+        # comparisons with NaN are always false, so NaN elements are invalid
+        valid = numpy.ones(array.shape, dtype=bool)
+        if self.min_element != None:
+            valid &= self._above(self.min_element, array)
+        if self.max_element != None:
+            valid &= self._below(array, self.max_element)
+        if self.min_element == None and self.max_element == None:
+            valid &= array == array
+        return bool(valid.all())
@@ -0,0 +1,38 @@
+import re
+from structured_config.base.typedefs import ConversionTargetType
+from structured_config.validation.element_validator_base import ElementValidatorBase
+from typing import List
+
+
+class ElementRegexValidator(ElementValidatorBase):
+    """Require all list elements to be strings matching a regular expression
+
+    The pattern is compiled once. By default, the entire string must match, otherwise only its 
+    beginning. The list count limits are the same as in "ListValidator".
+
+    Args:
+        pattern (str or re.Pattern): regular expression
+        fullmatch (bool): must the entire string match, defaults to True
+    """
+
+    def __init__(self, pattern: str or re.Pattern, fullmatch: bool = True, **count_limits):
+        super().__init__(**count_limits)
+        self.pattern: re.Pattern = re.compile(pattern)
+        self.fullmatch: bool = fullmatch
+        self._match = self.pattern.fullmatch if fullmatch else self.pattern.match
+
+    def validate(self, values: List[ConversionTargetType]) -> bool:
+        # non-string elements raise a type error in the pattern
+        try:
+            return all(map(self._match, values))
+        except TypeError:
+            return False
+
+    def find_invalid(self, values: List[ConversionTargetType]) -> int or None:
+        for index, value in enumerate(values):
+            if type(value) is not str or self._match(value) == None:
+                return index
+        return None
+
+    def describe_elements(self) -> str:
+        return f"must match format '{self.pattern.pattern}'"
@@ -0,0 +1,60 @@
+from structured_config.base.typedefs import ConversionTargetType
+from structured_config.validation.list_validator import ListValidator
+from structured_config.validation.validation_exception import ValidationException
+from typing import List
+
+
+class ElementValidatorBase(ListValidator):
+    """List validator that checks all list elements in one batch
+
+    Element validators check the converted list elements in addition to the list count limits. 
+    "validate()" checks the entire list at once (e.g. using built-in functions that iterate the 
+    list in C), and only if that fails, "find_invalid()" searches the first invalid element to 
+    report it. Subclasses implement both methods, and "describe_elements()" for the specification.
+
+    Args:
+        min_count (int or None): list min count, optional
+        max_count (int or None): list max count, optional
+        min_exclusive (bool): should min be exclusive, defaults to False
+        max_exclusive (bool): should max be exclusive, defaults to False
+        strict_count (int or None): exact required list count, optional
+    """
+
+    def __init__(self, 
+                 min_count: int or None = None,
+                 min_exclusive: bool = False,
+                 max_count: int or None = None,
+                 max_exclusive: bool = False,
+                 strict_count: int or None = None):
+        super().__init__(
+            min_count=min_count, 
+            min_exclusive=min_exclusive, 
+            max_count=max_count, 
+            max_exclusive=max_exclusive, 
+            strict_count=strict_count,
+        )
+
+    def __call__(self, values: List[ConversionTargetType]) -> List[ConversionTargetType]:
+        # the count limits are reported as before
+        if not self._limits(values=values):
+            return super().__call__(values=values)
+        if not self.validate(values=values):
+            # only the invalid element is reported, the list may be very long
+            index: int or None = self.find_invalid(values=values)
+            raise ValidationException(
+                value=values[index] if index != None else f"list of length {len(values)}",
+                reason=f"List element [{index}] is invalid: elements {self.describe_elements()}",
+            )
+        return values
+
+    def find_invalid(self, values: List[ConversionTargetType]) -> int or None:
+        """Find the index of the first invalid element, after "validate()" failed"""
+        raise NotImplementedError()
+    
+    def describe_elements(self) -> str:
+        """Describe the element requirements"""
+        raise NotImplementedError()
+
+    def specify(self) -> str:
+        limits: str = super().specify().strip()
+        return f" {limits}, list elements {self.describe_elements()}" if limits else f" list elements {self.describe_elements()}"
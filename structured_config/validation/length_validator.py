@@ -0,0 +1,46 @@
+from structured_config.base.typedefs import ValidatorSourceType
+from structured_config.validation.compiled_validator import CompiledValidator, ValidatorCheckFunction, guarded
+
+
+class LengthValidator(CompiledValidator):
+    """Require the length of a value (e.g. a string) to be within limits
+
+    Either limit may be omitted, or an exact length may be required instead. Values without a length
+    are invalid.
+
+    Args:
+        min_length (int or None): minimum length, optional
+        max_length (int or None): maximum length, optional
+        strict_length (int or None): exact length, optional
+    """
+
+    def __init__(self, 
+                 min_length: int or None = None, 
+                 max_length: int or None = None, 
+                 strict_length: int or None = None):
+        self.min: int or None = min_length
+        self.max: int or None = max_length
+        self.strict: int or None = strict_length
+        super().__init__(check=guarded(self._compile()))
+
+    def reason(self, data: ValidatorSourceType) -> str:
+        if not hasattr(data, "__len__"):
+            return f"Value '{data}' of type '{type(data).__name__}' has no length"
+        elif self.strict != None:
+            return f"Value '{data}' must have length {self.strict}"
+        return f"Value '{data}' must have a length in [{self.min or 0}, {'inf' if self.max == None else self.max}]"
+
+    def _compile(self) -> ValidatorCheckFunction:
+        strict = self.strict
+        min = self.min
+        max = self.max
+        if strict != None:
+            return lambda data: len(data) == strict
+        elif min != None and max != None:
+            return lambda data: min <= len(data) <= max
+        elif min != None:
+            return lambda data: min <= len(data)
+        elif max != None:
+            return lambda data: len(data) <= max
+        else:
+            return lambda data: len(data) >= 0
@@ -0,0 +1,52 @@
+import os
+from enum import Enum
+from structured_config.base.typedefs import ValidatorSourceType
+from structured_config.validation.compiled_validator import CompiledValidator
+
+
+class PathKind(Enum):
+    Any = 0
+    File = 1
+    Directory = 2
+
+
+class PathExistsValidator(CompiledValidator):
+    """Require a path to exist
+
+    This validator accesses the file system, so it's I/O-bound: during a deferred conversion, it runs
+    concurrently with all other I/O-bound validators once the config is converted.
+
+    Args:
+        kind (PathKind): required kind of path, by default files and directories are allowed
+        readable (bool): must the path be readable, defaults to False
+    """
+
+    io_bound: bool = True
+
+    def __init__(self, kind: PathKind = PathKind.Any, readable: bool = False):
+        self.kind: PathKind = kind
+        self.readable: bool = readable
+        super().__init__(check=self._exists)
+
+    def reason(self, data: ValidatorSourceType) -> str:
+        if not isinstance(data, (str, os.PathLike)):
+            return f"Data must be a path but is '{type(data).__name__}'"
+        elif not self._is_kind(path=data):
+            return f"Path '{data}' is not an existing {self._kind_name()}"
+        return f"Path '{data}' is not readable"
+
+    def _exists(self, data: ValidatorSourceType) -> bool:
+        return \
+            isinstance(data, (str, os.PathLike)) and \
+            self._is_kind(path=data) and \
+            (not self.readable or os.access(data, os.R_OK))
+
+    def _is_kind(self, path: str or os.PathLike) -> bool:
+        if self.kind == PathKind.File:
+            return os.path.isfile(path)
+        elif self.kind == PathKind.Directory:
+            return os.path.isdir(path)
+        return os.path.exists(path)
+
+    def _kind_name(self) -> str:
+        return {PathKind.File: "file", PathKind.Directory: "directory"}.get(self.kind, "path")
@@ -0,0 +1,50 @@
+import operator
+from structured_config.base.typedefs import ValidatorSourceType
+from structured_config.validation.compiled_validator import CompiledValidator, ValidatorCheckFunction, guarded
+
+
+class RangeValidator(CompiledValidator):
+    """Require a value to be within a range
+
+    Either limit may be omitted, and each limit may be exclusive. Values that can't be compared to
+    the limits are invalid.
+
+    Args:
+        min (Any or None): lower limit, optional
+        max (Any or None): upper limit, optional
+        min_exclusive (bool): should min be exclusive, defaults to False
+        max_exclusive (bool): should max be exclusive, defaults to False
+    """
+
+    def __init__(self, 
+                 min: ValidatorSourceType or None = None, 
+                 max: ValidatorSourceType or None = None,
+                 min_exclusive: bool = False, 
+                 max_exclusive: bool = False):
+        self.min: ValidatorSourceType or None = min
+        self.max: ValidatorSourceType or None = max
+        self.min_exclusive: bool = min_exclusive
+        self.max_exclusive: bool = max_exclusive
+        super().__init__(check=guarded(self._compile()))
+
+    def reason(self, data: ValidatorSourceType) -> str:
+        lower_bound: str = "(" if self.min_exclusive else "["
+        upper_bound: str = ")" if self.max_exclusive else "]"
+        lower: str = "-inf" if self.min == None else str(self.min)
+        upper: str = "inf" if self.max == None else str(self.max)
+        return f"Value '{data}' is not in range {lower_bound}{lower}, {upper}{upper_bound}"
+
+    def _compile(self) -> ValidatorCheckFunction:
+        # "min < data" or "min <= data", and "data < max" or "data <= max"
+        above = operator.lt if self.min_exclusive else operator.le
+        below = operator.lt if self.max_exclusive else operator.le
+        min = self.min
+        max = self.max
+        if min != None and max != None:
+            return lambda data: above(min, data) and below(data, max)
+        elif min != None:
+            return lambda data: above(min, data)
+        elif max != None:
+            return lambda data: below(data, max)
+        else:
+            return lambda data: True
@@ -0,0 +1,43 @@
+from typing import Any, Dict, List, Tuple
+from structured_config.validation.cross_validation_context import CrossValidationContext
+from structured_config.validation.cross_validator_base import CrossValidationViolation, CrossValidatorBase
+
+
+class ReferenceValidator(CrossValidatorBase):
+    """Require all values at a path to reference an existing value at another path
+
+    For example, "ReferenceValidator(reference="routes[*].backend", target="backends[*].name")" requires 
+    each route to name an existing backend. The targets are indexed once, so each reference is checked 
+    in constant time. References only match targets of the same type.
+
+    Args:
+        reference (str): dotted path of the referencing values, relative to the validated object
+        target (str): dotted path of the referenced values, relative to the validated object
+    """
+
+    def __init__(self, reference: str, target: str):
+        self.reference: str = reference
+        self.target: str = target
+
+    def validate(self, context: CrossValidationContext) -> List[CrossValidationViolation]:
+        targets: Dict[Tuple[type, Any], int] = context.index(path=self.target)
+        values: List[Any] = context.values(path=self.reference)
+        try:
+            # all references are hashable and found
+            if targets.keys() >= {CrossValidationContext.index_key(value=value) for value in values}:
+                return []
+        except TypeError:
+            pass
+        
+        paths: List[str] = context.paths(path=self.reference)
+        violations: List[CrossValidationViolation] = []
+        for position, value in enumerate(values):
+            try:
+                found: bool = CrossValidationContext.index_key(value=value) in targets
+            except TypeError:
+                found = False
+            if not found:
+                violations.append(CrossValidationViolation(
+                    path=paths[position], value=value, reason=f"no matching value at '{self.target}'"
+                ))
+        return violations
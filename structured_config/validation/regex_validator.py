@@ -0,0 +1,26 @@
+import re
+from structured_config.base.typedefs import ValidatorSourceType
+from structured_config.validation.compiled_validator import CompiledValidator
+
+
+class RegexValidator(CompiledValidator):
+    """Require a string to match a regular expression
+
+    The pattern is compiled once. By default, the entire string must match, otherwise only its 
+    beginning. Values that aren't strings are invalid.
+
+    Args:
+        pattern (str or re.Pattern): regular expression
+        fullmatch (bool): must the entire string match, defaults to True
+    """
+
+    def __init__(self, pattern: str or re.Pattern, fullmatch: bool = True):
+        self.pattern: re.Pattern = re.compile(pattern)
+        self.fullmatch: bool = fullmatch
+        match = self.pattern.fullmatch if fullmatch else self.pattern.match
+        super().__init__(check=lambda data: type(data) is str and match(data) != None)
+
+    def reason(self, data: ValidatorSourceType) -> str:
+        if type(data) is not str:
+            return f"Data must be 'str' but is '{type(data).__name__}'"
+        return f"String '{data}' does not match format '{self.pattern.pattern}'"
@@ -10,17 +10,19 @@ class StrFormatValidator(ValidatorBase):
     def __init__(self, format: str, fullmatch: bool = True):
         self.format: str = format
         self.fullmatch: bool = fullmatch
+        # compile the pattern once, instead of looking it up on every call
+        self._pattern: re.Pattern = re.compile(format)
         super().__init__()
 
     def validate(self, data: ValidatorSourceType) -> bool:
         if type(data) is not str:
             self.fail_reason = f"Data must be 'str' but is '{type(data).__name__}'"
             return False
-        elif not re.fullmatch(pattern=self.format, string=data):
-            self.fail_reason = f"String '{data}' does not match format '{self.format}"
+        elif not self._match(data=data):
+            self.fail_reason = f"String '{data}' does not match format '{self.format}'"
             return False
 
         return True
     
     def _match(self, data: str) -> bool:
-        return bool(re.fullmatch(pattern=self.format, string=data) if self.fullmatch else re.match(pattern=self.format, string=data))
\ No newline at end of file
+        return (self._pattern.fullmatch(data) if self.fullmatch else self._pattern.match(data)) != None
@@ -0,0 +1,37 @@
+from structured_config.base.typedefs import ConversionTargetType
+from structured_config.validation.element_validator_base import ElementValidatorBase
+from typing import Any, List, Set
+
+
+class UniqueElementsValidator(ElementValidatorBase):
+    """Require all list elements to be unique
+
+    Hashable elements are compared with a single set operation, lists with unhashable elements are
+    compared pairwise. The list count limits are the same as in "ListValidator".
+    """
+
+    def __init__(self, **count_limits):
+        super().__init__(**count_limits)
+
+    def validate(self, values: List[ConversionTargetType]) -> bool:
+        try:
+            return len(set(values)) == len(values)
+        except TypeError:
+            return self.find_invalid(values=values) == None
+
+    def find_invalid(self, values: List[ConversionTargetType]) -> int or None:
+        seen: Set[Any] = set()
+        unhashable: List[Any] = []
+        for index, value in enumerate(values):
+            try:
+                if value in seen:
+                    return index
+                seen.add(value)
+            except TypeError:
+                if value in unhashable:
+                    return index
+                unhashable.append(value)
+        return None
+
+    def describe_elements(self) -> str:
+        return "must be unique"
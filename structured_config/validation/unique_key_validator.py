@@ -0,0 +1,38 @@
+from typing import Any, Dict, List, Tuple
+from structured_config.validation.cross_validation_context import CrossValidationContext
+from structured_config.validation.cross_validator_base import CrossValidationViolation, CrossValidatorBase
+
+
+class UniqueKeyValidator(CrossValidatorBase):
+    """Require all values at a path to be unique, e.g. "backends[*].name"
+
+    Each repeated value is reported together with the path of its first occurrence. Equal values of 
+    different types (e.g. "1" and "True") are not duplicates.
+
+    Args:
+        path (str): dotted path relative to the validated object, "[*]" addresses all list elements
+    """
+
+    def __init__(self, path: str):
+        self.path: str = path
+
+    def validate(self, context: CrossValidationContext) -> List[CrossValidationViolation]:
+        values: List[Any] = context.values(path=self.path)
+        first: Dict[Tuple[type, Any], int] = context.index(path=self.path)
+        # all values are unique if each of them has its own index entry
+        if len(first) == len(values):
+            return []
+        
+        paths: List[str] = context.paths(path=self.path)
+        violations: List[CrossValidationViolation] = []
+        for position, value in enumerate(values):
+            try:
+                first_position: int = first[CrossValidationContext.index_key(value=value)]
+            except TypeError:
+                violations.append(CrossValidationViolation(path=paths[position], value=value, reason="value is not hashable"))
+                continue
+            if first_position != position:
+                violations.append(CrossValidationViolation(
+                    path=paths[position], value=value, reason=f"duplicate of '{paths[first_position]}'"
+                ))
+        return violations
@@ -1,5 +1,6 @@
 
-from typing import TypeVar
+from typing import Tuple, TypeVar
+from structured_config.base.result_cache import ResultCache
 from structured_config.validation.validation_exception import ValidationException
 from structured_config.base.typedefs import ValidatorSourceType
 from enum import Enum
@@ -12,15 +13,46 @@ class ValidatorPhase(Enum):
     NoValidation = 2
 
 class ValidatorBase:
+    """Base class for scalar validators
+
+    Validators that are slow because they access external state (e.g. check if a file exists) should
+    set "io_bound" to "True". During a deferred conversion (see "DeferredValidation"), these validators 
+    aren't run when their value is converted, but concurrently once the entire config is converted.
+
+    Validators that are expensive, and always produce the same result for the same value, may set 
+    "cacheable" to "True" (or call "set_cacheable()"). Their results, including failures, are then 
+    cached per value in a "ResultCache".
+    """
+
+    # run concurrently at the end of a deferred conversion
+    io_bound: bool = False
+    # cache results per value
+    cacheable: bool = False
+    # cache of cacheable validators, "None" for the shared cache
+    result_cache: ResultCache or None = None
 
     def __init__(self, fail_reason: str = "Unknown validation failure"):
         self.fail_reason = fail_reason
 
     def __call__(self, data: ValidatorSourceType) -> ValidatorSourceType:
-        if not self.validate(data=data):
-            raise ValidationException(value=data, reason=self.get_fail_reason())
+        valid, reason = self.outcome(data=data) if not self.cacheable else \
+            (self.result_cache or ResultCache.shared()).call(owner=self, value=data, compute=lambda: self.outcome(data=data))
+        if not valid:
+            raise ValidationException(value=data, reason=reason)
         else:
             return data
+        
+    def set_cacheable(self, cacheable: bool = True, cache: ResultCache or None = None) -> 'ValidatorBase':
+        """Enable or disable result caching for this validator, optionally with its own cache"""
+        self.cacheable = cacheable
+        self.result_cache = cache
+        return self
+
+    def outcome(self, data: ValidatorSourceType) -> Tuple[bool, str or None]:
+        """Validate a value, and get the failure reason if it's invalid"""
+        if not self.validate(data=data):
+            return (False, self.get_fail_reason())
+        return (True, None)
 
     def get_fail_reason(self) -> str:
         return self.fail_reason
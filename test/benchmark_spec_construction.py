@@ -0,0 +1,72 @@
+"""Benchmark the construction of large specifications
+
+Builds an object of nested objects with typed and untyped scalars, lists, and requirements, and
+prints the construction time for 1k, 10k and 100k values. Run with:
+
+    PYTHONPATH=. python test/benchmark_spec_construction.py [repetitions]
+"""
+import sys
+import time
+from dataclasses import dataclass
+from typing import List
+
+from structured_config import Config, ListEntry, MakeRequirements, ObjectEntry, ScalarEntry
+
+# values per nested object
+GROUP_SIZE: int = 10
+SIZES: List[int] = [1_000, 10_000, 100_000]
+
+
+@dataclass
+class Group:
+    name: str
+    count: int
+    ratio: float
+    enabled: bool
+    label: str
+    tags: List[str]
+    level: int
+    weight: float
+    note: str
+    extra: str
+
+
+def _group(index: int) -> ObjectEntry:
+    return ObjectEntry.typed(
+        name=f"group_{index}",
+        cast_to=Group,
+        entries=[
+            ScalarEntry.make(name="name", type=str),
+            ScalarEntry.typed(name="count", cast_to=int, type=int),
+            ScalarEntry.typed(name="ratio", cast_to=float, type=[int, float]),
+            ScalarEntry.make(name="enabled", type=bool),
+            ScalarEntry.make(name="label"),
+            ListEntry.make(name="tags", elements=Config.scalar(type=str)),
+            ScalarEntry.typed(name="level", cast_to=int),
+            ScalarEntry.make(name="weight", type=[int, float]),
+            ScalarEntry.make(name="note", type=str),
+            ScalarEntry.make(name="extra"),
+        ],
+        requirements=MakeRequirements.mixed(
+            required=["name", "count"],
+            defaults={"ratio": 1.0, "enabled": True, "label": "", "tags": [], "level": 0, "weight": 1, "note": "", "extra": ""},
+        ),
+    )
+
+
+def build(values: int):
+    return Config.object(entries=[_group(index=index) for index in range(values // GROUP_SIZE)])
+
+
+def main(repetitions: int):
+    for size in SIZES:
+        timings: List[float] = []
+        for _ in range(repetitions):
+            start: float = time.perf_counter()
+            build(values=size)
+            timings.append(time.perf_counter() - start)
+        print(f"{size:>8} values: {min(timings):.3f}s (best of {repetitions})")
+
+
+if __name__ == "__main__":
+    main(repetitions=int(sys.argv[1]) if len(sys.argv) > 1 else 3)
@@ -0,0 +1,121 @@
+import copy
+import random
+
+import pytest
+
+from structured_config import Assignment, Mapper, Override
+from structured_config.io.overrides.invalid_override_specification_exception import InvalidOverrideSpecificationException
+
+
+def _apply(overrides, data):
+    return Assignment(overrides=[Override(key=key, value=value) for key, value in overrides], data=data).apply()
+
+
+def _apply_one_by_one(overrides, data):
+    # every override on its own, as overrides were applied before they were grouped by prefix
+    for key, value in overrides:
+        data = _apply(overrides=[(key, value)], data=data)
+    return data
+
+
+def _outcome(function, overrides, data):
+    try:
+        return function(overrides=overrides, data=copy.deepcopy(data))
+    except Exception as error:
+        return type(error)
+
+
+def test_last_writer_wins():
+    assert _apply(overrides=[("a.b", 1), ("a.c", 2), ("a.b", 3)], data={}) == {"a": {"b": 3, "c": 2}}
+    assert _apply(overrides=[("l.[0]", 1), ("l.[0]", 2)], data={"l": [0]}) == {"l": [2]}
+
+
+def test_value_assignment_after_nested_override_replaces_it():
+    assert _apply(overrides=[("a.b.c", 1), ("a.b", 2)], data={}) == {"a": {"b": 2}}
+
+
+def test_every_add_creates_an_element():
+    data = _apply(overrides=[("l.+.x", 1), ("l.[-1].y", 2), ("l.+.x", 3), ("l.[-1].y", 4)], data={"l": []})
+    assert data == {"l": [{"x": 1, "y": 2}, {"x": 3, "y": 4}]}
+
+
+def test_mapper_applies_add_before_set():
+    mapper = Mapper().direct("l.[1].x", 2).direct("l.+.x", 0).direct("l.+.x", 1)
+    assert mapper.apply({"l": []}) == {"l": [{"x": 0}, {"x": 2}]}
+
+
+@pytest.mark.parametrize("overrides, data", [
+    ([("l.[3]", 1)], {"l": [0]}),
+    ([("a.b", 1)], {"a": [1]}),
+    ([("l.+", 1)], {"l": [{}]}),
+    ([("l.+.x", 1)], {"l": [1]}),
+    ([("a.[0]", 1)], {"a": {}}),
+])
+def test_errors(overrides, data):
+    with pytest.raises(InvalidOverrideSpecificationException):
+        _apply(overrides=overrides, data=data)
+
+
+def _random_data(rng):
+    # top-level keys hold objects, lists of objects, or lists of scalars
+    data = {}
+    for key in rng.sample(["a", "b", "c"], rng.randint(0, 3)):
+        kind = rng.randint(0, 2)
+        if kind == 0:
+            data[key] = {"x": rng.randint(0, 3)}
+        elif kind == 1:
+            data[key] = [{"x": rng.randint(0, 3)} for _ in range(rng.randint(0, 2))]
+        else:
+            data[key] = [rng.randint(0, 3) for _ in range(rng.randint(0, 2))]
+    return data
+
+
+def _random_key(rng):
+    parts = [rng.choice(["a", "b", "c"])]
+    for _ in range(rng.randint(0, 2)):
+        parts.append(rng.choice(["x", "y", "+", "+", "[0]", "[1]", "[-1]"]))
+    return ".".join(parts)
+
+def test_grouped_application_matches_one_by_one_application():
+    rng = random.Random(0)
+    for _ in range(4000):
+        data = _random_data(rng)
+        overrides = [(_random_key(rng), rng.randint(0, 9)) for _ in range(rng.randint(1, 4))]
+        assert _outcome(_apply, overrides, data) == _outcome(_apply_one_by_one, overrides, data), (overrides, data)
+
+
+def test_copy_on_write_leaves_the_input_unchanged():
+    base = {"a": {"b": 1, "c": {"d": 2}}, "l": [{"x": 1}, {"x": 2}], "untouched": {"e": [1, 2]}}
+    original = copy.deepcopy(base)
+    overrides = [Override(key="a.b", value=5), Override(key="l.[1].x", value=6), Override(key="l.+.x", value=7)]
+    result = Assignment(overrides=overrides, data=base, in_place=False).apply()
+
+    assert base == original
+    assert result == {
+        "a": {"b": 5, "c": {"d": 2}},
+        "l": [{"x": 1}, {"x": 6}, {"x": 7}],
+        "untouched": {"e": [1, 2]},
+    }
+    # containers on overridden paths are copied
+    assert result is not base
+    assert result["a"] is not base["a"]
+    assert result["l"] is not base["l"]
+    assert result["l"][1] is not base["l"][1]
+    # everything else is shared
+    assert result["untouched"] is base["untouched"]
+    assert result["a"]["c"] is base["a"]["c"]
+    assert result["l"][0] is base["l"][0]
+
+
+def test_copy_on_write_matches_in_place_application():
+    rng = random.Random(1)
+    for _ in range(1000):
+        data = _random_data(rng)
+        overrides = [Override(key=_random_key(rng), value=rng.randint(0, 9)) for _ in range(rng.randint(1, 4))]
+        original = copy.deepcopy(data)
+        try:
+            copied = Assignment(overrides=overrides, data=data, in_place=False).apply()
+        except InvalidOverrideSpecificationException:
+            copied = InvalidOverrideSpecificationException
+        assert data == original
+        assert copied == _outcome(_apply, [(override.key, override.value) for override in overrides], data)
@@ -0,0 +1,81 @@
+import pytest
+
+from structured_config import AllOf, AnyOf, CompiledValidator, Not, RangeValidator, ValidatorBase
+from structured_config.validation.compiled_validator import guarded
+from structured_config.validation.validation_exception import ValidationException
+
+
+class Recording(CompiledValidator):
+    def __init__(self, name, result, calls):
+        self.name = name
+        super().__init__(check=lambda data: calls.append(name) or result)
+
+    def reason(self, data):
+        return f"{self.name} failed"
+
+
+class Plain(ValidatorBase):
+    def __init__(self, result, calls):
+        super().__init__(fail_reason="plain failed")
+        self.result = result
+        self.calls = calls
+
+    def validate(self, data):
+        self.calls.append("plain")
+        return self.result
+
+
+def test_all_of_stops_at_the_first_failure():
+    calls = []
+    validator = AllOf(Recording("a", True, calls), Recording("b", False, calls), Recording("c", True, calls))
+    assert not validator.check()(1)
+    assert calls == ["a", "b"]
+
+
+def test_any_of_stops_at_the_first_success():
+    calls = []
+    validator = AnyOf(Recording("a", False, calls), Recording("b", True, calls), Recording("c", True, calls))
+    assert validator(1) == 1
+    assert calls == ["a", "b"]
+
+
+def test_all_of_reports_the_failing_validator():
+    calls = []
+    validator = AllOf(Recording("a", True, calls), Plain(False, calls), Recording("c", False, calls))
+    with pytest.raises(ValidationException) as error:
+        validator(1)
+    assert "plain failed" in str(error.value)
+    assert validator.outcome(1) == (False, "plain failed")
+
+    validator = AllOf(RangeValidator(min=0), RangeValidator(max=5))
+    assert validator.outcome(3) == (True, None)
+    assert validator.outcome(7) == (False, RangeValidator(max=5).reason(data=7))
+
+
+def test_any_of_reports_all_alternatives():
+    validator = AnyOf(Recording("a", False, []), Recording("b", False, []))
+    valid, reason = validator.outcome(1)
+    assert not valid
+    assert "a failed" in reason and "b failed" in reason
+
+
+def test_not_inverts_the_check():
+    validator = Not(RangeValidator(min=0, max=5))
+    assert validator(7) == 7
+    valid, reason = validator.outcome(3)
+    assert not valid
+    assert "RangeValidator" in reason
+
+
+def test_empty_combinators():
+    assert AllOf().validate(1)
+    assert not AnyOf().validate(1)
+
+
+def test_guarded_checks_treat_type_errors_as_invalid():
+    assert not guarded(lambda data: data > 0)("text")
+    assert guarded(lambda data: data > 0)(1)
+    with pytest.raises(ValidationException):
+        RangeValidator(min=0)("text")
+    with pytest.raises(ZeroDivisionError):
+        guarded(lambda data: 1 / data > 0)(0)
@@ -0,0 +1,95 @@
+from structured_config import (
+    CamelCase,
+    Config,
+    ConvertedConfig,
+    ConverterBase,
+    ListEntry,
+    ObjectEntry,
+    Override,
+    ScalarEntry,
+    SnakeCase,
+)
+
+
+class CountingConverter(ConverterBase):
+    def __init__(self):
+        self.calls = 0
+
+    def convert(self, other):
+        self.calls += 1
+        return dict(other)
+
+
+def _spec(root: CountingConverter, server: CountingConverter):
+    return Config.object(converter=root, entries=[
+        ObjectEntry.make(name="server", converter=server, entries=[
+            ScalarEntry.make(name="host"),
+            ScalarEntry.typed(name="port", cast_to=int),
+        ]),
+        ObjectEntry.make(name="client", entries=[
+            ScalarEntry.make(name="name"),
+            ObjectEntry.make(name="retry", entries=[ScalarEntry.make(name="count")]),
+        ]),
+        ListEntry.make(name="users", elements=Config.object(entries=[ScalarEntry.make(name="name")])),
+        ScalarEntry.typed(name="label", cast_to=str),
+    ])
+
+
+def _data():
+    return {
+        "server": {"host": "localhost", "port": 80},
+        "client": {"name": "c", "retry": {"count": 3}},
+        "users": [{"name": "a"}, {"name": "b"}],
+        "label": 1,
+    }
+
+
+def test_unchanged_subtrees_are_reused():
+    root, server = CountingConverter(), CountingConverter()
+    base = ConvertedConfig(specification=_spec(root=root, server=server), data=_data())
+    changed = base.with_overrides([Override(key="client.retry.count", value=5), Override(key="users.[1].name", value="x")])
+
+    assert changed.get()["client"]["retry"] == {"count": 5}
+    assert changed.get()["users"] == [{"name": "a"}, {"name": "x"}]
+    # changed paths are reconverted
+    assert changed.get()["client"] is not base.get()["client"]
+    assert changed.get()["users"] is not base.get()["users"]
+    # everything else keeps its converted object
+    assert changed.get()["server"] is base.get()["server"]
+    assert changed.get()["users"][0] is base.get()["users"][0]
+    assert server.calls == 1
+    # the base config is not changed
+    assert base.get()["client"]["retry"] == {"count": 3}
+    assert base.data() == _data()
+
+
+def test_ancestor_converters_run_again():
+    root, server = CountingConverter(), CountingConverter()
+    base = ConvertedConfig(specification=_spec(root=root, server=server), data=_data())
+    changed = base.with_overrides([Override(key="server.port", value="8080")])
+    assert changed.get()["server"] == {"host": "localhost", "port": 8080}
+    assert root.calls == 2
+    assert server.calls == 2
+
+    unchanged = base.with_data(data=base.data())
+    assert unchanged.get() is base.get()
+    assert root.calls == 2
+
+
+def test_equal_scalars_of_different_types_are_reconverted():
+    base = ConvertedConfig(specification=_spec(root=CountingConverter(), server=CountingConverter()), data=_data())
+    assert base.get()["label"] == "1"
+    changed = base.with_overrides([Override(key="label", value=True)])
+    assert changed.get()["label"] == "True"
+    same = changed.with_overrides([Override(key="label", value=True)])
+    assert same.get()["label"] == "True"
+
+
+def test_overrides_are_translated_to_the_source_case():
+    spec = Config.object(entries=[
+        ObjectEntry.make(name="home_address", entries=[ScalarEntry.make(name="street_name")]),
+    ]).translate_case(target=SnakeCase(), source=CamelCase())
+    base = ConvertedConfig(specification=spec, data={"homeAddress": {"streetName": "a"}})
+    changed = base.with_overrides([Override(key="home_address.street_name", value="b")])
+    assert changed.get() == {"home_address": {"street_name": "b"}}
+    assert changed.data() == {"homeAddress": {"streetName": "b"}}
@@ -0,0 +1,99 @@
+from dataclasses import dataclass
+
+import pytest
+
+from structured_config import (
+    Config,
+    ConvertedConfig,
+    CrossValidationContext,
+    CrossValidationException,
+    ListEntry,
+    MakeRequirements,
+    ObjectEntry,
+    ReferenceValidator,
+    ScalarEntry,
+    UniqueKeyValidator,
+)
+
+
+def _spec(cross_validators, key_type=None):
+    return Config.object(
+        entries=[
+            ListEntry.make(name="backends", elements=Config.object(
+                entries=[ScalarEntry.make(name="name", type=key_type)],
+                requirements=MakeRequirements.optional(defaults={"name": "default"}),
+            )),
+            ListEntry.make(name="routes", elements=Config.object(entries=[ScalarEntry.make(name="backend")])),
+        ],
+        cross_validators=cross_validators,
+    )
+
+
+def _violations(spec, data):
+    with pytest.raises(CrossValidationException) as error:
+        spec.convert(data)
+    return [(violation.path, violation.value) for violation in error.value.violations]
+
+
+def test_references_are_checked():
+    spec = _spec(cross_validators=[ReferenceValidator(reference="routes[*].backend", target="backends[*].name")])
+    data = {"backends": [{"name": "a"}], "routes": [{"backend": "a"}, {"backend": "b"}, {"backend": "c"}]}
+    assert _violations(spec, data) == [("routes.[1].backend", "b"), ("routes.[2].backend", "c")]
+
+
+def test_defaults_are_applied_before_cross_validation():
+    spec = _spec(cross_validators=[ReferenceValidator(reference="routes[*].backend", target="backends[*].name")])
+    converted = spec.convert({"backends": [{}], "routes": [{"backend": "default"}]})
+    assert converted["backends"] == [{"name": "default"}]
+
+
+def test_duplicates_are_reported_with_their_first_occurrence():
+    spec = _spec(cross_validators=[UniqueKeyValidator(path="backends[*].name")])
+    data = {"backends": [{"name": "a"}, {}, {"name": "a"}, {"name": "default"}], "routes": []}
+    assert _violations(spec, data) == [("backends.[2].name", "a"), ("backends.[3].name", "default")]
+
+
+def test_equal_values_of_different_types_do_not_match():
+    unique = _spec(cross_validators=[UniqueKeyValidator(path="backends[*].name")])
+    unique.convert({"backends": [{"name": 1}, {"name": True}, {"name": 1.5}], "routes": []})
+
+    reference = _spec(cross_validators=[ReferenceValidator(reference="routes[*].backend", target="backends[*].name")])
+    assert _violations(reference, {"backends": [{"name": 1}], "routes": [{"backend": True}]}) == [("routes.[0].backend", True)]
+
+
+def test_unhashable_values():
+    context = CrossValidationContext(data={"backends": [{"name": "a"}, {"name": ["b"]}], "routes": [{"backend": ["b"]}]})
+    unique = UniqueKeyValidator(path="backends[*].name").validate(context=context)
+    assert [(violation.path, violation.reason) for violation in unique] == [("backends.[1].name", "value is not hashable")]
+    references = ReferenceValidator(reference="routes[*].backend", target="backends[*].name").validate(context=context)
+    assert [violation.path for violation in references] == ["routes.[0].backend"]
+
+
+def test_converted_objects_are_accessed_by_attribute():
+    @dataclass
+    class Backend:
+        name: str
+
+    spec = Config.object(
+        entries=[
+            ListEntry.make(name="backends", elements=Config.from_dataclass(Backend, cached=False)),
+            ListEntry.make(name="routes", elements=Config.object(entries=[ScalarEntry.make(name="backend")])),
+        ],
+        cross_validators=[ReferenceValidator(reference="routes[*].backend", target="backends[*].name")],
+    )
+    assert spec.convert({"backends": [{"name": "a"}], "routes": [{"backend": "a"}]})["backends"] == [Backend(name="a")]
+    assert _violations(spec, {"backends": [{"name": "a"}], "routes": [{"backend": "b"}]}) == [("routes.[0].backend", "b")]
+
+
+def test_incremental_conversion_is_cross_validated():
+    spec = _spec(cross_validators=[ReferenceValidator(reference="routes[*].backend", target="backends[*].name")])
+    base = ConvertedConfig(specification=spec, data={"backends": [{"name": "a"}], "routes": [{"backend": "a"}]})
+    with pytest.raises(CrossValidationException):
+        base.with_data(data={"backends": [{"name": "b"}], "routes": [{"backend": "a"}]})
+
+
+def test_context_shares_resolved_paths_and_indexes():
+    context = CrossValidationContext(data={"items": [{"id": 1}, {"id": True}, {"id": 1}]}, path="root")
+    assert context.values(path="items[*].id") is context.values(path="items[*].id")
+    assert context.paths(path="items.[*].id") == ["root.items.[0].id", "root.items.[1].id", "root.items.[2].id"]
+    assert context.index(path="items[*].id") == {(int, 1): 0, (bool, True): 1}
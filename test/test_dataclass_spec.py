@@ -0,0 +1,64 @@
+from dataclasses import dataclass, field
+from typing import List, NotRequired, Optional, TypedDict
+
+import pytest
+
+from structured_config import Config
+from structured_config.spec.required_value_not_found_exception import RequiredValueNotFoundException
+
+
+@dataclass
+class Inner:
+    a: int
+
+
+@dataclass
+class Outer:
+    name: str
+    inner: Optional[Inner] = None
+    fallback: Inner = field(default_factory=lambda: Inner(a=1))
+    tags: List[str] = field(default_factory=list)
+
+
+class Options(TypedDict):
+    name: str
+    level: NotRequired[int]
+    inner: NotRequired[Inner]
+
+
+def test_missing_nested_object_is_the_field_default():
+    outer = Config.from_dataclass(Outer).convert({"name": "n"})
+    assert outer.inner == None
+    assert outer.fallback == Inner(a=1)
+
+
+def test_present_nested_object_is_converted():
+    outer = Config.from_dataclass(Outer).convert({"name": "n", "inner": {"a": 2}})
+    assert outer.inner == Inner(a=2)
+
+
+def test_nested_object_without_default_is_required():
+    @dataclass
+    class Holder:
+        inner: Inner
+
+    with pytest.raises(RequiredValueNotFoundException):
+        Config.from_dataclass(Holder).convert({})
+
+
+def test_default_factories_are_called_per_conversion():
+    spec = Config.from_dataclass(Outer)
+    first = spec.convert({"name": "first"})
+    first.tags.append("changed")
+    first.fallback.a = 5
+    second = spec.convert({"name": "second"})
+    assert second.tags == []
+    assert second.fallback == Inner(a=1)
+    assert first.tags is not second.tags
+
+
+def test_missing_optional_typed_dict_keys_are_omitted():
+    options = Config.from_dataclass(Options).convert({"name": "n"})
+    assert options == {"name": "n"}
+    options = Config.from_dataclass(Options).convert({"name": "n", "level": 2, "inner": {"a": 3}})
+    assert options == {"name": "n", "level": 2, "inner": Inner(a=3)}
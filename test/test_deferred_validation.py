@@ -0,0 +1,124 @@
+import asyncio
+import json
+import threading
+
+import pytest
+
+from structured_config import (
+    AllOf,
+    AnyOf,
+    Config,
+    ConfigSpecification,
+    DeferredValidation,
+    DeferredValidationException,
+    FileConfig,
+    Not,
+    PathExistsValidator,
+    RangeValidator,
+    ScalarEntry,
+    ValidatorBase,
+)
+from structured_config.validation.validation_exception import ValidationException
+
+
+class SlowCheck(ValidatorBase):
+    """Non-compiled I/O-bound validator, which records the values it validated"""
+
+    io_bound = True
+
+    def __init__(self):
+        super().__init__(fail_reason="slow check failed")
+        self.validated = []
+
+    def validate(self, data):
+        if data == "raise":
+            raise TypeError("cannot check")
+        self.validated.append((data, threading.current_thread().name))
+        return data != "bad"
+
+
+def _spec(validator):
+    return Config.object(entries=[
+        ScalarEntry.make(name="first", validator=validator),
+        ScalarEntry.make(name="second", validator=validator),
+        ScalarEntry.make(name="count", validator=RangeValidator(min=0)),
+    ])
+
+
+def _paths(error):
+    return sorted(failure.path for failure in error.value.failures)
+
+
+def test_combinators_are_io_bound_if_any_validator_is():
+    assert AllOf(RangeValidator(min=0), PathExistsValidator()).io_bound
+    assert AnyOf(PathExistsValidator()).io_bound
+    assert Not(PathExistsValidator()).io_bound
+    assert AllOf(Not(AnyOf(PathExistsValidator()))).io_bound
+    assert not AllOf(RangeValidator(min=0), Not(RangeValidator(max=5))).io_bound
+
+
+def test_combined_io_bound_validators_are_deferred(tmp_path):
+    spec = _spec(validator=AllOf(PathExistsValidator()))
+    with DeferredValidation() as deferred:
+        spec.convert({"first": str(tmp_path / "missing"), "second": str(tmp_path), "count": 1})
+    assert deferred.pending() == 2
+    with pytest.raises(DeferredValidationException) as error:
+        deferred.run()
+    assert _paths(error) == ["first"]
+    assert deferred.pending() == 0
+
+
+def test_other_validators_are_not_deferred(tmp_path):
+    spec = _spec(validator=PathExistsValidator())
+    with DeferredValidation() as deferred:
+        with pytest.raises(ValidationException) as error:
+            spec.convert({"first": str(tmp_path), "second": str(tmp_path), "count": -1})
+    assert not isinstance(error.value, DeferredValidationException)
+
+
+def test_convert_deferred_collects_all_failures(tmp_path):
+    spec = _spec(validator=PathExistsValidator())
+    data = {"first": str(tmp_path / "a"), "second": str(tmp_path / "b"), "count": 1}
+    with pytest.raises(DeferredValidationException) as error:
+        spec.convert_deferred(data, max_workers=2)
+    assert _paths(error) == ["first", "second"]
+    assert str(tmp_path / "a") in str(error.value)
+
+
+def test_convert_deferred_returns_the_output(tmp_path):
+    spec = _spec(validator=PathExistsValidator())
+    data = {"first": str(tmp_path), "second": str(tmp_path), "count": 1}
+    assert spec.convert_deferred(data) == data
+
+
+def test_non_compiled_validators_and_exceptions():
+    validator = SlowCheck()
+    spec = _spec(validator=validator)
+    with pytest.raises(DeferredValidationException) as error:
+        spec.convert_deferred({"first": "bad", "second": "raise", "count": 1})
+    reasons = {failure.path: failure.reason for failure in error.value.failures}
+    assert reasons == {"first": "slow check failed", "second": "TypeError: cannot check"}
+    # deferred validators don't run in the converting thread
+    assert all(thread != threading.current_thread().name for _, thread in validator.validated)
+
+
+def test_convert_async(tmp_path):
+    spec = _spec(validator=PathExistsValidator())
+    data = {"first": str(tmp_path), "second": str(tmp_path), "count": 1}
+    assert asyncio.run(spec.convert_async(data)) == data
+    with pytest.raises(DeferredValidationException) as error:
+        asyncio.run(spec.convert_async({**data, "second": str(tmp_path / "missing")}))
+    assert _paths(error) == ["second"]
+
+
+def test_run_async_without_checks():
+    asyncio.run(DeferredValidation().run_async())
+
+
+def test_get_config_defers_io_bound_validation(tmp_path):
+    file = tmp_path / "config.json"
+    file.write_text(json.dumps({"first": str(tmp_path / "a"), "second": str(tmp_path / "b"), "count": 1}))
+    config = ConfigSpecification(specification=_spec(validator=PathExistsValidator())).with_file_config(FileConfig(file=str(file)))
+    with pytest.raises(DeferredValidationException) as error:
+        config.get_config()
+    assert _paths(error) == ["first", "second"]
@@ -0,0 +1,55 @@
+from typing import Any, Dict, List
+
+from structured_config import DictionarySourceExtractor
+
+
+class NonMaterializingExtractor(DictionarySourceExtractor):
+    """Dictionary extractor that fails if any source is flattened into a dictionary"""
+
+    def _flatten(self, source: Any) -> Any:
+        raise AssertionError("source was materialized")
+
+
+def _data(count: int) -> Dict[str, Any]:
+    return {"values": {f"key_{i}": i for i in range(count)}, "list": [{"a": 1}, {"a": 2}]}
+
+
+def test_default_source_is_streamed():
+    extractor = NonMaterializingExtractor(mapping=lambda k, s: [s[k]], data=_data(count=10000))
+    overrides: List[Any] = list(extractor.all_available())
+    assert len(overrides) == 10002
+    assert overrides[0] == 0
+
+
+def test_default_source_is_streamed_with_key_filter():
+    extractor = NonMaterializingExtractor(mapping=lambda k, s: [s[k]], data=_data(count=100))
+    overrides: List[Any] = list(extractor.all_available(key_filter=lambda key: key.startswith("list.")))
+    assert overrides == [1, 2]
+
+
+def test_default_source_is_flattened_for_single_keys():
+    extractor = DictionarySourceExtractor.direct(data=_data(count=3))
+    assert list(extractor.get(key="values.key_2")) == [2]
+    assert sorted(extractor.available_keys()) == sorted(
+        ["values.key_0", "values.key_1", "values.key_2", "list.[0].a", "list.[1].a"]
+    )
+
+
+def test_alternate_source_is_streamed():
+    extractor = NonMaterializingExtractor(mapping=lambda k, s: [s[k]], data={})
+    assert list(extractor.all_available_from_source(source={"x": {"y": 5}})) == [5]
+
+
+def _with_neighbour(key, source):
+    # mapping that reads another key of the flattened source
+    return [(source[key], source["list.[0].a"], len(source))]
+
+
+def test_mapping_sees_the_same_source_on_every_path():
+    data = _data(count=2)
+    extractor = DictionarySourceExtractor(mapping=_with_neighbour, data=data)
+    streamed = list(extractor.all_available_from_source(source=data))
+    assert streamed == [(0, 1, 4), (1, 1, 4), (1, 1, 4), (2, 1, 4)]
+    assert list(extractor.all_available()) == streamed
+    assert [extractor.get_from_source(key=key, source=data)[0] for key in extractor.available_keys()] == streamed
+    assert [extractor.get(key=key)[0] for key in extractor.available_keys()] == streamed
@@ -0,0 +1,84 @@
+import ast
+import importlib
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import structured_config
+
+INIT: Path = Path(structured_config.__file__)
+
+# modules that only the features using them should load
+DEFERRED_MODULES = [
+    "yaml",
+    "argparse",
+    "asyncio",
+    "concurrent.futures",
+    "structured_config.base.structured_config",
+    "structured_config.io.schema.json_schema_writer",
+    "structured_config.io.schema.yaml_like_writer",
+    "structured_config.io.reader.yaml_reader",
+    "structured_config.cli_args.argparse_argument",
+]
+
+
+def _run(code: str, *options: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *options, "-c", code],
+        cwd=INIT.parent.parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _import_times(code: str) -> dict:
+    # cumulative import time in microseconds of each module imported by the code, from "-X importtime"
+    times = {}
+    for line in _run(code, "-X", "importtime").stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line[len("import time:"):].split("|")
+        times[module.strip()] = int(cumulative)
+    return times
+
+
+def _type_checking_imports() -> dict:
+    # names imported by the "if TYPE_CHECKING:" block, by module
+    tree: ast.Module = ast.parse(INIT.read_text())
+    block = next(
+        node for node in tree.body
+        if isinstance(node, ast.If) and isinstance(node.test, ast.Name) and node.test.id == "TYPE_CHECKING"
+    )
+    return {
+        alias.name: "." * node.level + node.module
+        for node in block.body if isinstance(node, ast.ImportFrom)
+        for alias in node.names
+    }
+
+
+def test_import_does_not_load_optional_features():
+    loaded = json.loads(_run(
+        "import json, sys; import structured_config; "
+        f"print(json.dumps([module for module in {DEFERRED_MODULES!r} if module in sys.modules]))"
+    ).stdout)
+    assert loaded == []
+
+
+def test_import_time():
+    # the package import only sets up the lazy names, no submodules or optional dependencies are imported
+    times = _import_times(code="import structured_config")
+    assert "structured_config" in times
+    assert [module for module in times if module.startswith("structured_config.")] == []
+    assert [module for module in DEFERRED_MODULES if module in times] == []
+
+
+def test_lazy_imports_match_type_checking_imports():
+    assert _type_checking_imports() == structured_config._lazy_imports
+
+
+def test_all_public_names_resolve():
+    for name in structured_config.__all__:
+        module = importlib.import_module(structured_config._lazy_imports[name], "structured_config")
+        assert getattr(structured_config, name) is getattr(module, name)
@@ -0,0 +1,59 @@
+import json
+import math
+from dataclasses import dataclass
+from typing import Optional
+
+from structured_config import Config, JsonSchemaWriter, MakeRequirements, ObjectEntry, ScalarEntry
+
+
+def _schema(config):
+    return JsonSchemaWriter(deduplicate=False).schema(definition=config.specify())
+
+
+def test_objects_with_required_descendants_are_required():
+    config = Config.object(entries=[
+        ObjectEntry.make(name="outer", entries=[
+            ObjectEntry.make(name="inner", entries=[ScalarEntry.make(name="value")]),
+        ]),
+        ObjectEntry.make(
+            name="optional",
+            entries=[ScalarEntry.make(name="value")],
+            requirements=MakeRequirements.optional(defaults={"value": 1}),
+        ),
+    ])
+    schema = _schema(config=config)
+    assert schema["required"] == ["outer"]
+    assert schema["properties"]["outer"]["required"] == ["inner"]
+    assert schema["properties"]["outer"]["properties"]["inner"]["required"] == ["value"]
+    assert "required" not in schema["properties"]["optional"]
+
+
+def test_objects_with_a_default_are_not_required():
+    @dataclass
+    class Inner:
+        a: int
+
+    @dataclass
+    class Outer:
+        name: str
+        inner: Optional[Inner] = None
+
+    schema = _schema(config=Config.from_dataclass(Outer, cached=False))
+    assert schema["required"] == ["name"]
+    assert schema["properties"]["inner"]["required"] == ["a"]
+
+
+def test_non_finite_defaults_are_skipped():
+    config = Config.object(
+        entries=[ScalarEntry.make(name="low"), ScalarEntry.make(name="high"), ScalarEntry.make(name="ratio")],
+        requirements=MakeRequirements.optional(defaults={"low": -math.inf, "high": math.nan, "ratio": 0.5}),
+    )
+    schema = _schema(config=config)
+    assert "default" not in schema["properties"]["low"]
+    assert "default" not in schema["properties"]["high"]
+    assert schema["properties"]["ratio"]["default"] == 0.5
+    json.loads(JsonSchemaWriter().define(config), parse_constant=_reject_constant)
+
+
+def _reject_constant(constant):
+    raise AssertionError(f"schema contains '{constant}'")
@@ -0,0 +1,100 @@
+import argparse
+
+import pytest
+
+from structured_config import ArgparseConfig, Mapper, OverrideConfig, OverrideFileArgument, OverrideFileReader
+from structured_config.io.overrides.invalid_override_source_exception import InvalidOverrideSourceException
+from structured_config.io.overrides.invalid_override_type_exception import InvalidOverrideTypeException
+from structured_config.io.reader.config_file_not_found_exception import ConfigFileNotFoundException
+
+
+def _file(tmp_path, content):
+    path = tmp_path / "overrides.txt"
+    path.write_text(content)
+    return str(path)
+
+
+def _failing_stream(overrides):
+    yield from overrides
+    raise InvalidOverrideSourceException(reason="broken stream")
+
+
+def test_direct_many_adds_all_overrides():
+    mapper = Mapper().direct_many(overrides=iter([("a.b", 1), ("l.+", 2), ("l.+", 3)]))
+    assert mapper.apply({}) == {"a": {"b": 1}, "l": [2, 3]}
+
+
+def test_direct_many_resorts_after_a_failing_stream():
+    mapper = Mapper().direct("l.[0]", 1)
+    mapper.overrides()
+    with pytest.raises(InvalidOverrideSourceException):
+        mapper.direct_many(overrides=_failing_stream([("l.+", 5)]))
+    # the ADD consumed before the error is applied before the SET
+    assert [override.key for override in mapper.overrides()] == ["l.+", "l.[0]"]
+    assert mapper.apply({"l": []}) == {"l": [1]}
+
+
+def test_reads_key_value_lines(tmp_path):
+    file = _file(tmp_path, "# comment\n\na.b = some value\nl.[0]=x=y\n")
+    assert list(OverrideFileReader(file=file).read()) == [("a.b", "some value"), ("l.[0]", "x=y")]
+
+
+def test_reads_json_lines(tmp_path):
+    file = _file(tmp_path, '{"a.b": 1, "l.+": true}\n  {"c": "d"}\n')
+    assert list(OverrideFileReader(file=file).read()) == [("a.b", 1), ("l.+", True), ("c", "d")]
+
+
+def test_reads_mixed_lines(tmp_path):
+    file = _file(tmp_path, 'a=1\n{"b": 2}\n')
+    assert Mapper().direct_many(overrides=OverrideFileReader(file=file).read()).apply({}) == {"a": "1", "b": 2}
+
+
+@pytest.mark.parametrize("content", [
+    "a.b\n",
+    "=value\n",
+    "{\"a\": 1\n",
+    "{\"a\": 1}\n{1}\n",
+])
+def test_invalid_lines(tmp_path, content):
+    with pytest.raises(InvalidOverrideSourceException):
+        list(OverrideFileReader(file=_file(tmp_path, content)).read())
+
+
+def test_invalid_line_keeps_the_overrides_before_it(tmp_path):
+    mapper = Mapper()
+    with pytest.raises(InvalidOverrideSourceException) as error:
+        mapper.direct_many(overrides=OverrideFileReader(file=_file(tmp_path, "a=1\nbroken\n")).read())
+    assert "Line 2" in str(error.value)
+    assert [override.key for override in mapper.overrides()] == ["a"]
+
+
+def test_non_scalar_json_values_are_rejected(tmp_path):
+    with pytest.raises(InvalidOverrideTypeException):
+        Mapper().direct_many(overrides=OverrideFileReader(file=_file(tmp_path, '{"a": [1]}\n')).read())
+
+
+def test_missing_file(tmp_path):
+    with pytest.raises(ConfigFileNotFoundException):
+        OverrideFileReader(file=str(tmp_path / "missing.txt"))
+
+
+def test_argparse_override_file(tmp_path):
+    first = _file(tmp_path, "a=file\nb=file\n")
+    second = tmp_path / "second.jsonl"
+    second.write_text('{"c": 3}\n')
+
+    parser = argparse.ArgumentParser()
+    config = ArgparseConfig(
+        parser=parser,
+        use_for_overrides=True,
+        config_file=None,
+        overrides_file=OverrideFileArgument(name="override-file", help="Override file"),
+    )
+    config.overrides_list.apply(parser)
+    config.overrides_file.apply(parser)
+    arguments = parser.parse_args(["--override-file", first, "--override-file", str(second), "--override", "a", "list"])
+
+    override_config = OverrideConfig()
+    config.override(override_config=override_config, arguments=arguments)
+    # the override list takes precedence over override files
+    assert override_config.mapper.apply({}) == {"a": "list", "b": "file", "c": 3}
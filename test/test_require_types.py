@@ -0,0 +1,30 @@
+from structured_config.type_checking.require_types import RequireConfigType, RequireConvertedType
+
+
+class Checks:
+    def check(self, key, parent_key, obj):
+        pass
+
+    def not_a_check(self, value):
+        pass
+
+
+def test_config_type_checkers_are_shared_per_type_list():
+    assert RequireConfigType.from_type_list(types=[int, str]) is RequireConfigType.from_type_list(types=[int, str])
+    assert RequireConfigType.from_type_list(types=[int]) is not RequireConfigType.from_type_list(types=[int], allow_instance_of=True)
+
+
+def test_config_type_checkers_of_unhashable_types_are_not_shared():
+    unhashable = [[int]]
+    assert RequireConfigType.from_type_list(types=unhashable) is not RequireConfigType.from_type_list(types=unhashable)
+
+
+def test_bound_methods_are_classified_by_their_function():
+    checks = Checks()
+    assert RequireConvertedType._is_type_checking_function(checks.check)
+    assert not RequireConvertedType._is_type_checking_function(checks.not_a_check)
+    assert RequireConvertedType._type_checking_methods.get(Checks.check, None) == True
+    assert RequireConvertedType._type_checking_methods.get(Checks.not_a_check, None) == False
+    # unbound functions have the extra "self" parameter
+    assert not RequireConvertedType._is_type_checking_function(Checks.check)
+    assert RequireConvertedType._is_type_checking_function(Checks().check)
@@ -0,0 +1,39 @@
+import threading
+
+from structured_config.base.result_cache import ResultCache
+from structured_config.validation.validation_exception import ValidationException
+
+
+def _fail():
+    raise ValidationException(value=3, reason="too small")
+
+
+def test_cached_failures_raise_a_new_exception_per_hit():
+    cache = ResultCache()
+    errors = []
+    for _ in range(3):
+        try:
+            cache.call(owner=cache, value=3, compute=_fail)
+        except ValidationException as error:
+            errors.append(error)
+    assert len(errors) == 3
+    assert len({id(error) for error in errors}) == 3
+    assert all(str(error) == "Validation failed for object '3': too small" for error in errors)
+    assert cache.statistics().hits == 2
+
+
+def test_shared_cache_is_created_once():
+    ResultCache._shared = None
+    barrier = threading.Barrier(8)
+    caches = []
+
+    def get():
+        barrier.wait()
+        caches.append(ResultCache.shared())
+
+    threads = [threading.Thread(target=get) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len({id(cache) for cache in caches}) == 1
@@ -0,0 +1,42 @@
+from structured_config import (
+    CamelCase,
+    Config,
+    DictionarySourceExtractor,
+    ListEntry,
+    ObjectEntry,
+    ScalarEntry,
+)
+
+
+def _spec():
+    return Config.object(entries=[
+        ObjectEntry.make(name="person", entries=[
+            ScalarEntry.make(name="first_name"),
+        ]),
+        ListEntry.make(name="home_addresses", elements=Config.object(entries=[
+            ScalarEntry.make(name="street_name"),
+        ])),
+    ])
+
+
+def test_knows_source_case_keys():
+    spec = _spec()
+    assert spec.index().knows(key="person.first_name")
+    assert spec.index().knows(key="home_addresses.[0].street_name")
+    assert spec.index().knows(key="home_addresses.+.street_name")
+    assert not spec.index().knows(key="person.last_name")
+
+
+def test_knows_translates_keys_to_the_source_case():
+    spec = _spec().expect_source_case(source=CamelCase())
+    assert spec.index().knows(key="person.firstName")
+    assert spec.index().knows(key="person.first_name")
+    assert spec.index().knows(key="homeAddresses.[1].streetName")
+    assert not spec.index().knows(key="person.lastName")
+
+
+def test_knows_as_extractor_key_filter():
+    spec = _spec().expect_source_case(source=CamelCase())
+    extractor = DictionarySourceExtractor.direct(data={"person": {"first_name": "A", "unknown": 1}})
+    overrides = list(extractor.all_available(key_filter=spec.index().knows))
+    assert overrides == ["A"]
@@ -0,0 +1,72 @@
+from structured_config import (
+    CamelCase,
+    Config,
+    JsonLikeWriter,
+    ListEntry,
+    NoTranslation,
+    ObjectEntry,
+    PascalCase,
+    ScalarEntry,
+    SnakeCase,
+    TypeRegistry,
+    YamlLikeWriter,
+)
+
+
+def _spec():
+    return Config.object(entries=[
+        ObjectEntry.make(name="home_address", entries=[ScalarEntry.make(name="street_name", type=str)]),
+        ListEntry.make(name="user_names", elements=Config.scalar(type=str)),
+    ])
+
+
+def test_definitions_are_cached():
+    spec = _spec()
+    assert spec.specify() is spec.specify()
+
+
+def test_translate_case_rebuilds_the_definition():
+    spec = _spec()
+    before = spec.specify()
+    spec.translate_case(target=SnakeCase(), source=CamelCase())
+    after = spec.specify()
+    assert after is not before
+    assert isinstance(after.key_case, CamelCase)
+    assert isinstance(before.key_case, NoTranslation)
+    assert isinstance(after.children["home_address"].key_case, CamelCase)
+
+
+def test_changed_children_rebuild_their_parents():
+    spec = _spec()
+    before = spec.specify()
+    child = dict(spec.child_values())["home_address"]
+    child.use_type_registry(registry=TypeRegistry(scalar_types=[str, int]))
+    assert spec.specify() is not before
+    assert spec.specify().children["home_address"] is child.specify()
+
+
+def test_shared_children_rebuild_all_parents():
+    shared = Config.object(entries=[ScalarEntry.make(name="value")])
+    first = Config.list(elements=shared)
+    second = Config.list(elements=shared)
+    first.specify(), second.specify()
+    shared.translate_case(target=NoTranslation(), source=SnakeCase())
+    assert first.specify().children is shared.specify()
+    assert second.specify().children is shared.specify()
+
+
+def test_schema_case_writers_leave_the_spec_case_unchanged():
+    spec = _spec()
+    definition = spec.specify()
+    for writer in [
+        JsonLikeWriter(with_schema_case=True, schema_case=PascalCase()),
+        YamlLikeWriter(with_schema_case=True, schema_case=PascalCase()),
+    ]:
+        schema = writer.define(spec)
+        assert "HomeAddress" in schema and "StreetName" in schema
+        assert "home_address" not in schema
+    assert spec.specify() is definition
+    assert isinstance(definition.key_case, NoTranslation)
+    assert isinstance(definition.children["home_address"].key_case, NoTranslation)
+    assert isinstance(spec.get_source_case(), NoTranslation)
+    assert "home_address" in JsonLikeWriter().define(spec)
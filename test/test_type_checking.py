@@ -0,0 +1,64 @@
+from typing import Protocol, runtime_checkable
+
+import pytest
+
+from structured_config import ConfigTypeChecker, ConvertedTypeChecker, TypeRegistry
+
+
+@runtime_checkable
+class Named(Protocol):
+    name: str
+
+
+class HasName:
+    def __init__(self, named: bool):
+        if named:
+            self.name = "name"
+
+
+class PositiveMeta(type):
+    def __instancecheck__(cls, instance) -> bool:
+        return type(instance) is int and instance > 0
+
+
+class Positive(metaclass=PositiveMeta):
+    pass
+
+
+class Base:
+    pass
+
+
+class Derived(Base):
+    pass
+
+
+def test_converted_protocol_check_depends_on_the_instance():
+    checker = ConvertedTypeChecker(any_of=[Named], allow_instance_of=True)
+    checker(key="a", parent_key="", obj=HasName(named=True))
+    with pytest.raises(TypeError):
+        checker(key="a", parent_key="", obj=HasName(named=False))
+    checker(key="a", parent_key="", obj=HasName(named=True))
+
+
+def test_converted_custom_instance_check_depends_on_the_instance():
+    checker = ConvertedTypeChecker(any_of=[Positive], allow_instance_of=True)
+    checker(key="a", parent_key="", obj=1)
+    with pytest.raises(TypeError):
+        checker(key="a", parent_key="", obj=-1)
+
+
+def test_converted_plain_classes():
+    checker = ConvertedTypeChecker(any_of=[Base], allow_instance_of=True)
+    checker(key="a", parent_key="", obj=Derived())
+    with pytest.raises(TypeError):
+        ConvertedTypeChecker(any_of=[Base], allow_instance_of=False)(key="a", parent_key="", obj=Derived())
+
+
+def test_config_custom_instance_check_depends_on_the_instance():
+    checker = ConfigTypeChecker(allow_instance_of=True, specific_types=[Positive],
+                                registry=TypeRegistry(scalar_types=[Positive]))
+    checker(key="a", parent_key="", obj=1, scalar=True)
+    with pytest.raises(TypeError):
+        checker(key="a", parent_key="", obj=-1, scalar=True)
+    checker(key="a", parent_key="", obj=2, scalar=True)